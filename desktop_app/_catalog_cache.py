@@ -0,0 +1,37 @@
+"""
+PharmaPOS NG - Catalog Cache
+
+Process-wide memo of the product and store catalogs the UI dialogs list.
+Entries are keyed by engine and live until clear() is called from a
+mutation path; callers must treat the returned dicts as read-only.
+
+Each miss queries through its own short-lived session, so the loaders are
+safe to call from worker threads.
+"""
+
+import functools
+from typing import Tuple
+
+from sqlalchemy.orm import Session
+
+from desktop_app.models import ProductService, StoreService
+
+
+@functools.lru_cache(maxsize=8)
+def cached_products(bind) -> Tuple[dict, ...]:
+    """Active products, fetched once per engine."""
+    with Session(bind=bind) as session:
+        return tuple(ProductService(session).get_all_products())
+
+
+@functools.lru_cache(maxsize=8)
+def cached_stores(bind) -> Tuple[dict, ...]:
+    """All stores ordered by name, fetched once per engine."""
+    with Session(bind=bind) as session:
+        return tuple(StoreService(session).get_all_stores())
+
+
+def clear() -> None:
+    """Drop both catalogs so the next lookup hits the database."""
+    cached_products.cache_clear()
+    cached_stores.cache_clear()
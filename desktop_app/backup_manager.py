@@ -5,11 +5,10 @@ Handles automated backups, manual backups, and database restoration.
 """
 
 import os
-import shutil
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Callable
 import json
 
 from desktop_app.config import PROJECT_ROOT, DB_PATH
@@ -17,6 +16,38 @@ from desktop_app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pages copied per step of the SQLite backup API; other connections can use
+# the database between steps
+BACKUP_PAGES = 1000
+
+
+class _CopyAborted(Exception):
+    """Raised from the backup progress hook to stop a copy part-way."""
+
+
+def _copy_database(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    progress: Optional[Callable[[int, int], None]] = None,
+    should_abort: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """Copy `source` into `target` BACKUP_PAGES pages at a time.
+
+    Returns False if `should_abort` stopped the copy; SQLite then rolls back
+    whatever had been written to the target.
+    """
+    def on_step(status: int, remaining: int, total: int) -> None:
+        if progress:
+            progress(total - remaining, total)
+        if remaining and should_abort and should_abort():
+            raise _CopyAborted()
+
+    try:
+        source.backup(target, pages=BACKUP_PAGES, progress=on_step)
+    except _CopyAborted:
+        return False
+    return True
+
 
 class BackupManager:
     """Manages database backups and restoration."""
@@ -36,11 +67,19 @@ class BackupManager:
         
         logger.info(f"BackupManager initialized: DB={self.db_path}, Backups={self.backup_dir}")
     
-    def create_backup(self, backup_name: Optional[str] = None) -> Tuple[bool, str, Optional[Path]]:
+    def create_backup(
+        self,
+        backup_name: Optional[str] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_abort: Optional[Callable[[], bool]] = None,
+    ) -> Tuple[bool, str, Optional[Path]]:
         """Create a database backup.
         
         Args:
             backup_name: Optional custom backup name
+            progress: Optional callback receiving (pages copied, total pages)
+            should_abort: Optional callback; when it returns True the backup
+                stops and the partial file is removed
             
         Returns:
             Tuple of (success, message, backup_path)
@@ -65,12 +104,16 @@ class BackupManager:
             
             source_conn = sqlite3.connect(str(self.db_path))
             backup_conn = sqlite3.connect(str(backup_path))
+            try:
+                completed = _copy_database(source_conn, backup_conn, progress, should_abort)
+            finally:
+                source_conn.close()
+                backup_conn.close()
             
-            with backup_conn:
-                source_conn.backup(backup_conn)
-            
-            source_conn.close()
-            backup_conn.close()
+            if not completed:
+                backup_path.unlink()
+                logger.info(f"Backup cancelled: {backup_path}")
+                return False, "Backup cancelled", None
             
             # Create metadata file
             metadata = {
@@ -91,11 +134,22 @@ class BackupManager:
             logger.error(f"Backup failed: {e}", exc_info=True)
             return False, f"Backup failed: {str(e)}", None
     
-    def restore_backup(self, backup_path: Path) -> Tuple[bool, str]:
+    def restore_backup(
+        self,
+        backup_path: Path,
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_abort: Optional[Callable[[], bool]] = None,
+    ) -> Tuple[bool, str]:
         """Restore database from backup.
         
+        The backup is copied into the live database with the SQLite backup
+        API, so connections the application already holds stay valid.
+        
         Args:
             backup_path: Path to backup file
+            progress: Optional callback receiving (pages copied, total pages)
+            should_abort: Optional callback; when it returns True the restore
+                stops and the database is left unchanged
             
         Returns:
             Tuple of (success, message)
@@ -114,11 +168,19 @@ class BackupManager:
             if not self._verify_backup(backup_path):
                 return False, "Backup file is corrupted or invalid"
             
-            # Close all connections (important!)
             logger.info(f"Restoring from backup: {backup_path}")
             
-            # Copy backup to database location
-            shutil.copy2(backup_path, self.db_path)
+            backup_conn = sqlite3.connect(str(backup_path))
+            db_conn = sqlite3.connect(str(self.db_path))
+            try:
+                completed = _copy_database(backup_conn, db_conn, progress, should_abort)
+            finally:
+                backup_conn.close()
+                db_conn.close()
+            
+            if not completed:
+                logger.info("Restore cancelled")
+                return False, "Restore cancelled"
             
             logger.info("Database restored successfully")
             return True, "Database restored successfully"
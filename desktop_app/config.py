@@ -4,6 +4,7 @@ PharmaPOS NG - Configuration Settings
 Centralized configuration for the application.
 """
 
+import copy
 import json
 import os
 from pathlib import Path
@@ -158,17 +159,39 @@ def get_config() -> dict:
 CONFIG_FILE: Final[str] = str(PROJECT_ROOT / "config.json")
 
 
+# (st_mtime_ns, printer section) from the last successful read of CONFIG_FILE
+_printer_config_cache: Optional[tuple] = None
+
+
 def load_printer_config() -> Dict[str, Any]:
-    """Load printer configuration from config.json, or return defaults."""
-    if os.path.exists(CONFIG_FILE):
+    """Load printer configuration from config.json, or return defaults.
+
+    The parsed section is cached until config.json's modification time
+    changes, so printing a receipt does not re-read the file every time.
+    """
+    global _printer_config_cache
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return _default_printer_config()
+
+    if _printer_config_cache is None or _printer_config_cache[0] != mtime:
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                 config = json.load(f)
-                return config.get("printer", _default_printer_config())
         except Exception as e:
             print(f"Warning: Failed to load printer config: {e}")
-    
-    return _default_printer_config()
+            return _default_printer_config()
+        _printer_config_cache = (mtime, config.get("printer", _default_printer_config()))
+
+    # Callers get their own copy so the cached section cannot be mutated
+    return copy.deepcopy(_printer_config_cache[1])
+
+
+def invalidate_printer_config_cache() -> None:
+    """Forget the cached printer section; the next load re-reads config.json."""
+    global _printer_config_cache
+    _printer_config_cache = None
 
 
 def save_printer_config(printer_config: Dict[str, Any]) -> bool:
@@ -184,6 +207,8 @@ def save_printer_config(printer_config: Dict[str, Any]) -> bool:
         
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
             json.dump(full_config, f, indent=2, ensure_ascii=False)
+        # Coarse mtimes could hide a quick re-save; drop the cache explicitly
+        invalidate_printer_config_cache()
         return True
     except Exception as e:
         print(f"Error saving printer config: {e}")
@@ -262,6 +287,7 @@ __all__ = [
     "get_config",
     "load_printer_config",
     "save_printer_config",
+    "invalidate_printer_config_cache",
     "get_printer_backend",
     "get_printer_device_info",
 ]
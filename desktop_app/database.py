@@ -98,6 +98,7 @@ users = Table(
     Column("last_synced_at", DateTime, nullable=True),
     Column("is_deleted", Boolean, server_default=text("0"), nullable=False),
 )
+Index("idx_users_active_username", users.c.is_active, users.c.username)
 
 
 # products (master catalog)
@@ -778,6 +779,8 @@ sync_logs = Table(
     Column("retry_count", Integer, server_default=text("0")),
 )
 Index("idx_sales_store_date", sales.c.store_id, sales.c.created_at)
+# Newest-first lookups (receipt reprint) read one row off this index
+Index("idx_sales_created_at", sales.c.created_at.desc())
 Index("idx_sales_receipt", sales.c.receipt_number, unique=True)
 Index("idx_products_sku_barcode", products.c.sku, products.c.barcode)
 
@@ -855,6 +858,12 @@ def init_db(db_path: Optional[str] = None) -> None:
     """
     engine = get_engine(db_path)
     metadata.create_all(engine)
+
+    # create_all skips indexes on tables that already exist, so add any
+    # indexes introduced since the database was first created
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     
     # Create default users if they don't exist
     _create_default_users(engine, db_path)
@@ -4,16 +4,37 @@ PharmaPOS NG - Data Export Manager
 Handles exporting data to Excel, PDF, and CSV formats.
 """
 
-from datetime import datetime
+from datetime import datetime, date
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import csv
+import json
 
+from sqlalchemy import column, inspect, select, table
+
+from desktop_app.database import get_engine
 from desktop_app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Rows pulled from SQLite per round trip when streaming a table export
+EXPORT_FETCH_SIZE = 10000
+
+# Columns never written to an export file
+EXCLUDED_COLUMNS = {"password_hash"}
+
+
+def _export_value(value: Any) -> Any:
+    """Convert a DB value to a plain CSV/Excel/JSON cell value."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
 
 class ExportManager:
     """Manages data export to various formats."""
@@ -150,11 +171,11 @@ class ExportManager:
                     ws.cell(row=row_idx, column=col_idx, value=value)
             
             # Auto-adjust column widths
-            for column in ws.columns:
+            for col_cells in ws.columns:
                 max_length = 0
-                column_letter = column[0].column_letter
+                column_letter = col_cells[0].column_letter
                 
-                for cell in column:
+                for cell in col_cells:
                     try:
                         if len(str(cell.value)) > max_length:
                             max_length = len(str(cell.value))
@@ -292,5 +313,145 @@ class ExportManager:
             logger.error(f"PDF export failed: {e}", exc_info=True)
             return False, f"Export failed: {str(e)}", None
 
+    def iter_table_rows(
+        self,
+        conn,
+        table_name: str,
+        date_range: Optional[Tuple[date, date]] = None,
+    ) -> Tuple[List[str], Iterator[List[tuple]]]:
+        """Stream a table's rows in batches of EXPORT_FETCH_SIZE.
+
+        Columns are read from the database itself, so databases created by
+        older versions of the schema export as they are.
+
+        Args:
+            conn: Open SQLAlchemy connection
+            table_name: Name of a table in the database
+            date_range: Optional inclusive (start, end) filter on created_at,
+                applied when the table has that column
+
+        Returns:
+            Tuple of (column names, iterator of row batches)
+        """
+        names = [
+            c["name"] for c in inspect(conn).get_columns(table_name)
+            if c["name"] not in EXCLUDED_COLUMNS
+        ]
+        source = table(table_name, *[column(name) for name in names])
+        stmt = select(source)
+        if date_range and "created_at" in names:
+            start, end = date_range
+            stmt = stmt.where(
+                source.c.created_at >= f"{start.isoformat()} 00:00:00",
+                source.c.created_at <= f"{end.isoformat()} 23:59:59.999999",
+            )
+
+        def batches() -> Iterator[List[tuple]]:
+            result = conn.execute(stmt)
+            while True:
+                rows = result.fetchmany(EXPORT_FETCH_SIZE)
+                if not rows:
+                    break
+                yield [tuple(_export_value(v) for v in row) for row in rows]
+
+        return names, batches()
+
+    def export_tables(
+        self,
+        table_names: Optional[List[str]],
+        filename: str,
+        file_format: str = "csv",
+        db_path: Optional[str] = None,
+        date_range: Optional[Tuple[date, date]] = None,
+    ) -> tuple[bool, str, Optional[Path]]:
+        """Export whole tables straight from the database.
+
+        Rows are streamed in batches rather than loaded as dicts first. CSV
+        writes one file per table into a timestamped folder, Excel one sheet
+        per table (write-only workbook), JSON one object keyed by table name.
+
+        Args:
+            table_names: Tables to export, or None for every table in the database
+            filename: Output name (without extension)
+            file_format: 'csv', 'excel' or 'json'
+            db_path: Optional path to the SQLite database file
+            date_range: Optional inclusive (start, end) filter on created_at
+
+        Returns:
+            Tuple of (success, message, file_path)
+        """
+        try:
+            conn = get_engine(db_path).connect()
+        except Exception as e:
+            logger.error(f"Table export failed: {e}", exc_info=True)
+            return False, f"Export failed: {str(e)}", None
+
+        try:
+            if table_names is None:
+                table_names = sorted(inspect(conn).get_table_names())
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_name = f"{filename}_{timestamp}"
+            row_count = 0
+
+            if file_format == "csv":
+                file_path = self.export_dir / base_name
+                file_path.mkdir()
+                for table_name in table_names:
+                    headers, batches = self.iter_table_rows(conn, table_name, date_range)
+                    with open(file_path / f"{table_name}.csv", 'w', newline='', encoding='utf-8') as f:
+                        writer = csv.writer(f)
+                        writer.writerow(headers)
+                        for rows in batches:
+                            writer.writerows(rows)
+                            row_count += len(rows)
+
+            elif file_format == "excel":
+                try:
+                    import openpyxl
+                except ImportError:
+                    return False, "openpyxl not installed. Run: pip install openpyxl", None
+
+                file_path = self.export_dir / f"{base_name}.xlsx"
+                wb = openpyxl.Workbook(write_only=True)
+                for table_name in table_names:
+                    headers, batches = self.iter_table_rows(conn, table_name, date_range)
+                    # Excel caps sheet titles at 31 characters
+                    ws = wb.create_sheet(title=table_name[:31])
+                    ws.append(headers)
+                    for rows in batches:
+                        for row in rows:
+                            ws.append(row)
+                        row_count += len(rows)
+                wb.save(file_path)
+
+            elif file_format == "json":
+                file_path = self.export_dir / f"{base_name}.json"
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write("{")
+                    for i, table_name in enumerate(table_names):
+                        headers, batches = self.iter_table_rows(conn, table_name, date_range)
+                        f.write(f"{',' if i else ''}\n{json.dumps(table_name)}: [")
+                        first = True
+                        for rows in batches:
+                            for row in rows:
+                                f.write(("" if first else ",") + "\n  " + json.dumps(dict(zip(headers, row)), default=str))
+                                first = False
+                            row_count += len(rows)
+                        f.write("\n]")
+                    f.write("\n}\n")
+
+            else:
+                return False, f"Unsupported export format: {file_format}", None
+
+            logger.info(f"Table export successful: {file_path} ({row_count} rows)")
+            return True, f"Exported {row_count} rows to {file_path.name}", file_path
+
+        except Exception as e:
+            logger.error(f"Table export failed: {e}", exc_info=True)
+            return False, f"Export failed: {str(e)}", None
+        finally:
+            conn.close()
+
 
 __all__ = ['ExportManager']
@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import os
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
 from decimal import Decimal
+from itertools import groupby
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import bindparam, event, select, func, and_, or_
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.exc import IntegrityError
 
@@ -156,12 +158,58 @@ class UserService:
         return self.update_user(user_id, is_active=False)
 
 
+# --- Reference Data Cache ---------------------------------------------------
+_PRODUCTS_BY_IDS_STMT = select(products).where(
+    products.c.id.in_(bindparam("ids", expanding=True))
+)
+
+
+class RefDataCache:
+    """In-process cache of product and batch rows keyed by id.
+
+    Hits are served from memory and only the missing ids are fetched, in one
+    IN query. Services given the cache drop the entries they write; writes
+    made through other sessions must call `clear()`.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._products: Dict[int, dict] = {}
+        self._batches: Dict[int, dict] = {}
+
+    def get_products(self, product_ids: List[int]) -> Dict[int, dict]:
+        """Get products by id, keyed by product id; unknown ids are omitted."""
+        return self._get(self._products, _PRODUCTS_BY_IDS_STMT, product_ids)
+
+    def get_batches(self, batch_ids: List[int]) -> Dict[int, dict]:
+        """Get batches by id, keyed by batch id; unknown ids are omitted."""
+        return self._get(self._batches, _BATCHES_BY_IDS_STMT, batch_ids)
+
+    def _get(self, cache: Dict[int, dict], stmt, ids: List[int]) -> Dict[int, dict]:
+        missing = [row_id for row_id in ids if row_id not in cache]
+        if missing:
+            for row in self.session.execute(stmt, {"ids": missing}):
+                cache[row.id] = dict(row._mapping)
+        return {row_id: cache[row_id] for row_id in ids if row_id in cache}
+
+    def invalidate_product(self, product_id: int) -> None:
+        self._products.pop(product_id, None)
+
+    def invalidate_batch(self, batch_id: int) -> None:
+        self._batches.pop(batch_id, None)
+
+    def clear(self) -> None:
+        self._products.clear()
+        self._batches.clear()
+
+
 # --- Product Service --------------------------------------------------------
 class ProductService:
     """Service for managing products in the catalog."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, cache: Optional[RefDataCache] = None):
         self.session = session
+        self.cache = cache
 
     def create_product(
         self,
@@ -232,6 +280,18 @@ class ProductService:
         result = self.session.execute(stmt).fetchone()
         return dict(result._mapping) if result else None
 
+    def get_products_by_skus(self, skus: List[str], chunk_size: int = 500) -> Dict[str, dict]:
+        """Map the given SKUs to product rows, querying in chunks; unknown SKUs are omitted."""
+        skus = list(skus)
+        found = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(skus), chunk_size):
+            chunk = skus[start:start + chunk_size]
+            stmt = select(products).where(products.c.sku.in_(chunk))
+            for row in self.session.execute(stmt):
+                found[row.sku] = dict(row._mapping)
+        return found
+
     def get_product_by_barcode(self, barcode: str) -> Optional[dict]:
         """Get product by barcode."""
         stmt = select(products).where(products.c.barcode == barcode)
@@ -252,6 +312,8 @@ class ProductService:
         stmt = products.update().where(products.c.id == product_id).values(**kwargs)
         self.session.execute(stmt)
         self.session.commit()
+        if self.cache:
+            self.cache.invalidate_product(product_id)
         return True
 
     def deactivate_product(self, product_id: int) -> bool:
@@ -260,11 +322,19 @@ class ProductService:
 
 
 # --- Inventory Service (Batch & Stock) ---------------------------------------
+# Built once; the expanding bindparam lets the compiled form be reused for
+# any number of ids
+_BATCHES_BY_IDS_STMT = select(product_batches).where(
+    product_batches.c.id.in_(bindparam("ids", expanding=True))
+)
+
+
 class InventoryService:
     """Service for managing product batches and stock levels."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, cache: Optional[RefDataCache] = None):
         self.session = session
+        self.cache = cache
 
     def receive_stock(
         self,
@@ -319,6 +389,8 @@ class InventoryService:
         )
         self.session.execute(product_update)
         self.session.commit()
+        if self.cache:
+            self.cache.invalidate_product(product_id)
 
         return {
             "id": batch_id,
@@ -354,6 +426,21 @@ class InventoryService:
         results = self.session.execute(stmt).fetchall()
         return [dict(row._mapping) for row in results]
 
+    def get_store_inventory_ids(self, store_id: int) -> List[int]:
+        """Get the ids of all in-stock batches in store, in the same FEFO order."""
+        stmt = (
+            select(product_batches.c.id)
+            .where(product_batches.c.store_id == store_id)
+            .where(product_batches.c.quantity > 0)
+            .order_by(product_batches.c.expiry_date)
+        )
+        return list(self.session.execute(stmt).scalars())
+
+    def get_batches_by_ids(self, batch_ids: List[int]) -> Dict[int, dict]:
+        """Get batches by id in one query, keyed by batch id."""
+        rows = self.session.execute(_BATCHES_BY_IDS_STMT, {"ids": list(batch_ids)})
+        return {row.id: dict(row._mapping) for row in rows}
+
     def get_product_stock(self, product_id: int, store_id: int) -> int:
         """Get total quantity in stock for a product in a store."""
         stmt = select(func.sum(product_batches.c.quantity)).where(
@@ -379,6 +466,20 @@ class InventoryService:
         batches = [dict(row._mapping) for row in results]
         return batches
 
+    def get_available_batches_for_products(self, product_ids: List[int], store_id: int) -> Dict[int, List[dict]]:
+        """Get available batches for several products in one query, FEFO-ordered per product."""
+        stmt = (
+            select(product_batches)
+            .where(product_batches.c.product_id.in_(set(product_ids)))
+            .where(product_batches.c.store_id == store_id)
+            .where(product_batches.c.quantity > 0)
+            .order_by(product_batches.c.product_id, product_batches.c.expiry_date)
+        )
+        batches_by_product = {product_id: [] for product_id in product_ids}
+        for product_id, rows in groupby(self.session.execute(stmt), key=lambda row: row.product_id):
+            batches_by_product[product_id] = [dict(row._mapping) for row in rows]
+        return batches_by_product
+
     def allocate_stock_for_sale(self, product_id: int, store_id: int, quantity: int) -> List[dict]:
         """Allocate stock for a sale using FEFO. Returns list of allocations: [{batch_id, quantity}]."""
         if quantity <= 0:
@@ -717,24 +818,61 @@ class InventoryService:
 
     def expire_batches_within_days(self, store_id: int, days: int, user_id: int) -> int:
         """Expire all batches that will expire within the next `days` days."""
-        from datetime import timedelta, datetime
+        return self.expire_batches_within_days_bulk([store_id], days, user_id).get(store_id, 0)
+
+    def expire_batches_within_days_bulk(self, store_ids: List[int], days: int, user_id: int) -> Dict[int, int]:
+        """Expire batches expiring within `days` days across several stores at once.
+
+        Zeroes every matching batch with one UPDATE and writes their audit
+        rows in one executemany, committed together. Returns the number of
+        batches expired per store id.
+        """
         cutoff = datetime.now().date() + timedelta(days=days)
         stmt = (
-            select(product_batches.c.id)
-            .where(product_batches.c.store_id == store_id)
+            select(product_batches.c.id, product_batches.c.store_id, product_batches.c.quantity)
+            .where(product_batches.c.store_id.in_(set(store_ids)))
             .where(product_batches.c.expiry_date <= cutoff)
             .where(product_batches.c.quantity > 0)
         )
-        results = self.session.execute(stmt).fetchall()
-        batch_ids = [row[0] for row in results]
-        expired_count = 0
-        for bid in batch_ids:
-            if self.expire_batch(bid, user_id, notes=f"Bulk expire within next {days} days"):
-                expired_count += 1
-        return expired_count
+        batches = self.session.execute(stmt).fetchall()
+        expired = {store_id: 0 for store_id in store_ids}
+        if not batches:
+            return expired
+
+        batch_ids = [batch.id for batch in batches]
+        self.session.execute(
+            product_batches.update()
+            .where(product_batches.c.id.in_(batch_ids))
+            .values(quantity=0)
+        )
+        self.session.execute(
+            inventory_audit.insert(),
+            [
+                {
+                    "product_batch_id": batch.id,
+                    "previous_quantity": batch.quantity,
+                    "new_quantity": 0,
+                    "change_type": "expired",
+                    "notes": f"Bulk expire within next {days} days",
+                    "user_id": user_id,
+                    "sync_id": str(uuid.uuid4()),
+                }
+                for batch in batches
+            ],
+        )
+        self.session.commit()
+
+        for batch in batches:
+            expired[batch.store_id] += 1
+            if self.cache:
+                self.cache.invalidate_batch(batch.id)
+        return expired
+
+    def update_batch_quantity(self, batch_id: int, quantity_change: int, change_type: str, user_id: int, reference_id: Optional[int] = None, notes: str = "", commit: bool = True) -> bool:
+        """Update batch quantity and log the change in audit trail.
 
-    def update_batch_quantity(self, batch_id: int, quantity_change: int, change_type: str, user_id: int, reference_id: Optional[int] = None, notes: str = "") -> bool:
-        """Update batch quantity and log the change in audit trail."""
+        Pass commit=False to leave the change in the caller's transaction.
+        """
         from desktop_app.database import inventory_audit
         
         batch = self.get_batch(batch_id)
@@ -751,6 +889,8 @@ class InventoryService:
             .values(quantity=new_qty)
         )
         self.session.execute(stmt)
+        if self.cache:
+            self.cache.invalidate_batch(batch_id)
 
         # Log to audit trail
         audit_stmt = inventory_audit.insert().values(
@@ -764,7 +904,8 @@ class InventoryService:
             sync_id=str(uuid.uuid4()),
         )
         self.session.execute(audit_stmt)
-        self.session.commit()
+        if commit:
+            self.session.commit()
         return True
 
     def confirm_reservation(self, reservation_id: int, user_id: int, reference_id: Optional[int] = None) -> bool:
@@ -825,6 +966,38 @@ class InventoryService:
 
 
 # --- Sales Service -----------------------------------------------------------
+# Receipt statements, built once and executed with parameters
+_SALE_ITEM_COLUMNS = (
+    products.c.name.label("product_name"),
+    product_batches.c.batch_number,
+    sale_items.c.product_batch_id,
+    sale_items.c.quantity,
+    sale_items.c.unit_price,
+)
+
+_SALE_ITEMS_WITH_PRODUCT_NAMES_STMT = (
+    select(*_SALE_ITEM_COLUMNS)
+    .select_from(
+        sale_items.outerjoin(product_batches, sale_items.c.product_batch_id == product_batches.c.id)
+        .outerjoin(products, product_batches.c.product_id == products.c.id)
+    )
+    .where(sale_items.c.sale_id == bindparam("sale_id"))
+    .order_by(sale_items.c.id)
+)
+
+_LAST_SALE = select(sales).order_by(sales.c.created_at.desc()).limit(1).cte("last_sale")
+
+_LATEST_SALE_WITH_ITEMS_STMT = (
+    select(_LAST_SALE, *_SALE_ITEM_COLUMNS)
+    .select_from(
+        _LAST_SALE.outerjoin(sale_items, sale_items.c.sale_id == _LAST_SALE.c.id)
+        .outerjoin(product_batches, sale_items.c.product_batch_id == product_batches.c.id)
+        .outerjoin(products, product_batches.c.product_id == products.c.id)
+    )
+    .order_by(sale_items.c.id)
+)
+
+
 class SalesService:
     """Service for processing sales transactions."""
 
@@ -886,8 +1059,10 @@ class SalesService:
                 change_type="sale",
                 user_id=user_id,
                 reference_id=sale_id,
+                commit=False,
             )
 
+        # Sale, items and stock movements commit together
         self.session.commit()
         return {
             "id": sale_id,
@@ -909,6 +1084,34 @@ class SalesService:
         results = self.session.execute(stmt).fetchall()
         return [dict(row._mapping) for row in results]
 
+    def get_sale_items_with_product_names(self, sale_id: int) -> List[dict]:
+        """Get a sale's items with product name and batch number in one joined query.
+
+        Rows hold only product_name, batch_number, product_batch_id, quantity
+        and unit_price; product_name is None if the product row is gone.
+        """
+        rows = self.session.execute(_SALE_ITEMS_WITH_PRODUCT_NAMES_STMT, {"sale_id": sale_id})
+        return [dict(row._mapping) for row in rows]
+
+    def get_latest_sale_with_items(self) -> Optional[dict]:
+        """Get the most recent sale and its items in a single statement.
+
+        The sale is picked in a CTE and joined to its items, so the header
+        and the rows arrive together. Returns the sale dict with an `items`
+        list of read-only row mappings keyed like
+        `get_sale_items_with_product_names`, or None if there are no sales.
+        """
+        rows = self.session.execute(_LATEST_SALE_WITH_ITEMS_STMT).fetchall()
+        if not rows:
+            return None
+
+        # Every row repeats the sale columns; copy them once for the header.
+        # Items are read once by the caller, so their fetched rows' mappings
+        # are used as they are rather than copied into dicts.
+        sale = {key: rows[0]._mapping[key] for key in _LAST_SALE.c.keys()}
+        sale["items"] = [row._mapping for row in rows if row.product_batch_id is not None]
+        return sale
+
     def get_sales_by_date(
         self, store_id: int, start_date: date, end_date: date
     ) -> List[dict]:
@@ -1281,14 +1484,39 @@ def get_session(db_path: Optional[str] = None) -> Session:
     return Session()
 
 
+@contextmanager
+def statement_budget(session: Session, limit: int):
+    """Fail if the block issues more than `limit` SQL statements on `session`.
+
+    A development guard for hot paths such as receipt rendering: a per-row
+    lookup added later trips the assertion instead of silently multiplying
+    queries. Like any assert it is skipped under `python -O`.
+    """
+    connection = session.connection()
+    count = 0
+
+    def count_statement(*args) -> None:  # noqa: ANN002
+        nonlocal count
+        count += 1
+
+    event.listen(connection, "before_cursor_execute", count_statement)
+    try:
+        yield
+    finally:
+        event.remove(connection, "before_cursor_execute", count_statement)
+    assert count <= limit, f"{count} SQL statements issued, budget is {limit}"
+
+
 __all__ = [
     "StoreService",
     "UserService",
     "ProductService",
     "InventoryService",
+    "RefDataCache",
     "SalesService",
     "StockTransferService",
     "SupplierService",
     "PurchaseOrderService",
     "get_session",
+    "statement_budget",
 ]
@@ -8,13 +8,76 @@ bulk operations, and data validation.
 import csv
 import json
 from decimal import Decimal
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Iterator, Callable
 from datetime import datetime
 import os
+import uuid
 
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import IntegrityError
+
+from desktop_app.database import products
 from desktop_app.models import ProductService, get_session
 
 
+# Rows read before each batched SKU lookup and executemany during import
+IMPORT_CHUNK_SIZE = 500
+
+# Rows between progress callbacks during import
+PROGRESS_INTERVAL = 100
+
+# Fields every imported row must provide
+REQUIRED_FIELDS = ("name", "sku", "nafdac_number")
+
+# Fields an import may change on a product that already exists
+UPDATE_FIELDS = ("name", "generic_name", "barcode", "cost_price", "selling_price", "description")
+
+# Precision prices are compared at when checking for unchanged rows
+CENTS = Decimal("0.01")
+
+
+def _field(row: Dict, key: str, default: str = "") -> str:
+    """Return a stripped string value from an import row (None counts as empty)."""
+    value = row.get(key, default)
+    return "" if value is None else str(value).strip()
+
+
+def _new_product_values(values: Dict) -> Dict:
+    """Insert parameters for an imported product (mirrors ProductService.create_product)."""
+    return dict(
+        values,
+        retail_price=values["selling_price"],
+        min_stock=0,
+        max_stock=9999,
+        sync_id=str(uuid.uuid4()),
+    )
+
+
+def _update_product_values(product_id: int, values: Dict) -> Dict:
+    """Update parameters for an imported product that already exists."""
+    params = {key: values[key] for key in UPDATE_FIELDS}
+    params["product_id"] = product_id
+    return params
+
+
+def _row_fields(values: Dict) -> Tuple:
+    """The updatable fields of a product row or parsed import row, comparable.
+
+    Prices are rounded to cents; text is taken verbatim: parsed rows are
+    already stripped by _parse_row, so a stored value with stray whitespace
+    compares differently and gets rewritten.
+    """
+    return tuple(
+        Decimal(values[key] or 0).quantize(CENTS) if key.endswith("_price")
+        else ("" if values[key] is None else str(values[key]))
+        for key in UPDATE_FIELDS
+    )
+
+
+# Executed with a list of parameter dicts as a single executemany
+_UPDATE_PRODUCT_STMT = products.update().where(products.c.id == bindparam("product_id"))
+
+
 class ProductImportExporter:
     """Handle product import/export operations."""
 
@@ -108,189 +171,253 @@ class ProductImportExporter:
         except Exception as e:
             return False, f"Export failed: {str(e)}"
 
-    def import_from_csv(
-        self, filepath: str, update_existing: bool = False
-    ) -> Tuple[int, List[str]]:
+    def iter_rows(self, filepath: str, format: str = "csv") -> Iterator[Tuple[str, Dict]]:
         """
-        Import products from CSV file.
+        Yield rows from an import file one at a time.
 
-        CSV should have columns: name, generic_name, sku, barcode, nafdac_number,
-        cost_price, selling_price, description
+        CSV files are read through a buffered handle and never held in memory
+        as a whole. JSON files are parsed once and their items yielded in turn.
 
         Args:
-            filepath: Input CSV file path
+            filepath: Input file path
+            format: 'csv' or 'json'
+
+        Yields:
+            tuple: (label: str, row: dict) where label is "Row N" or "Item N"
+        """
+        if format.lower() == "csv":
+            with open(filepath, "r", encoding="utf-8", buffering=1 << 20, newline="") as csvfile:
+                # Start at 2 (row 1 is header)
+                for row_num, row in enumerate(csv.DictReader(csvfile), start=2):
+                    yield f"Row {row_num}", row
+
+        elif format.lower() == "json":
+            with open(filepath, "r", encoding="utf-8") as jsonfile:
+                products_data = json.load(jsonfile)
+
+            if not isinstance(products_data, list):
+                raise ValueError("JSON must contain an array of products")
+
+            for idx, row in enumerate(products_data, start=1):
+                yield f"Item {idx}", row
+
+        else:
+            raise ValueError("Format must be 'csv' or 'json'")
+
+    def stream_import(
+        self,
+        filepath: str,
+        format: str = "csv",
+        update_existing: bool = False,
+        progress: Optional[Callable[[int], None]] = None,
+        should_abort: Optional[Callable[[], bool]] = None,
+    ) -> Tuple[int, List[str], List[str]]:
+        """
+        Validate and import products in a single pass over the file.
+
+        Invalid rows are reported as errors and skipped; valid rows are
+        imported. When a SKU appears more than once in the file only its
+        first valid row is used, and the number of collapsed duplicates is
+        reported as a notice. With update_existing, rows whose fields match
+        the stored product are skipped rather than rewritten and counted in
+        a notice. Notices are informational and do not mean the import had
+        problems.
+
+        Args:
+            filepath: Input file path
+            format: 'csv' or 'json'
             update_existing: Update existing products if SKU matches
+            progress: Optional callback receiving the number of rows read,
+                called every PROGRESS_INTERVAL rows
+            should_abort: Optional callback; when it returns True the import
+                stops and is rolled back
 
         Returns:
-            tuple: (count_imported: int, errors: List[str])
+            tuple: (count_imported: int, errors: List[str], notices: List[str])
         """
         errors = []
-        created_count = 0
+        notices = []
+        imported_count = 0
+        # SKUs already taken from this file; later rows repeating one are
+        # dropped before any DB work (first occurrence wins)
+        seen_skus = set()
+        duplicate_count = 0
+        unchanged_count = 0
+
+        def flush(chunk: List[Tuple[str, Dict]]) -> None:
+            nonlocal imported_count, duplicate_count, unchanged_count
+            parsed = []
+            for label, row in chunk:
+                values, error = self._parse_row(row)
+                if error:
+                    errors.append(f"{label}: {error}")
+                elif values["sku"] in seen_skus:
+                    duplicate_count += 1
+                else:
+                    seen_skus.add(values["sku"])
+                    parsed.append((label, values))
+
+            # One lookup per chunk instead of a SELECT per row
+            existing = self.product_service.get_products_by_skus(
+                {values["sku"] for _, values in parsed}
+            )
+            inserts = []
+            updates = []
+
+            for label, values in parsed:
+                product = existing.get(values["sku"])
+                if product is None:
+                    inserts.append((label, _new_product_values(values)))
+                elif update_existing:
+                    # Re-imports of an unchanged supplier file leave rows untouched
+                    if _row_fields(values) == _row_fields(product):
+                        unchanged_count += 1
+                    else:
+                        updates.append((label, _update_product_values(product["id"], values)))
+                else:
+                    errors.append(f"{label}: SKU '{values['sku']}' already exists (skipped)")
+
+            imported_count += self._execute_batch(products.insert(), inserts, errors)
+            imported_count += self._execute_batch(_UPDATE_PRODUCT_STMT, updates, errors)
 
         try:
-            with open(filepath, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
-                    try:
-                        # Validate required fields
-                        name = row.get("name", "").strip()
-                        sku = row.get("sku", "").strip()
-                        nafdac = row.get("nafdac_number", "").strip()
-                        cost_price = row.get("cost_price", "0").strip()
-                        selling_price = row.get("selling_price", "0").strip()
-
-                        if not all([name, sku, nafdac, cost_price, selling_price]):
-                            errors.append(
-                                f"Row {row_num}: Missing required fields (name, sku, nafdac_number, cost_price, selling_price)"
-                            )
-                            continue
-
-                        # Validate prices
-                        try:
-                            cost = Decimal(cost_price)
-                            selling = Decimal(selling_price)
-                            if cost < 0 or selling < 0:
-                                raise ValueError("Prices cannot be negative")
-                        except Exception as e:
-                            errors.append(f"Row {row_num}: Invalid price format - {str(e)}")
-                            continue
-
-                        # Check if product exists
-                        existing = self.product_service.get_product_by_sku(sku)
-
-                        if existing:
-                            if update_existing:
-                                # Update existing product
-                                self.product_service.update_product(
-                                    existing["id"],
-                                    name=name,
-                                    generic_name=row.get("generic_name", ""),
-                                    barcode=row.get("barcode", ""),
-                                    cost_price=cost,
-                                    selling_price=selling,
-                                    description=row.get("description", ""),
-                                )
-                                created_count += 1
-                            else:
-                                errors.append(f"Row {row_num}: SKU '{sku}' already exists (skipped)")
-                                continue
-                        else:
-                            # Create new product
-                            self.product_service.create_product(
-                                name=name,
-                                sku=sku,
-                                cost_price=cost,
-                                selling_price=selling,
-                                nafdac_number=nafdac,
-                                generic_name=row.get("generic_name", ""),
-                                barcode=row.get("barcode", ""),
-                                description=row.get("description", ""),
-                            )
-                            created_count += 1
-
-                    except Exception as e:
-                        errors.append(f"Row {row_num}: {str(e)}")
+            # Sorting/temp tables for the lookups stay in memory
+            self.session.execute(text("PRAGMA temp_store=MEMORY"))
+
+            chunk = []
+            for rows_read, item in enumerate(self.iter_rows(filepath, format), start=1):
+                if should_abort and should_abort():
+                    self.session.rollback()
+                    return 0, ["Import cancelled"], notices
+                if progress and rows_read % PROGRESS_INTERVAL == 0:
+                    progress(rows_read)
+
+                chunk.append(item)
+                if len(chunk) >= IMPORT_CHUNK_SIZE:
+                    flush(chunk)
+                    chunk = []
+            if chunk:
+                flush(chunk)
+
+            # The whole import is committed as one transaction
+            self.session.commit()
+
+            if imported_count:
+                # Refresh planner statistics so SKU/barcode lookups keep using
+                # their indexes after a large change in table size
+                self.session.execute(text("ANALYZE products"))
+                self.session.commit()
+
+            if duplicate_count:
+                notices.append(f"{duplicate_count} duplicate SKUs in file collapsed (first occurrence kept)")
+            if unchanged_count:
+                notices.append(f"{unchanged_count} unchanged products skipped")
+            return imported_count, errors, notices
 
         except FileNotFoundError:
             errors.append(f"File not found: {filepath}")
+        except json.JSONDecodeError as e:
+            errors.append(f"Invalid JSON format: {str(e)}")
+        except ValueError as e:
+            errors.append(str(e))
         except Exception as e:
             errors.append(f"Import failed: {str(e)}")
 
-        return created_count, errors
+        self.session.rollback()
+        return 0, errors, []
 
-    def import_from_json(
+    def _execute_batch(self, stmt, batch: List[Tuple[str, Dict]], errors: List[str]) -> int:
+        """
+        Run `stmt` for every row in `batch` with a single executemany.
+
+        If the batch hits a constraint violation it is retried row by row so
+        the offending rows can be reported. Returns the number of rows written.
+        """
+        if not batch:
+            return 0
+
+        try:
+            with self.session.begin_nested():
+                self.session.execute(stmt, [params for _, params in batch])
+            return len(batch)
+        except IntegrityError:
+            pass
+
+        written = 0
+        for label, params in batch:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(stmt, params)
+                written += 1
+            except IntegrityError as e:
+                errors.append(f"{label}: {str(e.orig)}")
+        return written
+
+    def _parse_row(self, row: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        """Validate a single import row. Returns (values, None) or (None, error)."""
+        name = _field(row, "name")
+        sku = _field(row, "sku")
+        nafdac = _field(row, "nafdac_number")
+        cost_price = _field(row, "cost_price", "0")
+        selling_price = _field(row, "selling_price", "0")
+
+        if not all([name, sku, nafdac, cost_price, selling_price]):
+            return None, "Missing required fields (name, sku, nafdac_number, cost_price, selling_price)"
+
+        # Validate prices
+        try:
+            cost = Decimal(cost_price)
+            selling = Decimal(selling_price)
+            if cost < 0 or selling < 0:
+                raise ValueError("Prices cannot be negative")
+        except Exception as e:
+            return None, f"Invalid price format - {str(e)}"
+
+        return {
+            "name": name,
+            "sku": sku,
+            "nafdac_number": nafdac,
+            "cost_price": cost,
+            "selling_price": selling,
+            # Normalized exactly as _row_fields reads them, so the change
+            # check covers what is written
+            "generic_name": _field(row, "generic_name"),
+            "barcode": _field(row, "barcode"),
+            "description": _field(row, "description"),
+        }, None
+
+    def import_from_csv(
         self, filepath: str, update_existing: bool = False
-    ) -> Tuple[int, List[str]]:
+    ) -> Tuple[int, List[str], List[str]]:
         """
-        Import products from JSON file.
+        Import products from CSV file.
+
+        CSV should have columns: name, generic_name, sku, barcode, nafdac_number,
+        cost_price, selling_price, description
 
         Args:
-            filepath: Input JSON file path
+            filepath: Input CSV file path
             update_existing: Update existing products if SKU matches
 
         Returns:
-            tuple: (count_imported: int, errors: List[str])
+            tuple: (count_imported: int, errors: List[str], notices: List[str])
         """
-        errors = []
-        created_count = 0
-
-        try:
-            with open(filepath, "r", encoding="utf-8") as jsonfile:
-                products_data = json.load(jsonfile)
+        return self.stream_import(filepath, "csv", update_existing)
 
-                if not isinstance(products_data, list):
-                    return 0, ["JSON must contain an array of products"]
-
-                for idx, row in enumerate(products_data, start=1):
-                    try:
-                        # Validate required fields
-                        name = row.get("name", "").strip() if row.get("name") else ""
-                        sku = row.get("sku", "").strip() if row.get("sku") else ""
-                        nafdac = row.get("nafdac_number", "").strip() if row.get("nafdac_number") else ""
-                        cost_price = str(row.get("cost_price", "0")).strip()
-                        selling_price = str(row.get("selling_price", "0")).strip()
-
-                        if not all([name, sku, nafdac, cost_price, selling_price]):
-                            errors.append(
-                                f"Item {idx}: Missing required fields (name, sku, nafdac_number, cost_price, selling_price)"
-                            )
-                            continue
-
-                        # Validate prices
-                        try:
-                            cost = Decimal(cost_price)
-                            selling = Decimal(selling_price)
-                            if cost < 0 or selling < 0:
-                                raise ValueError("Prices cannot be negative")
-                        except Exception as e:
-                            errors.append(f"Item {idx}: Invalid price format - {str(e)}")
-                            continue
-
-                        # Check if product exists
-                        existing = self.product_service.get_product_by_sku(sku)
-
-                        if existing:
-                            if update_existing:
-                                # Update existing product
-                                self.product_service.update_product(
-                                    existing["id"],
-                                    name=name,
-                                    generic_name=row.get("generic_name", ""),
-                                    barcode=row.get("barcode", ""),
-                                    cost_price=cost,
-                                    selling_price=selling,
-                                    description=row.get("description", ""),
-                                )
-                                created_count += 1
-                            else:
-                                errors.append(f"Item {idx}: SKU '{sku}' already exists (skipped)")
-                                continue
-                        else:
-                            # Create new product
-                            self.product_service.create_product(
-                                name=name,
-                                sku=sku,
-                                cost_price=cost,
-                                selling_price=selling,
-                                nafdac_number=nafdac,
-                                generic_name=row.get("generic_name", ""),
-                                barcode=row.get("barcode", ""),
-                                description=row.get("description", ""),
-                            )
-                            created_count += 1
-
-                    except Exception as e:
-                        errors.append(f"Item {idx}: {str(e)}")
+    def import_from_json(
+        self, filepath: str, update_existing: bool = False
+    ) -> Tuple[int, List[str], List[str]]:
+        """
+        Import products from JSON file.
 
-        except FileNotFoundError:
-            errors.append(f"File not found: {filepath}")
-        except json.JSONDecodeError as e:
-            errors.append(f"Invalid JSON format: {str(e)}")
-        except Exception as e:
-            errors.append(f"Import failed: {str(e)}")
+        Args:
+            filepath: Input JSON file path
+            update_existing: Update existing products if SKU matches
 
-        return created_count, errors
+        Returns:
+            tuple: (count_imported: int, errors: List[str], notices: List[str])
+        """
+        return self.stream_import(filepath, "json", update_existing)
 
     def get_import_template(self, filepath: str, format: str = "csv") -> Tuple[bool, str]:
         """
@@ -363,6 +490,9 @@ class ProductImportExporter:
         """
         Validate import file without importing.
 
+        Rows are streamed through iter_rows, so CSV files are tokenized by the
+        C csv reader over a buffered handle and never loaded whole.
+
         Args:
             filepath: File path to validate
             format: 'csv' or 'json'
@@ -373,59 +503,25 @@ class ProductImportExporter:
         errors = []
 
         try:
-            if format.lower() == "csv":
-                with open(filepath, "r", encoding="utf-8") as csvfile:
-                    reader = csv.DictReader(csvfile)
-
-                    for row_num, row in enumerate(reader, start=2):
-                        # Validate required fields
-                        if not row.get("name", "").strip():
-                            errors.append(f"Row {row_num}: Missing 'name'")
-                        if not row.get("sku", "").strip():
-                            errors.append(f"Row {row_num}: Missing 'sku'")
-                        if not row.get("nafdac_number", "").strip():
-                            errors.append(f"Row {row_num}: Missing 'nafdac_number'")
-
-                        # Validate prices
-                        try:
-                            cost_price = row.get("cost_price", "0").strip()
-                            selling_price = row.get("selling_price", "0").strip()
-                            Decimal(cost_price)
-                            Decimal(selling_price)
-                        except Exception as e:
-                            errors.append(f"Row {row_num}: Invalid price format - {str(e)}")
-
-            elif format.lower() == "json":
-                with open(filepath, "r", encoding="utf-8") as jsonfile:
-                    products_data = json.load(jsonfile)
-
-                    if not isinstance(products_data, list):
-                        errors.append("JSON must contain an array of products")
-                        return False, errors
-
-                    for idx, row in enumerate(products_data, start=1):
-                        if not row.get("name", "").strip():
-                            errors.append(f"Item {idx}: Missing 'name'")
-                        if not row.get("sku", "").strip():
-                            errors.append(f"Item {idx}: Missing 'sku'")
-                        if not row.get("nafdac_number", "").strip():
-                            errors.append(f"Item {idx}: Missing 'nafdac_number'")
-
-                        try:
-                            cost_price = str(row.get("cost_price", "0")).strip()
-                            selling_price = str(row.get("selling_price", "0")).strip()
-                            Decimal(cost_price)
-                            Decimal(selling_price)
-                        except Exception as e:
-                            errors.append(f"Item {idx}: Invalid price format - {str(e)}")
-
-            else:
-                errors.append("Format must be 'csv' or 'json'")
+            for label, row in self.iter_rows(filepath, format):
+                # Validate required fields
+                for key in REQUIRED_FIELDS:
+                    if not _field(row, key):
+                        errors.append(f"{label}: Missing '{key}'")
+
+                # Validate prices
+                try:
+                    Decimal(_field(row, "cost_price", "0"))
+                    Decimal(_field(row, "selling_price", "0"))
+                except Exception as e:
+                    errors.append(f"{label}: Invalid price format - {str(e)}")
 
         except FileNotFoundError:
             errors.append(f"File not found: {filepath}")
         except json.JSONDecodeError as e:
             errors.append(f"Invalid JSON format: {str(e)}")
+        except ValueError as e:
+            errors.append(str(e))
         except Exception as e:
             errors.append(f"Validation failed: {str(e)}")
 
@@ -451,7 +547,7 @@ def export_products_json(
 
 def import_products_csv(
     filepath: str, db_path: Optional[str] = None, update_existing: bool = False
-) -> Tuple[int, List[str]]:
+) -> Tuple[int, List[str], List[str]]:
     """Import products from CSV."""
     importer = ProductImportExporter(db_path)
     return importer.import_from_csv(filepath, update_existing)
@@ -459,7 +555,7 @@ def import_products_csv(
 
 def import_products_json(
     filepath: str, db_path: Optional[str] = None, update_existing: bool = False
-) -> Tuple[int, List[str]]:
+) -> Tuple[int, List[str], List[str]]:
     """Import products from JSON."""
     importer = ProductImportExporter(db_path)
     return importer.import_from_json(filepath, update_existing)
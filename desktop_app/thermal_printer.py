@@ -1,9 +1,25 @@
+import itertools
 import os
 from datetime import datetime
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Iterable, Iterator, Mapping, NamedTuple, Union
 
 RECEIPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "receipts")
 
+# Code page ESC/POS printers use by default; receipts are encoded once into it
+RECEIPT_ENCODING = "cp437"
+
+# ESC/POS writes are flushed in chunks this size so small printer input
+# buffers (common on serial devices) are not overrun
+PRINT_CHUNK_SIZE = 320
+
+
+class PrintableItem(NamedTuple):
+    """One receipt line item."""
+
+    product_name: str
+    quantity: int
+    unit_price: float
+
 try:
     # Optional dependency: python-escpos
     from escpos.printer import Usb, Network, Serial  # type: ignore
@@ -98,6 +114,15 @@ class ThermalPrinter:
         # Ensure receipts dir exists
         os.makedirs(RECEIPTS_DIR, exist_ok=True)
 
+    def close(self) -> None:
+        """Release the ESC/POS device connection, if one was opened."""
+        if self.printer is not None:
+            try:
+                self.printer.close()
+            except Exception:
+                pass
+            self.printer = None
+
     def print_text(self, text: str) -> dict:
         """Attempt to print text using system printer first, then fall back to other methods.
 
@@ -107,6 +132,73 @@ class ThermalPrinter:
           3. Fallback -> save to file
         """
         # 1) Try system default printer first (only if QApplication exists)
+        result = self._print_system(text)
+        if result:
+            return result
+
+        # 2) ESC/POS via python-escpos
+        if self.printer:
+            try:
+                self.printer.text(text)
+                try:
+                    self.printer.cut()
+                except Exception:
+                    pass
+                return {"status": "printed", "device": "escpos", "path": None}
+            except Exception:
+                pass
+
+        # 3) Fallback: save to file
+        return self._save_text(text)
+
+    def print_lines(self, lines: Iterable[str], encoding: str = RECEIPT_ENCODING) -> dict:
+        """Print receipt lines with the same priority as `print_text`.
+
+        `lines` is consumed once. It is only joined into a single string for
+        the system printer or the file fallback; an ESC/POS device is fed the
+        lines as they are encoded, through a buffer flushed every
+        PRINT_CHUNK_SIZE bytes.
+        """
+        if self._system_printer_available():
+            return self.print_text("\n".join(lines))
+
+        lines = iter(lines)
+        if self.printer:
+            # A generator cannot be replayed, so keep what was sent in case
+            # the device fails and the receipt has to be saved instead
+            sent = []
+            try:
+                buffer = bytearray()
+                for line in lines:
+                    sent.append(line)
+                    buffer += line.encode(encoding, errors="replace") + b"\n"
+                    while len(buffer) >= PRINT_CHUNK_SIZE:
+                        self.printer._raw(bytes(buffer[:PRINT_CHUNK_SIZE]))
+                        del buffer[:PRINT_CHUNK_SIZE]
+                if buffer:
+                    self.printer._raw(bytes(buffer))
+                try:
+                    self.printer.cut()
+                except Exception:
+                    pass
+                return {"status": "printed", "device": "escpos", "path": None}
+            except Exception:
+                lines = itertools.chain(sent, lines)
+
+        return self._save_text("\n".join(lines))
+
+    @staticmethod
+    def _system_printer_available() -> bool:
+        """True when a QApplication is running and Qt can see a printer."""
+        try:
+            from PyQt5.QtWidgets import QApplication  # type: ignore
+            from PyQt5.QtPrintSupport import QPrinterInfo  # type: ignore
+        except Exception:
+            return False
+        return QApplication.instance() is not None and bool(QPrinterInfo.availablePrinters())
+
+    def _print_system(self, text: str) -> Optional[dict]:
+        """Print through the system default printer, or return None if unavailable."""
         try:
             from PyQt5.QtWidgets import QApplication  # type: ignore
             from PyQt5.QtPrintSupport import QPrinter, QPrinterInfo  # type: ignore
@@ -134,20 +226,10 @@ class ThermalPrinter:
                     return {"status": "printed", "device": "system_default", "path": None}
         except Exception:
             pass  # Fall through to next option
+        return None
 
-        # 2) ESC/POS via python-escpos
-        if self.printer:
-            try:
-                self.printer.text(text)
-                try:
-                    self.printer.cut()
-                except Exception:
-                    pass
-                return {"status": "printed", "device": "escpos", "path": None}
-            except Exception:
-                pass
-
-        # 3) Fallback: save to file
+    def _save_text(self, text: str) -> dict:
+        """Save the receipt under `receipts/` when no printer took it."""
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"receipt_{ts}.txt"
         path = os.path.abspath(os.path.join(RECEIPTS_DIR, filename))
@@ -157,10 +239,10 @@ class ThermalPrinter:
         return {"status": "saved", "device": "file", "path": path}
 
 
-def format_receipt(receipt_number: str, items: List[Dict], subtotal: float, tax: float, total: float,
-                   payment_method: str, amount_paid: float, change: float, store: Optional[dict] = None,
-                   cashier: Optional[str] = None, staff_id: Optional[str] = None) -> str:
-    """Return a professional thermal receipt formatted for 80mm thermal printer.
+def format_receipt_lines(receipt_number: str, items: List[PrintableItem], subtotal: float, tax: float, total: float,
+                         payment_method: str, amount_paid: float, change: float, store: Optional[dict] = None,
+                         cashier: Optional[str] = None, staff_id: Optional[str] = None) -> Iterator[str]:
+    """Yield the lines of a professional thermal receipt for an 80mm thermal printer.
     
     Matches standard POS receipt format with centered headers, itemized list,
     and transaction summary.
@@ -172,43 +254,39 @@ def format_receipt(receipt_number: str, items: List[Dict], subtotal: float, tax:
         """Center text within given width."""
         return text.center(width).rstrip()
     
-    lines = []
-    
     # Header
-    lines.append(" " * WIDTH)  # blank line
+    yield " " * WIDTH  # blank line
     store_name = store.get("name") if store else "PHARMAPOS"
-    lines.append(center(store_name.upper(), WIDTH))
+    yield center(store_name.upper(), WIDTH)
     
     if store:
         addr = store.get("address", "").strip()
         phone = store.get("phone", "").strip()
         if addr:
-            lines.append(center(addr, WIDTH))
+            yield center(addr, WIDTH)
         if phone:
-            lines.append(center(f"Phone: {phone}", WIDTH))
+            yield center(f"Phone: {phone}", WIDTH)
     
-    lines.append("-" * WIDTH)
+    yield "-" * WIDTH
     
     # Receipt info
     timestamp = datetime.now().strftime("%d/%m/%y %H:%M")
-    lines.append(f"Receipt: {receipt_number}")
-    lines.append(f"Date/Time: {timestamp}")
+    yield f"Receipt: {receipt_number}"
+    yield f"Date/Time: {timestamp}"
     if staff_id:
-        lines.append(f"Staff ID: {staff_id}")
+        yield f"Staff ID: {staff_id}"
     if cashier:
-        lines.append(f"Cashier: {cashier}")
-    lines.append("-" * WIDTH)
+        yield f"Cashier: {cashier}"
+    yield "-" * WIDTH
     
     # Items header
-    lines.append(f"{'Description':<25} {'Amount':>12}")
-    lines.append("-" * WIDTH)
+    yield f"{'Description':<25} {'Amount':>12}"
+    yield "-" * WIDTH
     
     # Items
     for it in items:
-        name = it.get("product_name") or it.get("name") or "Item"
-        qty = it.get("quantity", it.get("qty", 1))
-        price = float(it.get("unit_price", it.get("price", 0.0)))
-        line_total = qty * price
+        name = it.product_name or "Item"
+        line_total = it.quantity * it.unit_price
         
         # Truncate long names
         if len(name) > 25:
@@ -216,31 +294,48 @@ def format_receipt(receipt_number: str, items: List[Dict], subtotal: float, tax:
         
         # Item line
         amount_str = f"{line_total:.2f}"
-        line = f"{name:<25} {amount_str:>12}"
-        lines.append(line)
+        yield f"{name:<25} {amount_str:>12}"
     
     # Subtotals section
-    lines.append("-" * WIDTH)
-    lines.append(f"{'Subtotal:':<26} {subtotal:>11.2f}")
+    yield "-" * WIDTH
+    yield f"{'Subtotal:':<26} {subtotal:>11.2f}"
     if tax > 0:
-        lines.append(f"{'Tax (VAT):':<26} {tax:>11.2f}")
-    lines.append("=" * WIDTH)
-    lines.append(f"{'TOTAL:':<26} {total:>11.2f}")
-    lines.append("=" * WIDTH)
+        yield f"{'Tax (VAT):':<26} {tax:>11.2f}"
+    yield "=" * WIDTH
+    yield f"{'TOTAL:':<26} {total:>11.2f}"
+    yield "=" * WIDTH
     
     # Payment section
-    lines.append("")
-    lines.append(f"{'Payment Method:':<26} {payment_method.upper():<11}")
-    lines.append(f"{'Amount Paid:':<26} {amount_paid:>11.2f}")
+    yield ""
+    yield f"{'Payment Method:':<26} {payment_method.upper():<11}"
+    yield f"{'Amount Paid:':<26} {amount_paid:>11.2f}"
     if change > 0.01:
-        lines.append(f"{'Change:':<26} {change:>11.2f}")
-    lines.append("-" * WIDTH)
+        yield f"{'Change:':<26} {change:>11.2f}"
+    yield "-" * WIDTH
     
     # Footer
-    lines.append("")
-    lines.append(center("Thank You for Your Purchase!", WIDTH))
-    lines.append(center("Please Visit Again", WIDTH))
-    lines.append("-" * WIDTH)
-    lines.append("")
-    
-    return "\n".join(lines)
+    yield ""
+    yield center("Thank You for Your Purchase!", WIDTH)
+    yield center("Please Visit Again", WIDTH)
+    yield "-" * WIDTH
+    yield ""
+
+
+def format_receipt(receipt_number: str, items: Iterable[Union[PrintableItem, Mapping]], subtotal: float,
+                   tax: float, total: float, payment_method: str, amount_paid: float, change: float,
+                   store: Optional[dict] = None, cashier: Optional[str] = None,
+                   staff_id: Optional[str] = None) -> str:
+    """Return the receipt from `format_receipt_lines` as a single string.
+
+    Kept for existing callers, which may still pass items as dicts with
+    product_name/quantity/unit_price keys.
+    """
+    printable_items = [
+        PrintableItem(it.get("product_name"), it["quantity"], it["unit_price"])
+        if isinstance(it, Mapping) else it
+        for it in items
+    ]
+    return "\n".join(format_receipt_lines(
+        receipt_number, printable_items, subtotal, tax, total, payment_method,
+        amount_paid, change, store=store, cashier=cashier, staff_id=staff_id,
+    ))
@@ -4,8 +4,15 @@ PharmaPOS NG - Desktop Application (PyQt5)
 Main entry point for the pharmacy billing and inventory desktop application.
 """
 
+import os
 import sys
-from decimal import Decimal
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import partial
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+from typing import Optional
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -34,29 +41,206 @@ from PyQt5.QtWidgets import (
     QStackedWidget,
     QListWidget,
     QListWidgetItem,
+    QListView,
+    QStyledItemDelegate,
+    QStyle,
+    QProgressDialog,
+    QHeaderView,
+    QTableView,
+    QStyleOptionButton,
+    QStatusBar,
+    QFormLayout,
+    QSplashScreen,
+    QCompleter,
 )
-from PyQt5.QtCore import Qt, QDate
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtCore import (
+    Qt,
+    QDate,
+    QEventLoop,
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    pyqtSignal,
+    QAbstractListModel,
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QMutex,
+    QStringListModel,
+    QSize,
+    QRect,
+    QTimer,
+)
+from PyQt5.QtGui import QIcon, QFont, QColor, QPen, QPainter, QPixmap, QPixmapCache
 from PyQt5.QtPrintSupport import QPrinterInfo
+from sqlalchemy import select
 
 from desktop_app.auth import AuthenticationService, UserSession
+from desktop_app.database import users
 from desktop_app.models import (
     StoreService,
     UserService,
     ProductService,
     InventoryService,
+    RefDataCache,
     SalesService,
     PurchaseOrderService,
     SupplierService,
     get_session,
 )
+from desktop_app import _catalog_cache
 from desktop_app.sales import SalesTransaction
 from desktop_app.printer import ThermalPrinter, PrinterType, ReceiptGenerator
 from desktop_app.inventory import BatchManager, InventoryAlerts
 from desktop_app.reports import SalesReporter, InventoryReporter
 from desktop_app.product_manager import ProductImportExporter
+from desktop_app.backup_manager import BackupManager
+from desktop_app.export_manager import ExportManager
 from desktop_app.config import load_printer_config, save_printer_config
 from desktop_app.purchase_order_ui import PurchaseOrderUI
+from desktop_app.logger import get_logger
+
+logger = get_logger(__name__)
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), "styles.qss")
+
+# Quiet period after the last report date change before reports refresh
+REPORT_REFRESH_DELAY_MS = 300
+
+# Typing pause before the sales product grid is re-filtered
+PRODUCT_SEARCH_DELAY_MS = 150
+
+# Product cards the sales grid lays out per event-loop pass
+PRODUCT_GRID_BATCH_SIZE = 50
+
+# Seconds the sales catalog stays cached before the next lookup refetches it
+PRODUCTS_CACHE_TTL = 30.0
+
+# Tables behind each admin "Export Type" (None = every table); the date range
+# only narrows "Sales Data"
+DATA_EXPORT_TABLES = {
+    "Sales Data": ["sales", "sale_items"],
+    "Inventory Data": ["products", "product_batches"],
+    "User Data": ["users"],
+    "All Data": None,
+}
+DATA_EXPORT_FORMATS = {"CSV": "csv", "Excel (.xlsx)": "excel", "JSON": "json"}
+
+# Shared fonts; QFont is a value type, so widgets copy these on setFont
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(12)
+_TITLE_FONT.setBold(True)
+_TOTAL_FONT = QFont("Arial", 12, QFont.Bold)
+
+# Latest expiry date a received batch can be given
+_MAX_EXPIRY = QDate(2099, 12, 31)
+
+
+# --- Money Helpers -------------------------------------------------------------
+CENTS = Decimal("0.01")
+ZERO_MONEY = Decimal("0.00")
+
+
+def _money(value: float) -> Decimal:
+    """Convert a spin box value to a Decimal rounded to cents."""
+    if not value:
+        return ZERO_MONEY
+    return Decimal(value).quantize(CENTS, ROUND_HALF_UP)
+
+
+# Input limits shared by every money/quantity spin box
+MONEY_MAX = 999999.99
+QTY_MAX = 100000
+
+
+def _money_spin() -> QDoubleSpinBox:
+    """Spin box for a naira amount: 0 to MONEY_MAX with two decimals."""
+    spin = QDoubleSpinBox()
+    spin.setDecimals(2)
+    spin.setRange(0, MONEY_MAX)
+    return spin
+
+
+def _qty_spin(value: int = 1, minimum: int = 1, maximum: int = QTY_MAX) -> QSpinBox:
+    """Spin box for a unit quantity, starting at `value`."""
+    spin = QSpinBox()
+    spin.setRange(minimum, maximum)
+    spin.setValue(value)
+    return spin
+
+
+@contextmanager
+def suspended_table_updates(table: QTableView):
+    """Suspend repaints, signals, sorting and header auto-resize while refilling a table."""
+    header = table.horizontalHeader()
+    resize_modes = [header.sectionResizeMode(i) for i in range(header.count())]
+    sorting = table.isSortingEnabled()
+
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    table.setSortingEnabled(False)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    try:
+        yield table
+    finally:
+        for i, mode in enumerate(resize_modes):
+            header.setSectionResizeMode(i, mode)
+        table.setSortingEnabled(sorting)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+
+def _contains_completer(choices: list, parent=None) -> QCompleter:
+    """Case-insensitive completer matching `choices` anywhere in the typed text."""
+    completer = QCompleter(parent)
+    completer.setModel(QStringListModel(choices, completer))
+    completer.setCaseSensitivity(Qt.CaseInsensitive)
+    completer.setFilterMode(Qt.MatchContains)
+    return completer
+
+
+class CurrencyDelegate(QStyledItemDelegate):
+    """Show a numeric cell as naira; the text is only built for painted cells."""
+
+    def displayText(self, value, locale) -> str:
+        return f"₦{float(value):.2f}"
+
+
+class LazyComboBox(QComboBox):
+    """Combo box that is filled the first time its popup opens.
+
+    Until then it holds only `placeholder`. `loader()` returns (text, id)
+    pairs; the texts go in with one addItems call and the ids are kept in a
+    parallel list, read back with `current_id()`.
+    """
+
+    def __init__(self, loader, placeholder: str = "Select...", parent=None):
+        super().__init__(parent)
+        self._loader = loader
+        self._loaded = False
+        self._ids = [None]
+        self.addItem(placeholder)
+
+    def showPopup(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            choices = self._loader()
+            # No currentIndexChanged or repaint while the list fills
+            self.setUpdatesEnabled(False)
+            self.blockSignals(True)
+            try:
+                self.addItems([text for text, _ in choices])
+            finally:
+                self.blockSignals(False)
+                self.setUpdatesEnabled(True)
+            self._ids.extend(item_id for _, item_id in choices)
+        super().showPopup()
+
+    def current_id(self):
+        """Id of the selected entry, or None while the placeholder is selected."""
+        index = self.currentIndex()
+        return self._ids[index] if 0 <= index < len(self._ids) else None
 
 
 class PrinterSettingsDialog(QDialog):
@@ -329,8 +513,7 @@ class PrinterSettingsDialog(QDialog):
             if not names:
                 self.system_printer_combo.addItem("(No system printers found)")
             else:
-                for n in names:
-                    self.system_printer_combo.addItem(n)
+                self.system_printer_combo.addItems(names)
         except Exception:
             # In case Qt printing support is unavailable
             self.system_printer_combo.clear()
@@ -344,7 +527,7 @@ class StockReceivingDialog(QDialog):
     def __init__(self, session, parent=None):
         super().__init__(parent)
         self.session = session
-        self.product_service = ProductService(session)
+        self._store_ids = []  # parallel to store_combo's entries
         self.result_data = None
         self.setup_ui()
 
@@ -358,122 +541,89 @@ class StockReceivingDialog(QDialog):
         # Create scroll area for long form
         scroll = QScrollArea()
         scroll_widget = QWidget()
-        layout = QVBoxLayout(scroll_widget)
+        form = QFormLayout(scroll_widget)
 
         # --- Product Section ---
-        layout.addWidget(QLabel("<b>Product Information</b>"))
-        layout.addWidget(self._create_separator())
-
-        layout.addWidget(QLabel("Product:"))
-        self.product_combo = QComboBox()
+        form.addRow(QLabel("<b>Product Information</b>"))
+        form.addRow(self._create_separator())
+
+        # Products are only listed once the list is opened; the catalog is
+        # fetched in the background meanwhile so opening it reads the cache
+        self.product_combo = LazyComboBox(self.load_products, "Select a product...")
+        run_query(
+            partial(_catalog_cache.cached_products, self.session.get_bind()),
+            lambda _: None,
+            lambda error: logger.warning(f"Product catalog prefetch failed: {error}"),
+        )
         self.product_combo.currentIndexChanged.connect(self._on_product_changed)
-        self.load_products()
-        layout.addWidget(self.product_combo)
+        form.addRow("Product:", self.product_combo)
 
         # --- Batch Details Section ---
-        layout.addWidget(QLabel("<b>Batch Details</b>"))
-        layout.addWidget(self._create_separator())
+        form.addRow(QLabel("<b>Batch Details</b>"))
+        form.addRow(self._create_separator())
 
-        layout.addWidget(QLabel("Batch Number:"))
         self.batch_number_input = QLineEdit()
         self.batch_number_input.setPlaceholderText("e.g., BATCH-001, LOT-2025-001")
-        layout.addWidget(self.batch_number_input)
+        form.addRow("Batch Number:", self.batch_number_input)
 
-        layout.addWidget(QLabel("Quantity (units):"))
-        self.quantity_input = QSpinBox()
-        self.quantity_input.setRange(1, 100000)
-        self.quantity_input.setValue(1)
-        layout.addWidget(self.quantity_input)
+        self.quantity_input = _qty_spin()
+        form.addRow("Quantity (units):", self.quantity_input)
 
-        layout.addWidget(QLabel("Expiry Date:"))
         self.expiry_date_input = QDateEdit()
         self.expiry_date_input.setCalendarPopup(True)
-        self.expiry_date_input.setDate(QDate.currentDate())
-        self.expiry_date_input.setDateRange(QDate.currentDate(), QDate(2099, 12, 31))
-        layout.addWidget(self.expiry_date_input)
+        today = QDate.currentDate()
+        self.expiry_date_input.setDate(today)
+        self.expiry_date_input.setDateRange(today, _MAX_EXPIRY)
+        form.addRow("Expiry Date:", self.expiry_date_input)
 
         # --- Cost & Pricing Section ---
-        layout.addWidget(QLabel("<b>Cost & Pricing</b>"))
-        layout.addWidget(self._create_separator())
-
-        layout.addWidget(QLabel("Cost Price (per unit, ₦):"))
-        self.cost_price_input = QDoubleSpinBox()
-        self.cost_price_input.setRange(0, 999999.99)
-        self.cost_price_input.setDecimals(2)
-        self.cost_price_input.setValue(0)
-        layout.addWidget(self.cost_price_input)
-
-        layout.addWidget(QLabel("Retail Price (per unit, ₦):"))
-        self.retail_price_input = QDoubleSpinBox()
-        self.retail_price_input.setRange(0, 999999.99)
-        self.retail_price_input.setDecimals(2)
-        self.retail_price_input.setValue(0)
-        layout.addWidget(self.retail_price_input)
-
-        # Bulk pricing layout
+        form.addRow(QLabel("<b>Cost & Pricing</b>"))
+        form.addRow(self._create_separator())
+
+        self.cost_price_input = _money_spin()
+        form.addRow("Cost Price (per unit, ₦):", self.cost_price_input)
+
+        self.retail_price_input = _money_spin()
+        form.addRow("Retail Price (per unit, ₦):", self.retail_price_input)
+
+        # Bulk pricing: price and its minimum quantity share a row
         bulk_layout = QHBoxLayout()
-        bulk_layout.addWidget(QLabel("Bulk Price (₦):"))
-        self.bulk_price_input = QDoubleSpinBox()
-        self.bulk_price_input.setRange(0, 999999.99)
-        self.bulk_price_input.setDecimals(2)
+        self.bulk_price_input = _money_spin()
         bulk_layout.addWidget(self.bulk_price_input)
-
         bulk_layout.addWidget(QLabel("Min Qty:"))
-        self.bulk_quantity_input = QSpinBox()
-        self.bulk_quantity_input.setRange(1, 100000)
-        self.bulk_quantity_input.setValue(10)
+        self.bulk_quantity_input = _qty_spin(10)
         bulk_layout.addWidget(self.bulk_quantity_input)
-        layout.addLayout(bulk_layout)
+        form.addRow("Bulk Price (₦):", bulk_layout)
 
-        # Wholesale pricing layout
+        # Wholesale pricing, laid out like bulk
         wholesale_layout = QHBoxLayout()
-        wholesale_layout.addWidget(QLabel("Wholesale Price (₦):"))
-        self.wholesale_price_input = QDoubleSpinBox()
-        self.wholesale_price_input.setRange(0, 999999.99)
-        self.wholesale_price_input.setDecimals(2)
+        self.wholesale_price_input = _money_spin()
         wholesale_layout.addWidget(self.wholesale_price_input)
-
         wholesale_layout.addWidget(QLabel("Min Qty:"))
-        self.wholesale_quantity_input = QSpinBox()
-        self.wholesale_quantity_input.setRange(1, 100000)
-        self.wholesale_quantity_input.setValue(50)
+        self.wholesale_quantity_input = _qty_spin(50)
         wholesale_layout.addWidget(self.wholesale_quantity_input)
-        layout.addLayout(wholesale_layout)
+        form.addRow("Wholesale Price (₦):", wholesale_layout)
 
         # --- Stock Alerts Section ---
-        layout.addWidget(QLabel("<b>Stock Alerts</b>"))
-        layout.addWidget(self._create_separator())
-
-        alert_layout = QHBoxLayout()
-        alert_layout.addWidget(QLabel("Min Stock Alert:"))
-        self.min_stock_input = QSpinBox()
-        self.min_stock_input.setRange(0, 100000)
-        self.min_stock_input.setValue(10)
-        alert_layout.addWidget(self.min_stock_input)
-
-        alert_layout.addWidget(QLabel("Max Stock Alert:"))
-        self.max_stock_input = QSpinBox()
-        self.max_stock_input.setRange(1, 1000000)
-        self.max_stock_input.setValue(500)
-        alert_layout.addWidget(self.max_stock_input)
-
-        alert_layout.addWidget(QLabel("Reorder Level:"))
-        self.reorder_level_input = QSpinBox()
-        self.reorder_level_input.setRange(0, 100000)
-        self.reorder_level_input.setValue(50)
-        alert_layout.addWidget(self.reorder_level_input)
-        layout.addLayout(alert_layout)
+        form.addRow(QLabel("<b>Stock Alerts</b>"))
+        form.addRow(self._create_separator())
+
+        self.min_stock_input = _qty_spin(10, minimum=0)
+        form.addRow("Min Stock Alert:", self.min_stock_input)
+
+        self.max_stock_input = _qty_spin(500, maximum=1000000)
+        form.addRow("Max Stock Alert:", self.max_stock_input)
+
+        self.reorder_level_input = _qty_spin(50, minimum=0)
+        form.addRow("Reorder Level:", self.reorder_level_input)
 
         # --- Store Section ---
-        layout.addWidget(QLabel("<b>Store & Location</b>"))
-        layout.addWidget(self._create_separator())
+        form.addRow(QLabel("<b>Store & Location</b>"))
+        form.addRow(self._create_separator())
 
-        layout.addWidget(QLabel("Store:"))
         self.store_combo = QComboBox()
         self.load_stores()
-        layout.addWidget(self.store_combo)
-
-        layout.addStretch()
+        form.addRow("Store:", self.store_combo)
 
         scroll.setWidget(scroll_widget)
         scroll.setWidgetResizable(True)
@@ -506,32 +656,40 @@ class StockReceivingDialog(QDialog):
         # This can be used to pre-fill pricing from product master data
         pass
 
-    def load_products(self) -> None:
-        """Load products into combo box."""
+    def load_products(self) -> list:
+        """Return (label, id) choices for the product combo box."""
         try:
-            products = self.product_service.get_all_products()
-            self.product_combo.clear()
-            for prod in products:
-                self.product_combo.addItem(
-                    f"{prod['name']} ({prod['sku']})", prod["id"]
-                )
+            products = _catalog_cache.cached_products(self.session.get_bind())
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load products: {str(e)}")
+            return []
+        return [(f"{prod['name']} ({prod['sku']})", prod["id"]) for prod in products]
 
     def load_stores(self) -> None:
-        """Load stores into combo box."""
-        try:
-            store_service = StoreService(self.session)
-            stores = store_service.get_all_stores()
-            self.store_combo.clear()
-            for store in stores:
-                self.store_combo.addItem(store["name"], store["id"])
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load stores: {str(e)}")
+        """Load stores into the combo box in the background."""
+        run_query(
+            partial(_catalog_cache.cached_stores, self.session.get_bind()),
+            self._on_stores_loaded,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to load stores: {error}"),
+        )
+
+    def _on_stores_loaded(self, stores: tuple) -> None:
+        # Names go in with one addItems call; ids are kept in a parallel list
+        self._store_ids = [store["id"] for store in stores]
+        self.store_combo.clear()
+        self.store_combo.addItems([store["name"] for store in stores])
 
     def accept_receive(self) -> None:
         """Validate and accept receiving stock."""
         # Validation
+        if self.product_combo.current_id() is None:
+            QMessageBox.warning(self, "Validation", "Please select a product")
+            return
+
+        if self.store_combo.currentIndex() < 0:
+            QMessageBox.warning(self, "Validation", "Please select a store")
+            return
+
         if not self.batch_number_input.text().strip():
             QMessageBox.warning(self, "Validation", "Please enter a batch number")
             return
@@ -557,21 +715,23 @@ class StockReceivingDialog(QDialog):
             return
 
         # Store the result data
+        bulk_price = self.bulk_price_input.value()
+        wholesale_price = self.wholesale_price_input.value()
         self.result_data = {
-            "product_id": self.product_combo.currentData(),
+            "product_id": self.product_combo.current_id(),
             "batch_number": self.batch_number_input.text().strip(),
             "quantity": self.quantity_input.value(),
-            "cost_price": Decimal(str(self.cost_price_input.value())),
-            "retail_price": Decimal(str(self.retail_price_input.value())),
-            "bulk_price": Decimal(str(self.bulk_price_input.value())) if self.bulk_price_input.value() > 0 else None,
-            "bulk_quantity": self.bulk_quantity_input.value() if self.bulk_price_input.value() > 0 else None,
-            "wholesale_price": Decimal(str(self.wholesale_price_input.value())) if self.wholesale_price_input.value() > 0 else None,
-            "wholesale_quantity": self.wholesale_quantity_input.value() if self.wholesale_price_input.value() > 0 else None,
+            "cost_price": _money(self.cost_price_input.value()),
+            "retail_price": _money(self.retail_price_input.value()),
+            "bulk_price": _money(bulk_price) if bulk_price > 0 else None,
+            "bulk_quantity": self.bulk_quantity_input.value() if bulk_price > 0 else None,
+            "wholesale_price": _money(wholesale_price) if wholesale_price > 0 else None,
+            "wholesale_quantity": self.wholesale_quantity_input.value() if wholesale_price > 0 else None,
             "min_stock": self.min_stock_input.value(),
             "max_stock": self.max_stock_input.value(),
             "reorder_level": self.reorder_level_input.value(),
             "expiry_date": self.expiry_date_input.date().toPyDate(),
-            "store_id": self.store_combo.currentData(),
+            "store_id": self._store_ids[self.store_combo.currentIndex()],
         }
         self.accept()
 
@@ -580,11 +740,12 @@ class StockReceivingDialog(QDialog):
 class SalesCartDialog(QDialog):
     """Dialog to manage sales cart with FEFO allocation."""
 
+    REMOVE_COLUMN = 5
+
     def __init__(self, session, parent=None):
         super().__init__(parent)
         self.session = session
         self.inv_service = InventoryService(session)
-        self.product_service = ProductService(session)
         self.store_service = StoreService(session)
         self.cart_items = []  # List of {product_id, quantity, unit_price, batches: [{batch_id, qty}, ...]}
         self.setWindowTitle("Sales Cart (FEFO)")
@@ -598,20 +759,24 @@ class SalesCartDialog(QDialog):
         # Product selection section
         select_layout = QHBoxLayout()
         select_layout.addWidget(QLabel("Product:"))
-        self.product_combo = QComboBox()
-        self._load_products()
-        select_layout.addWidget(self.product_combo)
+        # Type to search; the completer filters the catalog in one string model
+        self.product_input = QLineEdit()
+        self.product_input.setPlaceholderText("Type a product name or SKU...")
+        self._products_by_label = {}  # completer label -> catalog product dict
+        self.product_input.setCompleter(_contains_completer([], self))
+        run_query(
+            partial(_catalog_cache.cached_products, self.session.get_bind()),
+            self._on_products_loaded,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to load products: {error}"),
+        )
+        select_layout.addWidget(self.product_input)
 
         select_layout.addWidget(QLabel("Quantity:"))
-        self.qty_input = QSpinBox()
-        self.qty_input.setMinimum(1)
-        self.qty_input.setValue(1)
+        self.qty_input = _qty_spin()
         select_layout.addWidget(self.qty_input)
 
         select_layout.addWidget(QLabel("Unit Price:"))
-        self.unit_price_input = QDoubleSpinBox()
-        self.unit_price_input.setMinimum(0)
-        self.unit_price_input.setValue(0)
+        self.unit_price_input = _money_spin()
         select_layout.addWidget(self.unit_price_input)
 
         add_btn = QPushButton("Add to Cart")
@@ -626,6 +791,12 @@ class SalesCartDialog(QDialog):
         self.cart_table.setHorizontalHeaderLabels(
             ["Product", "Qty", "Unit Price", "Subtotal", "Batches (FEFO)", "Remove"]
         )
+        # One handler for the whole "Remove" column instead of a button per row
+        self.cart_table.cellClicked.connect(self._on_cart_cell_clicked)
+        # Prices are stored as numbers and formatted when painted
+        currency_delegate = CurrencyDelegate(self.cart_table)
+        self.cart_table.setItemDelegateForColumn(2, currency_delegate)
+        self.cart_table.setItemDelegateForColumn(3, currency_delegate)
         layout.addWidget(self.cart_table)
 
         # Total section
@@ -633,7 +804,7 @@ class SalesCartDialog(QDialog):
         total_layout.addStretch()
         total_layout.addWidget(QLabel("Cart Total:"))
         self.total_label = QLabel("₦0.00")
-        self.total_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.total_label.setFont(_TOTAL_FONT)
         total_layout.addWidget(self.total_label)
         layout.addLayout(total_layout)
 
@@ -654,25 +825,33 @@ class SalesCartDialog(QDialog):
 
         self.setLayout(layout)
 
-    def _load_products(self):
-        """Load products into combo box."""
-        try:
-            products = self.product_service.list_products()
-            for product in products:
-                self.product_combo.addItem(
-                    f"{product['name']} ({product['sku']})",
-                    product["id"],
-                )
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load products: {str(e)}")
+    @property
+    def primary_store(self) -> Optional[dict]:
+        """The primary store, queried on the first add and reused once found."""
+        store = self.__dict__.get("primary_store")
+        if store is None:
+            store = self.store_service.get_primary_store()
+            if store is not None:
+                self.__dict__["primary_store"] = store
+        return store
+
+    def _on_products_loaded(self, products: tuple) -> None:
+        """Fill the product completer, remembering each label's product."""
+        self._products_by_label = {f"{product['name']} ({product['sku']})": product for product in products}
+        self.product_input.completer().model().setStringList(list(self._products_by_label))
 
     def _add_item_to_cart(self):
         """Add product to cart using FEFO allocation."""
         try:
-            product_id = self.product_combo.currentData()
+            product = self._products_by_label.get(self.product_input.text().strip())
             qty = self.qty_input.value()
             unit_price = self.unit_price_input.value()
 
+            if product is None:
+                QMessageBox.warning(self, "Validation", "Please pick a product from the suggestions")
+                return
+            product_id = product["id"]
+
             if qty <= 0:
                 QMessageBox.warning(self, "Validation", "Quantity must be > 0")
                 return
@@ -682,7 +861,7 @@ class SalesCartDialog(QDialog):
                 return
 
             # Get primary store
-            store = self.store_service.get_primary_store()
+            store = self.primary_store
             if not store:
                 QMessageBox.warning(self, "Error", "No primary store configured")
                 return
@@ -702,14 +881,18 @@ class SalesCartDialog(QDialog):
                 )
                 return
 
-            # Add to cart
-            product = self.product_service.get_product(product_id)
+            # Add to cart; the row's subtotal and batch text are built once here
+            subtotal = _money(unit_price) * qty
             cart_item = {
                 "product_id": product_id,
                 "product_name": product["name"],
                 "quantity": qty,
                 "unit_price": unit_price,
                 "batches": allocated_batches,  # [{batch_id, quantity}, ...]
+                "subtotal": subtotal,
+                "batch_info": ", ".join(
+                    f"B{b['batch_id']}:{b['quantity']}" for b in allocated_batches
+                ),
             }
             self.cart_items.append(cart_item)
 
@@ -722,39 +905,41 @@ class SalesCartDialog(QDialog):
 
     def _refresh_cart_table(self):
         """Refresh cart table display."""
-        self.cart_table.setRowCount(len(self.cart_items))
-        total = 0
-
-        for i, item in enumerate(self.cart_items):
-            subtotal = item["quantity"] * item["unit_price"]
-            total += subtotal
-
-            # Product name
-            self.cart_table.setItem(i, 0, QTableWidgetItem(item["product_name"]))
-
-            # Quantity
-            self.cart_table.setItem(i, 1, QTableWidgetItem(str(item["quantity"])))
-
-            # Unit price
-            self.cart_table.setItem(i, 2, QTableWidgetItem(f"₦{item['unit_price']:.2f}"))
-
-            # Subtotal
-            self.cart_table.setItem(i, 3, QTableWidgetItem(f"₦{subtotal:.2f}"))
-
-            # Batches (FEFO allocation details)
-            batch_info = ", ".join(
-                [f"B{b['batch_id']}:{b['quantity']}" for b in item["batches"]]
-            )
-            self.cart_table.setItem(i, 4, QTableWidgetItem(batch_info))
-
-            # Remove button
-            remove_btn = QPushButton("Remove")
-            remove_btn.clicked.connect(lambda checked, idx=i: self._remove_item(idx))
-            self.cart_table.setCellWidget(i, 5, remove_btn)
+        table = self.cart_table
+        with suspended_table_updates(table):
+            old_rows = table.rowCount()
+            table.setRowCount(len(self.cart_items))
+
+            # Only rows added since the last refresh get new items; existing
+            # rows keep theirs and are just handed their (possibly shifted) values
+            for i in range(old_rows, len(self.cart_items)):
+                for column in range(self.REMOVE_COLUMN):
+                    table.setItem(i, column, QTableWidgetItem())
+
+                # Remove marker, handled by _on_cart_cell_clicked
+                remove_item = QTableWidgetItem("✕")
+                remove_item.setTextAlignment(Qt.AlignCenter)
+                remove_item.setFlags(Qt.ItemIsEnabled)
+                remove_item.setToolTip("Remove from cart")
+                table.setItem(i, self.REMOVE_COLUMN, remove_item)
+
+            for i, item in enumerate(self.cart_items):
+                table.item(i, 0).setText(item["product_name"])
+                table.item(i, 1).setText(str(item["quantity"]))
+                # Unit price and subtotal, formatted by CurrencyDelegate
+                table.item(i, 2).setData(Qt.DisplayRole, float(item["unit_price"]))
+                table.item(i, 3).setData(Qt.DisplayRole, float(item["subtotal"]))
+                # Batches (FEFO allocation details)
+                table.item(i, 4).setText(item["batch_info"])
 
         # Update total
+        total = sum((item["subtotal"] for item in self.cart_items), ZERO_MONEY)
         self.total_label.setText(f"₦{total:.2f}")
 
+    def _on_cart_cell_clicked(self, row: int, column: int) -> None:
+        if column == self.REMOVE_COLUMN:
+            self._remove_item(row)
+
     def _remove_item(self, index):
         """Remove item from cart."""
         if 0 <= index < len(self.cart_items):
@@ -778,6 +963,15 @@ class SalesCartDialog(QDialog):
 
 
 # --- Login Dialog -----------------------------------------------
+# Built once and reused by every login, so SQLAlchemy's compiled cache is
+# always hit
+_USERNAMES_STMT = (
+    select(users.c.username)
+    .where(users.c.is_active.is_(True))
+    .order_by(users.c.username)
+)
+
+
 class LoginDialog(QDialog):
     """User login dialog."""
 
@@ -796,19 +990,17 @@ class LoginDialog(QDialog):
 
         # Title
         title = QLabel("PharmaPOS NG - Pharmacy Management System")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         layout.addSpacing(20)
 
-        # Username (ComboBox)
+        # Username, completed from the active users
         layout.addWidget(QLabel("Username:"))
-        self.username_combo = QComboBox()
-        self.load_usernames()
-        layout.addWidget(self.username_combo)
+        self.username_edit = QLineEdit()
+        self.username_edit.setPlaceholderText("Start typing a username...")
+        self.username_edit.setCompleter(_contains_completer([], self))
+        layout.addWidget(self.username_edit)
 
         # Password
         layout.addWidget(QLabel("Password:"))
@@ -827,37 +1019,49 @@ class LoginDialog(QDialog):
         self.error_label.setStyleSheet("color: red;")
         layout.addWidget(self.error_label)
 
+        self.load_usernames()
+
         self.setLayout(layout)
 
     def load_usernames(self) -> None:
-        """Load available usernames from database."""
+        """Load available usernames from database in the background."""
+        run_query(self._fetch_usernames, self._on_usernames_loaded, self._on_usernames_failed)
+
+    @staticmethod
+    def _fetch_usernames() -> list:
+        """Active usernames, queried on a worker thread."""
+        started = time.perf_counter()
+        session = get_session()
         try:
-            from desktop_app.database import users
-            session = get_session()
-            
-            # Query all active users
-            result = session.query(users.c.username).filter(
-                users.c.is_active == True
-            ).order_by(users.c.username).all()
-            
-            if result:
-                usernames = [row[0] for row in result]
-                self.username_combo.addItems(usernames)
-            else:
-                # Fallback if no users in database
-                self.username_combo.addItems(["admin", "manager1", "cashier1"])
+            result = session.execute(_USERNAMES_STMT).all()
+        finally:
             session.close()
-        except Exception:
-            # Fallback to demo users
-            self.username_combo.addItems(["admin", "manager1", "cashier1"])
+
+        elapsed = time.perf_counter() - started
+        if elapsed > 0.1:
+            logger.warning(f"load_usernames took {elapsed:.3f}s")
+        return [row[0] for row in result]
+
+    def _on_usernames_loaded(self, usernames: list) -> None:
+        # Fallback if no users in database
+        self._set_usernames(usernames or ["admin", "manager1", "cashier1"])
+
+    def _on_usernames_failed(self, error: str) -> None:
+        logger.error(f"load_usernames failed: {error}")
+        self.error_label.setText("Could not load users from database")
+        # Fallback to demo users
+        self._set_usernames(["admin", "manager1", "cashier1"])
+
+    def _set_usernames(self, usernames: list) -> None:
+        self.username_edit.completer().model().setStringList(usernames)
 
     def login(self) -> None:
         """Attempt login."""
-        username = self.username_combo.currentText()
+        username = self.username_edit.text().strip()
         password = self.password_input.text()
 
         if not username or not password:
-            self.error_label.setText("Please select username and enter password")
+            self.error_label.setText("Please enter username and password")
             return
 
         user_session = self.auth_service.login(username, password)
@@ -868,6 +1072,814 @@ class LoginDialog(QDialog):
             self.error_label.setText("Invalid username or password")
 
 
+# --- Product Form Spec ---------------------------------------------------------
+# Settings map to Qt setters in order (e.g. "maximum" -> setMaximum)
+# (section title, [(label, key, widget class or factory, settings), ...])
+PRODUCT_FORM_SECTIONS = [
+    ("Product Information", [
+        ("Product Name:", "name", QLineEdit, {}),
+        ("Generic Name (Optional):", "generic", QLineEdit, {}),
+        ("SKU:", "sku", QLineEdit, {}),
+        ("Barcode (Optional):", "barcode", QLineEdit, {}),
+        ("NAFDAC Number:", "nafdac", QLineEdit, {}),
+    ]),
+    ("Cost & Basic Pricing", [
+        ("Cost Price (₦):", "cost", _money_spin, {}),
+        ("Selling Price (₦):", "selling", _money_spin, {}),
+    ]),
+    ("Pricing Tiers", [
+        ("Retail Price (₦):", "retail", _money_spin, {}),
+        ("Bulk Price (₦) (Optional):", "bulk_price", _money_spin, {}),
+        ("Minimum Quantity for Bulk Price:", "bulk_qty", QSpinBox, {"minimum": 1, "maximum": QTY_MAX, "value": 10}),
+        ("Wholesale Price (₦) (Optional):", "wholesale_price", _money_spin, {}),
+        ("Minimum Quantity for Wholesale Price:", "wholesale_qty", QSpinBox, {"minimum": 1, "maximum": QTY_MAX, "value": 50}),
+    ]),
+    ("Stock Alerts", [
+        ("Minimum Stock Alert:", "min_stock", QSpinBox, {"minimum": 0, "maximum": QTY_MAX, "value": 10}),
+        ("Maximum Stock Alert:", "max_stock", QSpinBox, {"minimum": 1, "maximum": 1000000, "value": 500}),
+        ("Reorder Level (Optional):", "reorder", QSpinBox, {"minimum": 0, "maximum": QTY_MAX}),
+    ]),
+    ("Description", [
+        ("Description (Optional):", "description", QTextEdit, {"maximumHeight": 80}),
+    ]),
+]
+
+
+# --- Product Catalog Model/Delegate -------------------------------------------
+class ProductListModel(QAbstractListModel):
+    """List model over product dicts for the sales catalog view.
+
+    Rows are exposed PAGE_SIZE at a time: the view calls fetchMore() as it
+    is scrolled to the bottom, so only the pages looked at are laid out.
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._products = []
+        self._shown = 0
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._shown
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._shown < len(self._products)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._products) - self._shown)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._shown, self._shown + count - 1)
+        self._shown += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        product = self._products[index.row()]
+        if role == Qt.DisplayRole:
+            return product['name']
+        if role == Qt.UserRole:
+            return product
+        return None
+
+    def set_products(self, products: list) -> None:
+        """Replace the displayed products."""
+        self.beginResetModel()
+        self._products = list(products)
+        self._shown = min(self.PAGE_SIZE, len(self._products))
+        self.endResetModel()
+
+
+class ProductCardDelegate(QStyledItemDelegate):
+    """Paint a product card per row without constructing any widgets."""
+
+    CARD_SIZE = QSize(200, 220)
+
+    # Paint resources shared by every card; only fonts depend on the view
+    BORDER_PEN = QPen(QColor("#e0e0e0"), 2)
+    HOVER_BORDER_PEN = QPen(QColor("#4472C4"), 2)
+    BACKGROUND = QColor("#ffffff")
+    HOVER_BACKGROUND = QColor("#f0f7ff")
+    IMAGE_BACKGROUND = QColor("#e8e8e8")
+    TEXT_COLOR = QColor("#333")
+    STOCK_COLOR = QColor("#666")
+    PRICE_COLOR = QColor("#28a745")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fonts = None
+        self._fonts_key = None
+
+    def _card_fonts(self, base: QFont) -> dict:
+        """Build the card fonts once per view font instead of on every paint."""
+        key = base.key()
+        if key != self._fonts_key:
+            fonts = {}
+            for name, size, bold in (("image", 9, False), ("name", 8, True),
+                                     ("stock", 7, False), ("price", 9, True)):
+                font = QFont(base)
+                font.setPointSize(size)
+                font.setBold(bold)
+                fonts[name] = font
+            self._fonts, self._fonts_key = fonts, key
+        return self._fonts
+
+    def _placeholder(self, size: QSize, font: QFont) -> QPixmap:
+        """Return the shared "No Image" pixmap, rendering it only on a cache miss."""
+        key = f"product-card-placeholder:{size.width()}x{size.height()}:{font.key()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.IMAGE_BACKGROUND)
+            painter.drawRoundedRect(pixmap.rect(), 5, 5)
+            painter.setFont(font)
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, "📦 No Image")
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.CARD_SIZE
+
+    def paint(self, painter, option, index) -> None:
+        product = index.data(Qt.UserRole)
+        if not product:
+            return
+
+        price = float(product.get('retail_price', product.get('selling_price', 0)))
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        fonts = self._card_fonts(option.font)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background
+        card = option.rect.adjusted(4, 4, -4, -4)
+        painter.setPen(self.HOVER_BORDER_PEN if hovered else self.BORDER_PEN)
+        painter.setBrush(self.HOVER_BACKGROUND if hovered else self.BACKGROUND)
+        painter.drawRoundedRect(card, 8, 8)
+
+        inner = card.adjusted(10, 10, -10, -10)
+
+        # Product image placeholder
+        image_rect = QRect(inner.left(), inner.top(), inner.width(), 120)
+        painter.drawPixmap(image_rect.topLeft(), self._placeholder(image_rect.size(), fonts["image"]))
+        painter.setPen(self.TEXT_COLOR)
+
+        # Product name
+        top = image_rect.bottom() + 8
+        painter.setFont(fonts["name"])
+        name_rect = QRect(inner.left(), top, inner.width(), 30)
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, product['name'])
+
+        # Stock info
+        top = name_rect.bottom() + 4
+        painter.setFont(fonts["stock"])
+        painter.setPen(self.STOCK_COLOR)
+        painter.drawText(QRect(inner.left(), top, inner.width(), 14), Qt.AlignLeft | Qt.AlignVCenter,
+                         f"Stock: {product.get('quantity', 0)} units")
+
+        # Price
+        top += 18
+        painter.setFont(fonts["price"])
+        painter.setPen(self.PRICE_COLOR)
+        painter.drawText(QRect(inner.left(), top, inner.width(), 18), Qt.AlignLeft | Qt.AlignVCenter,
+                         f"₦{price:.2f}")
+
+        painter.restore()
+
+
+# --- Admin Users Model/Delegate ---------------------------------------------------
+class UserTableModel(QAbstractTableModel):
+    """Table model over user dicts for the admin users view."""
+
+    HEADERS = ["Username", "Full Name", "Role", "Status", "Created", "Actions"]
+    KEYS = ["username", "name", "role", "status", "created"]
+    ACTIONS_COLUMN = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._users)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole or index.column() >= len(self.KEYS):
+            return None
+        return self._users[index.row()][self.KEYS[index.column()]]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_users(self, users: list) -> None:
+        """Replace the displayed users."""
+        self.beginResetModel()
+        self._users = list(users)
+        self.endResetModel()
+
+
+class UserActionsDelegate(QStyledItemDelegate):
+    """Paint Edit/Disable buttons in the actions column and report clicks by username."""
+
+    edit_requested = pyqtSignal(str)
+    disable_requested = pyqtSignal(str)
+
+    # (text, width) per button
+    BUTTONS = (("Edit", 60), ("Disable", 70))
+
+    def _button_rects(self, rect: QRect) -> list:
+        rects = []
+        left = rect.left()
+        for _, width in self.BUTTONS:
+            rects.append(QRect(left, rect.top() + 2, width, rect.height() - 4))
+            left += width + 4
+        return rects
+
+    def paint(self, painter, option, index) -> None:
+        style = option.widget.style() if option.widget else QApplication.style()
+        for (text, _), rect in zip(self.BUTTONS, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = text
+            button.state = QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() != QEvent.MouseButtonRelease:
+            return False
+
+        username = index.siblingAtColumn(0).data()
+        for i, rect in enumerate(self._button_rects(option.rect)):
+            if rect.contains(event.pos()):
+                (self.edit_requested if i == 0 else self.disable_requested).emit(username)
+                return True
+        return False
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paint a Delete button in a column and report clicks by row."""
+
+    delete_requested = pyqtSignal(int)
+
+    def _button_rect(self, rect: QRect) -> QRect:
+        return rect.adjusted(4, 8, -4, -8)
+
+    def paint(self, painter, option, index) -> None:
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = QStyleOptionButton()
+        button.rect = self._button_rect(option.rect)
+        button.text = "Delete"
+        button.state = QStyle.State_Enabled
+        style.drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() != QEvent.MouseButtonRelease:
+            return False
+        if self._button_rect(option.rect).contains(event.pos()):
+            self.delete_requested.emit(index.row())
+            return True
+        return False
+
+
+# --- Sales Cart / Inventory Models -------------------------------------------
+@dataclass
+class CartRow:
+    """One sales cart line; price and quantity stay numeric for the totals."""
+
+    product_id: int
+    product_name: str
+    unit_price: float
+    quantity: int = 1
+    discount: float = 0
+
+    @property
+    def line_total(self) -> float:
+        return self.unit_price * self.quantity
+
+
+class CartTableModel(QAbstractTableModel):
+    """Table model over the sales cart's CartRow lines."""
+
+    HEADERS = ["Item #", "Product", "Price (₦)", "Qty", "Disc (%)", "Total (₦)", "Action"]
+    (ITEM_COLUMN, PRODUCT_COLUMN, PRICE_COLUMN, QTY_COLUMN, DISCOUNT_COLUMN, TOTAL_COLUMN,
+     DELETE_COLUMN) = range(7)
+    RIGHT_ALIGNED = (PRICE_COLUMN, TOTAL_COLUMN)
+
+    # Emitted with the new subtotal after every change to the cart
+    totalsChanged = pyqtSignal(float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Running sum of line totals, adjusted by each mutation's delta
+        self._subtotal = 0.0
+        self._font = QFont("Arial", 9, QFont.Bold)
+
+    @property
+    def rows(self) -> list:
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.ITEM_COLUMN:
+                return str(index.row() + 1)
+            if column == self.PRODUCT_COLUMN:
+                return row.product_name
+            if column == self.PRICE_COLUMN:
+                return f"₦{row.unit_price:.2f}"
+            if column == self.QTY_COLUMN:
+                return str(row.quantity)
+            if column == self.DISCOUNT_COLUMN:
+                return f"{row.discount}%"
+            if column == self.TOTAL_COLUMN:
+                return f"₦{row.line_total:.2f}"
+        elif role == Qt.EditRole:
+            # Raw numbers for delegates and sorting; only DisplayRole formats
+            if column == self.PRICE_COLUMN:
+                return row.unit_price
+            if column == self.QTY_COLUMN:
+                return row.quantity
+            if column == self.DISCOUNT_COLUMN:
+                return row.discount
+            if column == self.TOTAL_COLUMN:
+                return row.line_total
+        elif role == Qt.TextAlignmentRole:
+            if column == self.PRODUCT_COLUMN:
+                return int(Qt.AlignLeft | Qt.AlignVCenter)
+            if column in self.RIGHT_ALIGNED:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignCenter)
+        elif role == Qt.FontRole:
+            return self._font
+        elif role == Qt.UserRole:
+            return row.product_id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def find_product(self, product_id: int) -> int:
+        """Return the row holding `product_id`, or -1."""
+        for i, row in enumerate(self._rows):
+            if row.product_id == product_id:
+                return i
+        return -1
+
+    def quantity_of(self, product_id: int) -> int:
+        """Units of `product_id` already in the cart."""
+        row = self.find_product(product_id)
+        return self._rows[row].quantity if row >= 0 else 0
+
+    def add_or_increment(self, product_id: int, product_name: str, unit_price: float) -> None:
+        """Add one unit of a product, appending a row if it is not in the cart yet."""
+        row = self.find_product(product_id)
+        if row >= 0:
+            self._rows[row].quantity += 1
+            self.dataChanged.emit(self.index(row, self.QTY_COLUMN), self.index(row, self.TOTAL_COLUMN))
+        else:
+            row = len(self._rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.append(CartRow(product_id, product_name, unit_price))
+            self.endInsertRows()
+        self._subtotal += unit_price
+        self.totalsChanged.emit(self._subtotal)
+
+    def remove_row(self, row: int) -> None:
+        """Remove one cart row; later rows renumber."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._rows.pop(row)
+        self.endRemoveRows()
+        # Snap back to zero once empty so float drift cannot linger
+        self._subtotal = self._subtotal - removed.line_total if self._rows else 0.0
+        if row < len(self._rows):
+            self.dataChanged.emit(
+                self.index(row, self.ITEM_COLUMN), self.index(len(self._rows) - 1, self.ITEM_COLUMN)
+            )
+        self.totalsChanged.emit(self._subtotal)
+
+    def clear(self) -> None:
+        """Empty the cart."""
+        self.beginResetModel()
+        self._rows = []
+        self._subtotal = 0.0
+        self.endResetModel()
+        self.totalsChanged.emit(0.0)
+
+    def subtotal(self) -> float:
+        return self._subtotal
+
+
+class InventoryTableModel(QAbstractTableModel):
+    """Lazy table model over the inventory tab's stock batches.
+
+    Only batch ids are loaded up front; full rows are fetched FETCH_SIZE at
+    a time, starting at the first row the view asks for that is not cached.
+    """
+
+    HEADERS = ["Batch ID", "Product ID", "Batch #", "Expiry", "Qty"]
+    KEYS = ["id", "product_id", "batch_number", "expiry_date", "quantity"]
+    FETCH_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._cache = {}
+        self._fetch = None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        batch_id = self._ids[index.row()]
+        if role == Qt.UserRole:
+            return batch_id
+        if role == Qt.DisplayRole:
+            batch = self._cache.get(batch_id)
+            if batch is None:
+                batch = self._fetch_window(index.row())
+            return str(batch[self.KEYS[index.column()]]) if batch else ""
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_batch_ids(self, batch_ids: list, fetch) -> None:
+        """Show `batch_ids`; `fetch(ids)` returns {id: batch} for rows as they are needed."""
+        self.beginResetModel()
+        self._ids = list(batch_ids)
+        self._cache = {}
+        self._fetch = fetch
+        self.endResetModel()
+
+    def _fetch_window(self, row: int):
+        """Load the uncached batches in [row, row + FETCH_SIZE) and return `row`'s."""
+        window = [
+            batch_id for batch_id in self._ids[row:row + self.FETCH_SIZE]
+            if batch_id not in self._cache
+        ]
+        self._cache.update(self._fetch(window))
+        return self._cache.get(self._ids[row])
+
+
+def _naira_or_dash(value) -> str:
+    return f"₦{value}" if value else "-"
+
+
+def _count_or_dash(value) -> str:
+    return str(value) if value else "-"
+
+
+class ProductsTableModel(QAbstractTableModel):
+    """Table model over product dicts for the Products page.
+
+    Cells are formatted in data(), so only the rows the view paints are
+    ever turned into strings.
+    """
+
+    # (header, product key, display formatter)
+    COLUMNS = (
+        ("ID", "id", str),
+        ("Name", "name", str),
+        ("SKU", "sku", str),
+        ("Cost Price", "cost_price", lambda value: f"₦{value}"),
+        ("Retail Price", "retail_price", lambda value: f"₦{value}"),
+        ("Bulk Price", "bulk_price", _naira_or_dash),
+        ("Bulk Qty", "bulk_quantity", _count_or_dash),
+        ("Wholesale Price", "wholesale_price", _naira_or_dash),
+        ("Wholesale Qty", "wholesale_quantity", _count_or_dash),
+        ("Min Stock", "min_stock", str),
+        ("Max Stock", "max_stock", str),
+        ("Reorder Level", "reorder_level", _count_or_dash),
+        ("Status", "is_active", lambda value: "Active" if value else "Inactive"),
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        product = self._rows[index.row()]
+        if role == Qt.UserRole:
+            return product["id"]
+        if role == Qt.DisplayRole:
+            _, key, fmt = self.COLUMNS[index.column()]
+            return fmt(product.get(key))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, products: list) -> None:
+        """Replace every row with a single model reset."""
+        self.beginResetModel()
+        self._rows = products
+        self.endResetModel()
+
+
+class AlertTableModel(QAbstractTableModel):
+    """Read-only table model over (type, message) rows for the dashboard grids."""
+
+    def __init__(self, headers: list, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows: list) -> None:
+        """Replace every row with a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+# --- Background Loaders ------------------------------------------------------
+class LoaderSignals(QObject):
+    """Signals emitted by background loaders back to the GUI thread."""
+
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class DashboardLoader(QRunnable):
+    """Fetch dashboard alerts for a store off the GUI thread.
+
+    Uses the window's long-lived InventoryAlerts; MainWindow runs at most one
+    loader at a time, so its session is never used by two threads at once.
+    """
+
+    def __init__(self, alerts_service: InventoryAlerts, store_id: int):
+        super().__init__()
+        self.alerts_service = alerts_service
+        self.store_id = store_id
+        self.signals = LoaderSignals()
+
+    def run(self) -> None:
+        try:
+            self.signals.loaded.emit(self.alerts_service.generate_alerts(self.store_id))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            # End the read transaction so the next refresh sees new stock
+            self.alerts_service.session.rollback()
+
+
+class SalesProductsLoader(QRunnable):
+    """Fetch the active product catalog for the sales grid off the GUI thread."""
+
+    def __init__(self, db_path: str = None):
+        super().__init__()
+        self.db_path = db_path
+        self.signals = LoaderSignals()
+
+    def run(self) -> None:
+        session = get_session(self.db_path)
+        try:
+            self.signals.loaded.emit(ProductService(session).get_all_products(active_only=True))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            session.close()
+
+
+class QueryLoader(QRunnable):
+    """Call `fetch()` off the GUI thread; `fetch` opens and closes its own session."""
+
+    def __init__(self, fetch):
+        super().__init__()
+        self.fetch = fetch
+        self.signals = LoaderSignals()
+
+    def run(self) -> None:
+        try:
+            self.signals.loaded.emit(self.fetch())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+# QueryLoaders started by run_query, held until they report back
+_running_queries = set()
+
+
+def run_query(fetch, on_loaded, on_failed) -> None:
+    """Run `fetch()` on the global thread pool and hand its result to the GUI thread."""
+    job = QueryLoader(fetch)
+    _running_queries.add(job)
+    job.signals.loaded.connect(on_loaded)
+    job.signals.failed.connect(on_failed)
+    job.signals.loaded.connect(lambda _: _running_queries.discard(job))
+    job.signals.failed.connect(lambda _: _running_queries.discard(job))
+    QThreadPool.globalInstance().start(job)
+
+
+class PrintJob(QRunnable):
+    """Send receipt lines to the shared printer off the GUI thread.
+
+    Jobs queue on the thread pool; `lock` keeps them from writing to the
+    one device connection MainWindow holds open at the same time. `lines`
+    may be a generator, which is then formatted as the job prints it.
+    """
+
+    def __init__(self, printer, lines, lock: QMutex):
+        super().__init__()
+        self.printer = printer
+        self.lines = lines
+        self.lock = lock
+        self.signals = LoaderSignals()
+
+    def run(self) -> None:
+        self.lock.lock()
+        try:
+            self.signals.loaded.emit(self.printer.print_lines(self.lines))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            self.lock.unlock()
+
+
+class SaleSignals(LoaderSignals):
+    """LoaderSignals plus `rejected`, for a cart the stock cannot cover."""
+
+    rejected = pyqtSignal(str)
+
+
+class SaleWorker(QRunnable):
+    """Allocate batches FEFO and record a sale off the GUI thread.
+
+    The worker opens its own session; SQLAlchemy sessions are not shared
+    with the GUI thread.
+    """
+
+    def __init__(self, cart_items: list, user_id: int, store_id: int, payment_method: str,
+                 amount_paid: float, db_path: str = None):
+        super().__init__()
+        self.cart_items = cart_items
+        self.user_id = user_id
+        self.store_id = store_id
+        self.payment_method = payment_method
+        self.amount_paid = amount_paid
+        self.db_path = db_path
+        self.signals = SaleSignals()
+
+    def run(self) -> None:
+        session = get_session(self.db_path)
+        try:
+            # One session and service pair for the whole sale; create_sale
+            # commits the sale, its items and stock movements once
+            sales_service = SalesService(session)
+            inventory_service = sales_service.inventory_service
+
+            # One query for every cart product's batches (FEFO - earliest expiry first)
+            batches_by_product = inventory_service.get_available_batches_for_products(
+                [cart_item["product_id"] for cart_item in self.cart_items], self.store_id
+            )
+
+            allocated_items = []
+            for cart_item in self.cart_items:
+                batches = batches_by_product[cart_item["product_id"]]
+
+                # Allocate from batches, stopping at the last one needed. Taken
+                # stock is deducted from the prefetched rows so a later line
+                # for the same product sees what is left.
+                remaining_qty = cart_item["quantity"]
+                for batch in batches:
+                    if remaining_qty <= 0:
+                        break
+                    qty_to_take = min(remaining_qty, batch["quantity"])
+                    if qty_to_take <= 0:
+                        continue
+
+                    allocated_items.append({
+                        "batch_id": batch["id"],
+                        "quantity": qty_to_take,
+                        "unit_price": cart_item["unit_price"],
+                    })
+                    batch["quantity"] -= qty_to_take
+                    remaining_qty -= qty_to_take
+
+                if remaining_qty > 0:
+                    self.signals.rejected.emit(
+                        f"Not enough stock for {cart_item['product_name']}\n"
+                        f"Needed: {cart_item['quantity']}\n"
+                        f"Available: {cart_item['quantity'] - remaining_qty}"
+                    )
+                    return
+
+            sale_result = sales_service.create_sale(
+                user_id=self.user_id,
+                store_id=self.store_id,
+                items=allocated_items,
+                payment_method=self.payment_method,
+                amount_paid=_money(self.amount_paid),
+            )
+            self.signals.loaded.emit(sale_result)
+        except Exception as e:
+            session.rollback()
+            self.signals.failed.emit(str(e))
+        finally:
+            session.close()
+
+
+class ImportWorker(QObject):
+    """Run a product import on a worker thread, reporting progress."""
+
+    progress = pyqtSignal(int)
+    done = pyqtSignal(int, list, list)
+
+    def __init__(self, exporter: ProductImportExporter, filepath: str, file_format: str, update_existing: bool):
+        super().__init__()
+        self.exporter = exporter
+        self.filepath = filepath
+        self.file_format = file_format
+        self.update_existing = update_existing
+        self._abort = False
+
+    def run(self) -> None:
+        imported_count, errors, notices = self.exporter.stream_import(
+            self.filepath,
+            self.file_format,
+            self.update_existing,
+            progress=self.progress.emit,
+            should_abort=lambda: self._abort,
+        )
+        self.done.emit(imported_count, errors, notices)
+
+
+class InitWorker(QObject):
+    """Initialize the database and authentication service on a worker thread."""
+
+    ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def run(self) -> None:
+        from desktop_app.database import init_db
+
+        try:
+            init_db()
+            self.ready.emit(AuthenticationService())
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
 # --- Main Application Window -----------------------------------------------
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -878,15 +1890,58 @@ class MainWindow(QMainWindow):
         self.user_session = user_session
         self.db_path = None
 
-        # Initialize services
+        # Initialize services; GUI-thread handlers share this one session
         session = get_session(self.db_path)
+        self.session = session
+        # Product/batch rows by id; the services drop what they update
+        self.ref_cache = RefDataCache(session)
         self.store_service = StoreService(session)
-        self.product_service = ProductService(session)
-        self.inventory_service = InventoryService(session)
+        self.product_service = ProductService(session, cache=self.ref_cache)
+        self.inventory_service = InventoryService(session, cache=self.ref_cache)
+
+        # Sales catalog cache, filtered in memory by _do_product_search and
+        # indexed by barcode/SKU; dropped whenever stock or products change
+        self._all_products = []
+        self._products_cache = None  # (fetched_at, products)
+        self._products_by_barcode = {}
+        self._products_by_sku = {}
+        self._product_search_keys = []
+        # Last search and its (key, product) hits, narrowed as typing continues
+        self._last_product_search = ("", [])
+
+        # Background loaders (kept referenced until they report back)
+        self._dashboard_loader = None
+        self._sales_products_loader = None
+
+        # Checkout in flight: its SaleWorker and the totals shown afterwards
+        self._sale_worker = None
+        self._pending_sale = None
+
+        # Import/export helper, created on first use and reused afterwards
+        self._exporter = None
+
+        # Dashboard alerts reuse one session for the window's lifetime
+        self.alerts_service = InventoryAlerts(self.db_path)
+
+        # (backend config, ThermalPrinter), kept open between receipts; print
+        # jobs hold the lock while they write to it
+        self._printer = None
+        self._printer_config = None
+        self._backend_config = None
+        self._printer_lock = QMutex()
+        self._print_jobs = set()
+
+        # Product import running on a worker thread, if any
+        self._import_thread = None
+        self._import_worker = None
+        self._import_progress = None
 
         # Initialize purchase order UI
         self.purchase_order_ui = PurchaseOrderUI(self)
 
+        # Non-blocking feedback for routine refreshes and clean imports
+        self.setStatusBar(QStatusBar())
+
         self.setup_ui()
         self.load_dashboard_data()
         self.setup_keyboard_shortcuts()
@@ -942,11 +1997,68 @@ class MainWindow(QMainWindow):
         """Create the left sidebar navigation with expandable purchasing submenu."""
         sidebar = QWidget()
         sidebar.setFixedWidth(350)
+        # One sheet on the sidebar styles every nav button by role, instead of
+        # each button parsing its own copy
         sidebar.setStyleSheet("""
             QWidget {
                 background-color: #2c3e50;
                 border-right: 2px solid #34495e;
             }
+
+            QPushButton[role="nav"],
+            QPushButton[role="nav-sub"],
+            QPushButton[role="nav-admin"] {
+                background-color: transparent;
+                color: #bdc3c7;
+                border: none;
+                text-align: left;
+            }
+
+            QPushButton[role="nav"] {
+                padding: 15px 18px;
+                font-size: 16px;
+                font-weight: bold;
+                border-radius: 5px;
+                margin: 3px 0px;
+            }
+
+            QPushButton[role="nav-admin"] {
+                padding: 12px 15px;
+                font-size: 14px;
+                border-radius: 5px;
+                margin: 2px 0px;
+            }
+
+            QPushButton[role="nav-sub"] {
+                padding: 8px 10px;
+                font-size: 12px;
+                border-radius: 3px;
+                margin: 1px 0px;
+            }
+
+            QPushButton[role="nav"]:hover,
+            QPushButton[role="nav-admin"]:hover {
+                background-color: #34495e;
+                color: white;
+            }
+
+            QPushButton[role="nav-sub"]:hover {
+                background-color: #2c3e50;
+                color: white;
+            }
+
+            QPushButton[role="nav"]:checked,
+            QPushButton[role="nav-admin"]:checked {
+                background-color: #3498db;
+                color: white;
+                font-weight: bold;
+            }
+
+            QPushButton[role="nav-sub"]:checked {
+                background-color: #e74c3c;
+                color: white;
+                font-weight: bold;
+            }
         """)
 
         layout = QVBoxLayout(sidebar)
@@ -981,28 +2093,7 @@ class MainWindow(QMainWindow):
 
         for text, index in main_nav_items:
             btn = QPushButton(text)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #bdc3c7;
-                    border: none;
-                    text-align: left;
-                    padding: 15px 18px;
-                    font-size: 16px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                    margin: 3px 0px;
-                }
-                QPushButton:hover {
-                    background-color: #34495e;
-                    color: white;
-                }
-                QPushButton:checked {
-                    background-color: #3498db;
-                    color: white;
-                    font-weight: bold;
-                }
-            """)
+            btn.setProperty("role", "nav")
             btn.setCheckable(True)
             btn.clicked.connect(lambda checked, idx=index: self.set_active_page(idx))
             layout.addWidget(btn)
@@ -1060,27 +2151,7 @@ class MainWindow(QMainWindow):
         self.purchasing_sub_buttons = []
         for text, index in purchasing_sub_items:
             btn = QPushButton(text)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #bdc3c7;
-                    border: none;
-                    text-align: left;
-                    padding: 8px 10px;
-                    font-size: 12px;
-                    border-radius: 3px;
-                    margin: 1px 0px;
-                }
-                QPushButton:hover {
-                    background-color: #2c3e50;
-                    color: white;
-                }
-                QPushButton:checked {
-                    background-color: #e74c3c;
-                    color: white;
-                    font-weight: bold;
-                }
-            """)
+            btn.setProperty("role", "nav-sub")
             btn.setCheckable(True)
             btn.clicked.connect(lambda checked, idx=index: self.set_active_page(idx))
             submenu_layout.addWidget(btn)
@@ -1093,27 +2164,7 @@ class MainWindow(QMainWindow):
         # Add admin panel for admin users
         if self.user_session.role.lower() == "admin":
             admin_btn = QPushButton("👑 Admin")
-            admin_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #bdc3c7;
-                    border: none;
-                    text-align: left;
-                    padding: 12px 15px;
-                    font-size: 14px;
-                    border-radius: 5px;
-                    margin: 2px 0px;
-                }
-                QPushButton:hover {
-                    background-color: #34495e;
-                    color: white;
-                }
-                QPushButton:checked {
-                    background-color: #3498db;
-                    color: white;
-                    font-weight: bold;
-                }
-            """)
+            admin_btn.setProperty("role", "nav-admin")
             admin_btn.setCheckable(True)
             admin_btn.clicked.connect(lambda checked, idx=9: self.set_active_page(idx))
             layout.addWidget(admin_btn)
@@ -1247,6 +2298,7 @@ class MainWindow(QMainWindow):
 
     def set_active_page(self, index: int) -> None:
         """Set the active page in the content stack."""
+        self._materialize_tab(index)
         self.content_stack.setCurrentIndex(index)
 
         # Update navigation button states
@@ -1270,6 +2322,17 @@ class MainWindow(QMainWindow):
         if index < len(page_titles):
             self.page_title.setText(page_titles[index])
 
+    def _materialize_tab(self, index: int) -> None:
+        """Replace a placeholder page with its real contents the first time it is shown."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, builder())
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     def create_purchasing_tab(self) -> QWidget:
         """Create purchasing management tab."""
         widget = QWidget()
@@ -1364,19 +2427,7 @@ class MainWindow(QMainWindow):
 
             # Add action button
             action_btn = QPushButton("👁 View")
-            action_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    border: none;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 10px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            action_btn.setProperty("role", "row-action")
             self.purchase_orders_table.setCellWidget(i, 5, action_btn)
 
         layout.addWidget(self.purchase_orders_table)
@@ -1493,19 +2544,7 @@ class MainWindow(QMainWindow):
 
             # Add action button
             action_btn = QPushButton("👁 View")
-            action_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    border: none;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 10px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            action_btn.setProperty("role", "row-action")
             self.purchase_invoices_table.setCellWidget(i, 6, action_btn)
 
         layout.addWidget(self.purchase_invoices_table)
@@ -1589,19 +2628,7 @@ class MainWindow(QMainWindow):
 
             # Add action button
             action_btn = QPushButton("✏ Edit")
-            action_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f39c12;
-                    color: white;
-                    border: none;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                    font-size: 10px;
-                }
-                QPushButton:hover {
-                    background-color: #e67e22;
-                }
-            """)
+            action_btn.setProperty("role", "row-action")
             self.suppliers_table.setCellWidget(i, 6, action_btn)
 
         layout.addWidget(self.suppliers_table)
@@ -1719,16 +2746,25 @@ class MainWindow(QMainWindow):
         self.content_stack.addWidget(self.create_dashboard_tab())      # Index 0
         self.content_stack.addWidget(self.create_sales_tab())          # Index 1
         self.content_stack.addWidget(self.create_inventory_tab())      # Index 2
-        self.content_stack.addWidget(self.create_products_tab())       # Index 3
-        self.content_stack.addWidget(self.create_reports_tab())        # Index 4
-        self.content_stack.addWidget(self.create_purchase_order_tab()) # Index 5
+        self.content_stack.addWidget(QWidget())                        # Index 3 (Products, built on first visit)
+        self.content_stack.addWidget(QWidget())                        # Index 4 (Reports, built on first visit)
+        self.content_stack.addWidget(QWidget())                        # Index 5 (Purchase Order, built on first visit)
         self.content_stack.addWidget(self.create_purchase_invoice_tab()) # Index 6
         self.content_stack.addWidget(self.create_suppliers_tab())      # Index 7
         self.content_stack.addWidget(self.create_warehouse_tab())      # Index 8
 
+        # Pages that query on construction, or that most sessions never open,
+        # are built on first visit so startup only pays for the dashboard
+        self._tab_builders = {
+            3: self.create_products_tab,
+            4: self.create_reports_tab,
+            5: self.create_purchase_order_tab,
+        }
+
         # Admin tab (only for admin users)
         if self.user_session.role.lower() == "admin":
-            self.content_stack.addWidget(self.create_admin_tab())      # Index 9
+            self.content_stack.addWidget(QWidget())                    # Index 9 (built on first visit)
+            self._tab_builders[9] = self.create_admin_tab
 
         content_layout.addWidget(self.content_stack, 1)
         main_layout.addWidget(content_area, 1)
@@ -1746,16 +2782,16 @@ class MainWindow(QMainWindow):
         # Summary cards
         layout.addWidget(QLabel("Dashboard Summary"))
 
-        self.dashboard_table = QTableWidget()
-        self.dashboard_table.setColumnCount(2)
-        self.dashboard_table.setHorizontalHeaderLabels(["Metric", "Value"])
+        self.dashboard_model = AlertTableModel(["Metric", "Value"], self)
+        self.dashboard_table = QTableView()
+        self.dashboard_table.setModel(self.dashboard_model)
         layout.addWidget(self.dashboard_table)
 
         # Alerts
         layout.addWidget(QLabel("Alerts"))
-        self.alerts_table = QTableWidget()
-        self.alerts_table.setColumnCount(2)
-        self.alerts_table.setHorizontalHeaderLabels(["Alert Type", "Message"])
+        self.alerts_model = AlertTableModel(["Alert Type", "Message"], self)
+        self.alerts_table = QTableView()
+        self.alerts_table.setModel(self.alerts_model)
         layout.addWidget(self.alerts_table)
 
         widget.setLayout(layout)
@@ -1770,47 +2806,56 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout()
         left_layout.setSpacing(10)
         left_label = QLabel("PRODUCT CATALOG")
-        left_label.setStyleSheet("font-size: 12px; font-weight: bold; padding: 10px;")
+        left_label.setProperty("role", "section-title")
         left_layout.addWidget(left_label)
 
         # Low stock warning bar
         self.low_stock_bar = QLabel()
-        self.low_stock_bar.setStyleSheet("background-color: #fff3cd; color: #856404; padding: 8px; border-radius: 4px; font-size: 9px; font-weight: bold;")
+        self.low_stock_bar.setProperty("role", "warning-bar")
         self.low_stock_bar.setVisible(False)
         left_layout.addWidget(self.low_stock_bar)
 
         # Search bar with larger font
         search_layout = QHBoxLayout()
         search_label = QLabel("Search:")
-        search_label.setStyleSheet("font-size: 10px; font-weight: bold;")
+        search_label.setProperty("role", "field")
         self.product_search = QLineEdit()
         self.product_search.setPlaceholderText("Scan barcode or search product...")
-        self.product_search.setStyleSheet("font-size: 10px; padding: 8px; border-radius: 5px; border: 1px solid #ccc;")
+        self.product_search.setProperty("role", "search")
         self.product_search.setMinimumHeight(35)
-        self.product_search.textChanged.connect(self.on_product_search)
+        # Keystrokes restart the timer, so a burst of typing filters once
+        self._search_timer = QTimer(widget)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(PRODUCT_SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._do_product_search)
+        self.product_search.textChanged.connect(self._search_timer.start)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.product_search)
         left_layout.addLayout(search_layout)
 
-        # Product grid (scrollable)
-        product_scroll = QScrollArea()
-        product_scroll.setWidgetResizable(True)
-        self.product_grid_widget = QWidget()
-        self.product_grid_layout = QVBoxLayout(self.product_grid_widget)
-        self.product_grid_layout.setSpacing(15)
-
-        # Container for product cards
-        self.products_container = QWidget()
-        self.products_container_layout = QVBoxLayout(self.products_container)
-            
-        # Create product cards grid (2 columns for larger cards)
-        self.products_cards_layout = QGridLayout()
-        self.products_cards_layout.setSpacing(15)
-        self.products_container_layout.addLayout(self.products_cards_layout)
-        self.products_container_layout.addStretch()
-
-        product_scroll.setWidget(self.products_container)
-        left_layout.addWidget(product_scroll)
+        # Product catalog: cards are painted by a delegate, so only visible
+        # rows cost anything regardless of catalog size
+        self.product_model = ProductListModel(self)
+        self.product_view = QListView()
+        self.product_view.setViewMode(QListView.IconMode)
+        self.product_view.setFlow(QListView.LeftToRight)
+        self.product_view.setWrapping(True)
+        self.product_view.setResizeMode(QListView.Adjust)
+        self.product_view.setUniformItemSizes(True)
+        # Lay cards out in batches after each reset instead of in one blocking pass
+        self.product_view.setLayoutMode(QListView.Batched)
+        self.product_view.setBatchSize(PRODUCT_GRID_BATCH_SIZE)
+        self.product_view.setMovement(QListView.Static)
+        self.product_view.setSpacing(15)
+        self.product_view.setMouseTracking(True)
+        self.product_view.setSelectionMode(QListView.NoSelection)
+        self.product_view.setCursor(Qt.PointingHandCursor)
+        self.product_view.setModel(self.product_model)
+        self.product_view.setItemDelegate(ProductCardDelegate(self.product_view))
+        self.product_view.clicked.connect(
+            lambda index: self.add_product_to_sales_cart(index.data(Qt.UserRole))
+        )
+        left_layout.addWidget(self.product_view)
 
         left_widget = QWidget()
         left_widget.setLayout(left_layout)
@@ -1824,17 +2869,17 @@ class MainWindow(QMainWindow):
 
         # Header
         cart_header = QLabel("SALES RECEIPT")
-        cart_header.setStyleSheet("font-size: 12px; font-weight: bold; padding: 10px;")
+        cart_header.setProperty("role", "section-title")
         right_layout.addWidget(cart_header)
 
         # Customer info (with larger font)
         customer_layout = QHBoxLayout()
         customer_label = QLabel("Customer:")
-        customer_label.setStyleSheet("font-size: 10px; font-weight: bold;")
+        customer_label.setProperty("role", "field")
         customer_label.setMinimumWidth(80)
         self.customer_input = QLineEdit()
         self.customer_input.setPlaceholderText("Walk-in customer")
-        self.customer_input.setStyleSheet("font-size: 10px; padding: 6px;")
+        self.customer_input.setProperty("role", "input")
         self.customer_input.setMinimumHeight(32)
         customer_layout.addWidget(customer_label)
         customer_layout.addWidget(self.customer_input)
@@ -1843,11 +2888,11 @@ class MainWindow(QMainWindow):
         # Barcode/Item scanner (NEW FEATURE)
         scanner_layout = QHBoxLayout()
         scanner_label = QLabel("Item Scanner:")
-        scanner_label.setStyleSheet("font-size: 10px; font-weight: bold;")
+        scanner_label.setProperty("role", "field")
         scanner_label.setMinimumWidth(80)
         self.item_scanner = QLineEdit()
         self.item_scanner.setPlaceholderText("Scan barcode here to add item...")
-        self.item_scanner.setStyleSheet("font-size: 12px; padding: 10px; background-color: #fffacd; font-weight: bold; border: 2px solid #4472C4; border-radius: 6px;")
+        self.item_scanner.setProperty("role", "scanner")
         self.item_scanner.setMinimumHeight(48)
         self.item_scanner.returnPressed.connect(self.on_barcode_scanned)
         scanner_layout.addWidget(scanner_label)
@@ -1858,84 +2903,87 @@ class MainWindow(QMainWindow):
 
         # Cart table (with larger fonts and row heights)
         cart_label = QLabel("CART ITEMS")
-        cart_label.setStyleSheet("font-size: 11px; font-weight: bold; padding: 5px 0px;")
+        cart_label.setProperty("role", "section")
         right_layout.addWidget(cart_label)
         
-        self.sales_cart_table = QTableWidget()
-        self.sales_cart_table.setColumnCount(6)
-        self.sales_cart_table.setHorizontalHeaderLabels(
-            ["Item #", "Product", "Price (₦)", "Qty", "Disc (%)", "Total (₦)"]
-        )
+        self.cart_model = CartTableModel(self)
+        self.cart_model.totalsChanged.connect(self.update_sales_summary)
+        self.sales_cart_table = QTableView()
+        self.sales_cart_table.setModel(self.cart_model)
+        self.sales_cart_table.verticalHeader().setDefaultSectionSize(48)
         self.sales_cart_table.setColumnWidth(0, 50)
         self.sales_cart_table.setColumnWidth(1, 280)  # Product Name - wider for long names
         self.sales_cart_table.setColumnWidth(2, 80)
         self.sales_cart_table.setColumnWidth(3, 50)
         self.sales_cart_table.setColumnWidth(4, 70)
         self.sales_cart_table.setColumnWidth(5, 80)
-        self.sales_cart_table.setRowHeight(0, 35)
+        self.sales_cart_table.setColumnWidth(CartTableModel.DELETE_COLUMN, 80)
+
+        # One painted Delete button per row instead of a QPushButton each
+        cart_delete_delegate = DeleteButtonDelegate(self.sales_cart_table)
+        cart_delete_delegate.delete_requested.connect(self.remove_from_cart)
+        self.sales_cart_table.setItemDelegateForColumn(CartTableModel.DELETE_COLUMN, cart_delete_delegate)
         
         # Enhance table styling
-        header_style = "font-size: 10px; font-weight: bold; background-color: #4472C4; color: white;"
-        self.sales_cart_table.horizontalHeader().setStyleSheet(header_style)
-        self.sales_cart_table.setStyleSheet("font-size: 9px; border: 1px solid #ccc;")
+        self.sales_cart_table.setProperty("role", "cart")
         
         right_layout.addWidget(self.sales_cart_table)
 
         # Summary section (ENHANCED with larger fonts and better styling)
         summary_label = QLabel("TRANSACTION SUMMARY")
-        summary_label.setStyleSheet("font-size: 11px; font-weight: bold; padding: 10px 0px;")
+        summary_label.setProperty("role", "section")
         right_layout.addWidget(summary_label)
         
         summary_frame = QFrame()
-        summary_frame.setStyleSheet("border: 2px solid #ddd; border-radius: 5px; padding: 15px; background-color: #f9f9f9;")
+        summary_frame.setProperty("role", "summary-panel")
         summary_layout = QVBoxLayout(summary_frame)
         summary_layout.setSpacing(10)
         
         # Subtotal
         subtotal_layout = QHBoxLayout()
         subtotal_lbl = QLabel("Subtotal:")
-        subtotal_lbl.setStyleSheet("font-size: 10px; font-weight: bold;")
+        subtotal_lbl.setProperty("role", "field")
         subtotal_layout.addWidget(subtotal_lbl)
         subtotal_layout.addStretch()
         self.subtotal_label = QLabel("₦0.00")
         self.subtotal_label.setAlignment(Qt.AlignRight)
-        self.subtotal_label.setStyleSheet("font-size: 10px; font-weight: bold; min-width: 100px; padding-right: 10px;")
+        self.subtotal_label.setProperty("role", "summary-value")
         subtotal_layout.addWidget(self.subtotal_label)
         summary_layout.addLayout(subtotal_layout)
 
         # Discount
         discount_layout = QHBoxLayout()
         discount_lbl = QLabel("Discount:")
-        discount_lbl.setStyleSheet("font-size: 10px; font-weight: bold;")
+        discount_lbl.setProperty("role", "field")
         discount_layout.addWidget(discount_lbl)
         discount_layout.addStretch()
         self.discount_label = QLabel("₦0.00")
         self.discount_label.setAlignment(Qt.AlignRight)
-        self.discount_label.setStyleSheet("font-size: 10px; font-weight: bold; min-width: 100px; padding-right: 10px;")
+        self.discount_label.setProperty("role", "summary-value")
         discount_layout.addWidget(self.discount_label)
         summary_layout.addLayout(discount_layout)
 
         # Tax
         tax_layout = QHBoxLayout()
         tax_lbl = QLabel("Tax (7.5%):")
-        tax_lbl.setStyleSheet("font-size: 10px; font-weight: bold;")
+        tax_lbl.setProperty("role", "field")
         tax_layout.addWidget(tax_lbl)
         tax_layout.addStretch()
         self.tax_label = QLabel("₦0.00")
         self.tax_label.setAlignment(Qt.AlignRight)
-        self.tax_label.setStyleSheet("font-size: 10px; font-weight: bold; min-width: 100px; padding-right: 10px;")
+        self.tax_label.setProperty("role", "summary-value")
         tax_layout.addWidget(self.tax_label)
         summary_layout.addLayout(tax_layout)
 
         # Total (PROMINENT)
         total_layout = QHBoxLayout()
         total_lbl = QLabel("TOTAL:")
-        total_lbl.setStyleSheet("font-size: 12px; font-weight: bold; color: #fff;")
+        total_lbl.setProperty("role", "total-caption")
         total_layout.addWidget(total_lbl)
         total_layout.addStretch()
         self.total_amount_label = QLabel("₦0.00")
         self.total_amount_label.setAlignment(Qt.AlignRight)
-        self.total_amount_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #fff; min-width: 120px; padding: 8px 15px; background-color: #28a745; border-radius: 3px;")
+        self.total_amount_label.setProperty("role", "total-value")
         total_layout.addWidget(self.total_amount_label)
         summary_layout.addLayout(total_layout)
         
@@ -1943,7 +2991,7 @@ class MainWindow(QMainWindow):
 
         # Payment section (PROFESSIONAL)
         payment_label = QLabel("PAYMENT")
-        payment_label.setStyleSheet("font-size: 11px; font-weight: bold; padding: 10px 0px;")
+        payment_label.setProperty("role", "section")
         right_layout.addWidget(payment_label)
         
         payment_layout = QVBoxLayout()
@@ -1952,10 +3000,11 @@ class MainWindow(QMainWindow):
         # Payment method row
         method_row = QHBoxLayout()
         method_label = QLabel("Method:")
-        method_label.setStyleSheet("font-size: 10px; font-weight: bold; min-width: 60px;")
+        method_label.setProperty("role", "field")
+        method_label.setMinimumWidth(60)
         self.sales_payment_method = QComboBox()
         self.sales_payment_method.addItems(["Cash", "Card", "Transfer", "Credit"])
-        self.sales_payment_method.setStyleSheet("font-size: 10px; padding: 6px;")
+        self.sales_payment_method.setProperty("role", "input")
         self.sales_payment_method.setMinimumHeight(32)
         method_row.addWidget(method_label)
         method_row.addWidget(self.sales_payment_method)
@@ -1965,12 +3014,10 @@ class MainWindow(QMainWindow):
         # Amount paid row
         paid_row = QHBoxLayout()
         paid_label = QLabel("Amount Paid:")
-        paid_label.setStyleSheet("font-size: 10px; font-weight: bold; min-width: 120px;")
-        self.sales_amount_paid = QDoubleSpinBox()
-        self.sales_amount_paid.setMinimum(0)
-        self.sales_amount_paid.setMaximum(999999.99)
-        self.sales_amount_paid.setDecimals(2)
-        self.sales_amount_paid.setStyleSheet("font-size: 10px; padding: 6px;")
+        paid_label.setProperty("role", "field")
+        paid_label.setMinimumWidth(120)
+        self.sales_amount_paid = _money_spin()
+        self.sales_amount_paid.setProperty("role", "input")
         self.sales_amount_paid.setMinimumHeight(32)
         self.sales_amount_paid.valueChanged.connect(self.update_sales_summary)
         paid_row.addWidget(paid_label)
@@ -1980,10 +3027,11 @@ class MainWindow(QMainWindow):
         # Change row
         change_row = QHBoxLayout()
         change_label = QLabel("Change:")
-        change_label.setStyleSheet("font-size: 10px; font-weight: bold; min-width: 120px;")
+        change_label.setProperty("role", "field")
+        change_label.setMinimumWidth(120)
         self.sales_change_label = QLabel("₦0.00")
         self.sales_change_label.setAlignment(Qt.AlignRight)
-        self.sales_change_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #0066cc; min-width: 100px; padding-right: 10px;")
+        self.sales_change_label.setProperty("role", "change-value")
         change_row.addWidget(change_label)
         change_row.addStretch()
         change_row.addWidget(self.sales_change_label)
@@ -1998,63 +3046,21 @@ class MainWindow(QMainWindow):
         # Complete Sale button (GREEN, LARGE)
         self.complete_sale_btn = QPushButton("COMPLETE SALE")
         self.complete_sale_btn.setMinimumHeight(50)
-        self.complete_sale_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-        """)
+        self.complete_sale_btn.setProperty("role", "action-success")
         self.complete_sale_btn.clicked.connect(self.complete_sale)
         buttons_layout.addWidget(self.complete_sale_btn)
 
         # Save & Print button (BLUE)
         save_print_btn = QPushButton("Save & Print")
         save_print_btn.setMinimumHeight(50)
-        save_print_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4472C4;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #3555A0;
-            }
-        """)
+        save_print_btn.setProperty("role", "action-primary")
         save_print_btn.clicked.connect(self.complete_sale)
         buttons_layout.addWidget(save_print_btn)
         
         # Cancel button (RED)
         clear_btn = QPushButton("Clear Cart")
         clear_btn.setMinimumHeight(50)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
+        clear_btn.setProperty("role", "action-danger")
         clear_btn.clicked.connect(self.clear_sales_cart)
         buttons_layout.addWidget(clear_btn)
         
@@ -2065,12 +3071,12 @@ class MainWindow(QMainWindow):
         quick_actions_layout.setSpacing(10)
         
         self.printer_test_btn = QPushButton("🖨 Printer Test")
-        self.printer_test_btn.setStyleSheet("font-size: 9px; padding: 6px; min-height: 30px;")
+        self.printer_test_btn.setProperty("role", "quick-action")
         self.printer_test_btn.clicked.connect(self.printer_test)
         quick_actions_layout.addWidget(self.printer_test_btn)
 
         self.reprint_last_btn = QPushButton("📄 Reprint Last")
-        self.reprint_last_btn.setStyleSheet("font-size: 9px; padding: 6px; min-height: 30px;")
+        self.reprint_last_btn.setProperty("role", "quick-action")
         self.reprint_last_btn.clicked.connect(self.reprint_last_receipt)
         quick_actions_layout.addWidget(self.reprint_last_btn)
         
@@ -2117,9 +3123,9 @@ class MainWindow(QMainWindow):
 
         # Bulk expiry controls
         expiry_layout = QHBoxLayout()
-        expiry_layout.addWidget(QLabel("Store ID:"))
+        expiry_layout.addWidget(QLabel("Store IDs:"))
         self.expiry_store_input = QLineEdit()
-        self.expiry_store_input.setPlaceholderText("Leave empty for primary store")
+        self.expiry_store_input.setPlaceholderText("Comma-separated; empty for primary store")
         expiry_layout.addWidget(self.expiry_store_input)
 
         expiry_layout.addWidget(QLabel("Expire within (days):"))
@@ -2135,11 +3141,9 @@ class MainWindow(QMainWindow):
 
         # Stock view
         layout.addWidget(QLabel("Current Stock"))
-        self.inventory_table = QTableWidget()
-        self.inventory_table.setColumnCount(5)
-        self.inventory_table.setHorizontalHeaderLabels(
-            ["Batch ID", "Product ID", "Batch #", "Expiry", "Qty"]
-        )
+        self.inventory_model = InventoryTableModel(self)
+        self.inventory_table = QTableView()
+        self.inventory_table.setModel(self.inventory_model)
         layout.addWidget(self.inventory_table)
 
         widget.setLayout(layout)
@@ -2178,12 +3182,9 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
 
         # Products table
-        self.products_table = QTableWidget()
-        self.products_table.setColumnCount(13)
-        self.products_table.setHorizontalHeaderLabels(
-            ["ID", "Name", "SKU", "Cost Price", "Retail Price", "Bulk Price", "Bulk Qty", 
-             "Wholesale Price", "Wholesale Qty", "Min Stock", "Max Stock", "Reorder Level", "Status"]
-        )
+        self.products_model = ProductsTableModel(self)
+        self.products_table = QTableView()
+        self.products_table.setModel(self.products_model)
         self.products_table.setColumnWidth(1, 250)  # Product Name - wider for long names
         self.products_table.setColumnWidth(2, 120)  # SKU - wider
         layout.addWidget(self.products_table)
@@ -2196,30 +3197,11 @@ class MainWindow(QMainWindow):
 
     def load_products_table(self) -> None:
         """Load and display all products in the table."""
+        if 3 in self._tab_builders:
+            return  # Products page not built yet; it loads when first shown
         try:
             products = self.product_service.get_all_products(active_only=False)
-            self.products_table.setRowCount(len(products))
-
-            for i, product in enumerate(products):
-                self.products_table.setItem(i, 0, QTableWidgetItem(str(product["id"])))
-                self.products_table.setItem(i, 1, QTableWidgetItem(product["name"]))
-                self.products_table.setItem(i, 2, QTableWidgetItem(product["sku"]))
-                self.products_table.setItem(i, 3, QTableWidgetItem(f"₦{product.get('cost_price', 0)}"))
-                self.products_table.setItem(i, 4, QTableWidgetItem(f"₦{product.get('retail_price', 0)}"))
-                bulk_price = f"₦{product.get('bulk_price', 0)}" if product.get('bulk_price') else "-"
-                self.products_table.setItem(i, 5, QTableWidgetItem(bulk_price))
-                bulk_qty = str(product.get('bulk_quantity', "-")) if product.get('bulk_quantity') else "-"
-                self.products_table.setItem(i, 6, QTableWidgetItem(bulk_qty))
-                wholesale_price = f"₦{product.get('wholesale_price', 0)}" if product.get('wholesale_price') else "-"
-                self.products_table.setItem(i, 7, QTableWidgetItem(wholesale_price))
-                wholesale_qty = str(product.get('wholesale_quantity', "-")) if product.get('wholesale_quantity') else "-"
-                self.products_table.setItem(i, 8, QTableWidgetItem(wholesale_qty))
-                self.products_table.setItem(i, 9, QTableWidgetItem(str(product.get('min_stock', 0))))
-                self.products_table.setItem(i, 10, QTableWidgetItem(str(product.get('max_stock', 0))))
-                reorder = str(product.get('reorder_level', "-")) if product.get('reorder_level') else "-"
-                self.products_table.setItem(i, 11, QTableWidgetItem(reorder))
-                status = "Active" if product.get("is_active") else "Inactive"
-                self.products_table.setItem(i, 12, QTableWidgetItem(status))
+            self.products_model.set_rows(products)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load products: {str(e)}")
 
@@ -2237,137 +3219,23 @@ class MainWindow(QMainWindow):
         scroll_widget = QWidget()
         layout = QVBoxLayout(scroll_widget)
 
-        # ===== SECTION 1: Basic Product Information =====
-        layout.addWidget(QLabel("<b>Product Information</b>"))
-        layout.addWidget(self._create_separator())
-
-        # Name
-        layout.addWidget(QLabel("Product Name:"))
-        name_input = QLineEdit()
-        layout.addWidget(name_input)
-
-        # Generic Name
-        layout.addWidget(QLabel("Generic Name (Optional):"))
-        generic_input = QLineEdit()
-        layout.addWidget(generic_input)
-
-        # SKU
-        layout.addWidget(QLabel("SKU:"))
-        sku_input = QLineEdit()
-        layout.addWidget(sku_input)
-
-        # Barcode
-        layout.addWidget(QLabel("Barcode (Optional):"))
-        barcode_input = QLineEdit()
-        layout.addWidget(barcode_input)
-
-        # NAFDAC Number
-        layout.addWidget(QLabel("NAFDAC Number:"))
-        nafdac_input = QLineEdit()
-        layout.addWidget(nafdac_input)
-
-        layout.addSpacing(10)
-
-        # ===== SECTION 2: Cost & Basic Pricing =====
-        layout.addWidget(QLabel("<b>Cost & Basic Pricing</b>"))
-        layout.addWidget(self._create_separator())
-
-        # Cost Price
-        layout.addWidget(QLabel("Cost Price (₦):"))
-        cost_input = QDoubleSpinBox()
-        cost_input.setMinimum(0)
-        cost_input.setMaximum(999999.99)
-        cost_input.setDecimals(2)
-        layout.addWidget(cost_input)
-
-        # Selling Price
-        layout.addWidget(QLabel("Selling Price (₦):"))
-        selling_input = QDoubleSpinBox()
-        selling_input.setMinimum(0)
-        selling_input.setMaximum(999999.99)
-        selling_input.setDecimals(2)
-        layout.addWidget(selling_input)
-
-        layout.addSpacing(10)
-
-        # ===== SECTION 3: Pricing Tiers =====
-        layout.addWidget(QLabel("<b>Pricing Tiers</b>"))
-        layout.addWidget(self._create_separator())
-
-        # Retail Price
-        layout.addWidget(QLabel("Retail Price (₦):"))
-        retail_input = QDoubleSpinBox()
-        retail_input.setMinimum(0)
-        retail_input.setMaximum(999999.99)
-        retail_input.setDecimals(2)
-        layout.addWidget(retail_input)
-
-        # Bulk Price Section
-        layout.addWidget(QLabel("Bulk Price (₦) (Optional):"))
-        bulk_price_input = QDoubleSpinBox()
-        bulk_price_input.setMinimum(0)
-        bulk_price_input.setMaximum(999999.99)
-        bulk_price_input.setDecimals(2)
-        layout.addWidget(bulk_price_input)
-
-        layout.addWidget(QLabel("Minimum Quantity for Bulk Price:"))
-        bulk_qty_input = QSpinBox()
-        bulk_qty_input.setMinimum(1)
-        bulk_qty_input.setMaximum(100000)
-        bulk_qty_input.setValue(10)
-        layout.addWidget(bulk_qty_input)
-
-        # Wholesale Price Section
-        layout.addWidget(QLabel("Wholesale Price (₦) (Optional):"))
-        wholesale_price_input = QDoubleSpinBox()
-        wholesale_price_input.setMinimum(0)
-        wholesale_price_input.setMaximum(999999.99)
-        wholesale_price_input.setDecimals(2)
-        layout.addWidget(wholesale_price_input)
-
-        layout.addWidget(QLabel("Minimum Quantity for Wholesale Price:"))
-        wholesale_qty_input = QSpinBox()
-        wholesale_qty_input.setMinimum(1)
-        wholesale_qty_input.setMaximum(100000)
-        wholesale_qty_input.setValue(50)
-        layout.addWidget(wholesale_qty_input)
-
-        layout.addSpacing(10)
-
-        # ===== SECTION 4: Stock Alerts =====
-        layout.addWidget(QLabel("<b>Stock Alerts</b>"))
-        layout.addWidget(self._create_separator())
-
-        layout.addWidget(QLabel("Minimum Stock Alert:"))
-        min_stock_input = QSpinBox()
-        min_stock_input.setMinimum(0)
-        min_stock_input.setMaximum(100000)
-        min_stock_input.setValue(10)
-        layout.addWidget(min_stock_input)
-
-        layout.addWidget(QLabel("Maximum Stock Alert:"))
-        max_stock_input = QSpinBox()
-        max_stock_input.setMinimum(1)
-        max_stock_input.setMaximum(1000000)
-        max_stock_input.setValue(500)
-        layout.addWidget(max_stock_input)
-
-        layout.addWidget(QLabel("Reorder Level (Optional):"))
-        reorder_input = QSpinBox()
-        reorder_input.setMinimum(0)
-        reorder_input.setMaximum(100000)
-        layout.addWidget(reorder_input)
-
-        layout.addSpacing(10)
-
-        # ===== SECTION 5: Description =====
-        layout.addWidget(QLabel("<b>Description</b>"))
-        layout.addWidget(self._create_separator())
-
-        layout.addWidget(QLabel("Description (Optional):"))
-        description_input = QTextEdit()
-        description_input.setMaximumHeight(80)
-        layout.addWidget(description_input)
+        # Build every section/field from PRODUCT_FORM_SECTIONS
+        fields = {}
+        for i, (section, specs) in enumerate(PRODUCT_FORM_SECTIONS):
+            if i:
+                layout.addSpacing(10)
+            layout.addWidget(QLabel(f"<b>{section}</b>"))
+            layout.addWidget(self._create_separator())
+
+            # One form per section keeps labels aligned beside their fields
+            form = QFormLayout()
+            for label, key, widget_cls, settings in specs:
+                field = widget_cls()
+                for attr, value in settings.items():
+                    getattr(field, f"set{attr[0].upper()}{attr[1:]}")(value)
+                form.addRow(label, field)
+                fields[key] = field
+            layout.addLayout(form)
 
         layout.addStretch()
         scroll.setWidget(scroll_widget)
@@ -2378,41 +3246,51 @@ class MainWindow(QMainWindow):
 
         def create_product():
             try:
-                if not name_input.text().strip():
+                name = fields["name"].text().strip()
+                sku = fields["sku"].text().strip()
+                nafdac = fields["nafdac"].text().strip()
+                if not name:
                     QMessageBox.warning(dialog, "Validation", "Product name is required")
                     return
-                if not sku_input.text().strip():
+                if not sku:
                     QMessageBox.warning(dialog, "Validation", "SKU is required")
                     return
-                if not nafdac_input.text().strip():
+                if not nafdac:
                     QMessageBox.warning(dialog, "Validation", "NAFDAC number is required")
                     return
-                if min_stock_input.value() > max_stock_input.value():
+                if fields["min_stock"].value() > fields["max_stock"].value():
                     QMessageBox.warning(dialog, "Validation", "Min stock cannot exceed max stock")
                     return
 
+                selling = fields["selling"].value()
+                retail = fields["retail"].value()
+                bulk_price = fields["bulk_price"].value()
+                wholesale_price = fields["wholesale_price"].value()
+                reorder = fields["reorder"].value()
+
                 # Use retail price as fallback if not set
-                retail_price = Decimal(str(retail_input.value())) if retail_input.value() > 0 else Decimal(str(selling_input.value()))
+                retail_price = _money(retail) if retail > 0 else _money(selling)
 
                 product = self.product_service.create_product(
-                    name=name_input.text().strip(),
-                    sku=sku_input.text().strip(),
-                    cost_price=Decimal(str(cost_input.value())),
-                    selling_price=Decimal(str(selling_input.value())),
-                    nafdac_number=nafdac_input.text().strip(),
-                    generic_name=generic_input.text().strip(),
-                    barcode=barcode_input.text().strip(),
-                    description=description_input.toPlainText().strip(),
+                    name=name,
+                    sku=sku,
+                    cost_price=_money(fields["cost"].value()),
+                    selling_price=_money(selling),
+                    nafdac_number=nafdac,
+                    generic_name=fields["generic"].text().strip(),
+                    barcode=fields["barcode"].text().strip(),
+                    description=fields["description"].toPlainText().strip(),
                     retail_price=retail_price,
-                    bulk_price=Decimal(str(bulk_price_input.value())) if bulk_price_input.value() > 0 else None,
-                    bulk_quantity=bulk_qty_input.value() if bulk_price_input.value() > 0 else None,
-                    wholesale_price=Decimal(str(wholesale_price_input.value())) if wholesale_price_input.value() > 0 else None,
-                    wholesale_quantity=wholesale_qty_input.value() if wholesale_price_input.value() > 0 else None,
-                    min_stock=min_stock_input.value(),
-                    max_stock=max_stock_input.value(),
-                    reorder_level=reorder_input.value() if reorder_input.value() > 0 else None,
+                    bulk_price=_money(bulk_price) if bulk_price > 0 else None,
+                    bulk_quantity=fields["bulk_qty"].value() if bulk_price > 0 else None,
+                    wholesale_price=_money(wholesale_price) if wholesale_price > 0 else None,
+                    wholesale_quantity=fields["wholesale_qty"].value() if wholesale_price > 0 else None,
+                    min_stock=fields["min_stock"].value(),
+                    max_stock=fields["max_stock"].value(),
+                    reorder_level=reorder if reorder > 0 else None,
                 )
                 QMessageBox.information(dialog, "Success", f"Product created: {product['name']}\n\nRetail: ₦{product['retail_price']}\nBulk: ₦{product['bulk_price']}\nWholesale: ₦{product['wholesale_price']}\nStock Alerts: {product['min_stock']}-{product['max_stock']}")
+                self.invalidate_products_cache()
                 self.load_products_table()
                 dialog.accept()
             except Exception as e:
@@ -2430,8 +3308,43 @@ class MainWindow(QMainWindow):
         dialog.setLayout(main_layout)
         dialog.exec_()
 
+    @property
+    def primary_store(self) -> Optional[dict]:
+        """The primary store, queried once per window after it exists.
+
+        A missing store is not remembered, so a store created or restored
+        later is picked up on the next lookup.
+        """
+        store = self.__dict__.get("primary_store")
+        if store is None:
+            store = self.store_service.get_primary_store()
+            if store is not None:
+                self.__dict__["primary_store"] = store
+        return store
+
+    def invalidate_primary_store(self) -> None:
+        """Drop the cached primary store after a store edit or restore."""
+        self.__dict__.pop("primary_store", None)
+        _catalog_cache.clear()
+
+    def _get_exporter(self) -> ProductImportExporter:
+        """Return the shared ProductImportExporter, creating it on first use."""
+        if self._exporter is None:
+            self._exporter = ProductImportExporter(self.db_path)
+        return self._exporter
+
+    def _import_in_progress(self) -> bool:
+        """Warn and return True while a background import is using the exporter."""
+        if self._import_thread is None:
+            return False
+        QMessageBox.warning(self, "Import Running", "Please wait for the current import to finish.")
+        return True
+
     def show_import_dialog(self) -> None:
         """Show dialog to import products."""
+        if self._import_in_progress():
+            return
+
         file_filter = "CSV Files (*.csv);;JSON Files (*.json);;All Files (*.*)"
         filepath, selected_filter = QFileDialog.getOpenFileName(
             self, "Import Products", "", file_filter
@@ -2441,18 +3354,8 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            exporter = ProductImportExporter(self.db_path)
-            
-            # Validate file first
+            exporter = self._get_exporter()
             file_format = "csv" if filepath.endswith(".csv") else "json"
-            is_valid, errors = exporter.validate_file(filepath, file_format)
-            
-            if not is_valid:
-                error_msg = "Validation errors:\n\n" + "\n".join(errors[:10])
-                if len(errors) > 10:
-                    error_msg += f"\n... and {len(errors) - 10} more errors"
-                QMessageBox.warning(self, "Validation Failed", error_msg)
-                return
 
             # Ask to update existing
             reply = QMessageBox.question(
@@ -2463,28 +3366,68 @@ class MainWindow(QMainWindow):
             )
             update_existing = reply == QMessageBox.Yes
 
-            # Import
-            if file_format == "csv":
-                imported_count, errors = exporter.import_from_csv(filepath, update_existing)
-            else:
-                imported_count, errors = exporter.import_from_json(filepath, update_existing)
-
-            # Show results
-            msg = f"Imported: {imported_count} products\n"
-            if errors:
-                msg += f"\nErrors: {len(errors)}\n"
-                msg += "\n".join(errors[:5])
-                if len(errors) > 5:
-                    msg += f"\n... and {len(errors) - 5} more errors"
-
-            QMessageBox.information(self, "Import Complete", msg)
-            self.load_products_table()
+            # Validate and import in a single pass over the file, off the GUI thread
+            self._import_progress = QProgressDialog("Importing products...", "Cancel", 0, 0, self)
+            self._import_progress.setWindowTitle("Import Products")
+            self._import_progress.setWindowModality(Qt.WindowModal)
+            self._import_progress.setMinimumDuration(0)
+
+            self._import_thread = QThread(self)
+            self._import_worker = ImportWorker(exporter, filepath, file_format, update_existing)
+            self._import_worker.moveToThread(self._import_thread)
+            self._import_thread.started.connect(self._import_worker.run)
+            self._import_worker.progress.connect(self._on_import_progress)
+            self._import_worker.done.connect(self._on_import_done)
+            self._import_worker.done.connect(self._import_thread.quit)
+            self._import_thread.finished.connect(self._on_import_thread_finished)
+            self._import_progress.canceled.connect(self._cancel_import)
+
+            self._import_thread.start()
+            self._import_progress.show()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Import failed: {str(e)}")
 
+    def _on_import_progress(self, rows_read: int) -> None:
+        self._import_progress.setLabelText(f"Importing products... {rows_read} rows processed")
+
+    def _cancel_import(self) -> None:
+        """Ask the running import to stop; it rolls back at the next row."""
+        if self._import_worker is not None:
+            self._import_worker._abort = True
+
+    def _on_import_thread_finished(self) -> None:
+        # Release the worker only once its thread has fully stopped
+        self._import_thread.deleteLater()
+        self._import_thread = None
+        self._import_worker = None
+
+    def _on_import_done(self, imported_count: int, errors: list, notices: list) -> None:
+        """Show import results once ImportWorker finishes."""
+        self._import_progress.close()
+
+        # Show results; only imports with problems to review need a dialog,
+        # notices just ride along with the summary
+        if errors:
+            msg = f"Imported: {imported_count} products\n"
+            if notices:
+                msg += "\n".join(notices) + "\n"
+            msg += f"\nErrors: {len(errors)}\n"
+            msg += "\n".join(errors[:10])
+            if len(errors) > 10:
+                msg += f"\n... and {len(errors) - 10} more errors"
+            QMessageBox.information(self, "Import Complete", msg)
+        else:
+            summary = "; ".join([f"Imported: {imported_count} products"] + notices)
+            self.statusBar().showMessage(summary, 5000)
+        self.invalidate_products_cache()
+        self.load_products_table()
+
     def export_products_csv(self) -> None:
         """Export products to CSV file."""
+        if self._import_in_progress():
+            return
+
         filepath, _ = QFileDialog.getSaveFileName(
             self, "Export Products", "products.csv", "CSV Files (*.csv)"
         )
@@ -2493,7 +3436,7 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            exporter = ProductImportExporter(self.db_path)
+            exporter = self._get_exporter()
             success, message = exporter.export_to_csv(filepath)
             if success:
                 QMessageBox.information(self, "Export Success", message)
@@ -2504,6 +3447,9 @@ class MainWindow(QMainWindow):
 
     def export_products_json(self) -> None:
         """Export products to JSON file."""
+        if self._import_in_progress():
+            return
+
         filepath, _ = QFileDialog.getSaveFileName(
             self, "Export Products", "products.json", "JSON Files (*.json)"
         )
@@ -2512,7 +3458,7 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            exporter = ProductImportExporter(self.db_path)
+            exporter = self._get_exporter()
             success, message = exporter.export_to_json(filepath)
             if success:
                 QMessageBox.information(self, "Export Success", message)
@@ -2528,7 +3474,7 @@ class MainWindow(QMainWindow):
 
         # Title
         title = QLabel("REPORTS & ANALYTICS")
-        title.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        title.setProperty("role", "page-title")
         layout.addWidget(title)
 
         # Date range selector
@@ -2544,6 +3490,15 @@ class MainWindow(QMainWindow):
         date_layout.addStretch()
         layout.addLayout(date_layout)
 
+        # Date edits emit on every step while scrolling; coalesce a burst of
+        # changes to either date into one refresh
+        self._report_refresh_timer = QTimer(widget)
+        self._report_refresh_timer.setSingleShot(True)
+        self._report_refresh_timer.setInterval(REPORT_REFRESH_DELAY_MS)
+        self._report_refresh_timer.timeout.connect(self._refresh_all_reports)
+        self.report_start_date.dateChanged.connect(self._report_refresh_timer.start)
+        self.report_end_date.dateChanged.connect(self._report_refresh_timer.start)
+
         # Tab widget for different report types
         report_tabs = QTabWidget()
 
@@ -2553,11 +3508,11 @@ class MainWindow(QMainWindow):
         
         daily_sales_summary = QVBoxLayout()
         daily_summary_label = QLabel("Today's Sales Summary")
-        daily_summary_label.setStyleSheet("font-size: 12px; font-weight: bold;")
+        daily_summary_label.setProperty("role", "panel-title")
         daily_sales_summary.addWidget(daily_summary_label)
         
         summary_frame = QFrame()
-        summary_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 5px; padding: 15px;")
+        summary_frame.setProperty("role", "panel")
         summary_grid = QGridLayout(summary_frame)
         
         self.today_sales_count = QLabel("Transactions: 0")
@@ -2592,7 +3547,7 @@ class MainWindow(QMainWindow):
         product_movement_layout = QVBoxLayout(product_movement_widget)
         
         movement_label = QLabel("Top Selling Products (Last 30 Days)")
-        movement_label.setStyleSheet("font-size: 12px; font-weight: bold;")
+        movement_label.setProperty("role", "panel-title")
         product_movement_layout.addWidget(movement_label)
         
         self.product_movement_table = QTableWidget()
@@ -2613,15 +3568,15 @@ class MainWindow(QMainWindow):
         revenue_layout = QVBoxLayout(revenue_widget)
         
         revenue_label = QLabel("Revenue Tracking")
-        revenue_label.setStyleSheet("font-size: 12px; font-weight: bold;")
+        revenue_label.setProperty("role", "panel-title")
         revenue_layout.addWidget(revenue_label)
         
         revenue_frame = QFrame()
-        revenue_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 5px; padding: 15px;")
+        revenue_frame.setProperty("role", "panel")
         revenue_grid = QGridLayout(revenue_frame)
         
         self.total_revenue = QLabel("Total Revenue: ₦0.00")
-        self.total_revenue.setStyleSheet("font-size: 13px; font-weight: bold; color: #28a745;")
+        self.total_revenue.setProperty("role", "revenue-total")
         self.total_transactions = QLabel("Total Transactions: 0")
         self.payment_breakdown = QLabel("Payment Methods: Cash: 0 | Card: 0 | Transfer: 0 | Credit: 0")
         
@@ -2649,6 +3604,12 @@ class MainWindow(QMainWindow):
         widget.setLayout(layout)
         return widget
 
+    def _refresh_all_reports(self) -> None:
+        """Refresh every report after the date range changes."""
+        self.refresh_daily_sales()
+        self.refresh_product_movement()
+        self.refresh_revenue_report()
+
     def refresh_daily_sales(self) -> None:
         """Refresh and display today's sales data."""
         try:
@@ -2658,21 +3619,21 @@ class MainWindow(QMainWindow):
             self.today_sales_revenue.setText("Revenue: ₦0.00")
             self.today_sales_items.setText("Items Sold: 0")
             self.today_avg_transaction.setText("Avg Transaction: ₦0.00")
-            QMessageBox.information(self, "Info", "Daily sales data updated")
+            self.statusBar().showMessage("Daily sales data updated", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh daily sales: {str(e)}")
 
     def refresh_product_movement(self) -> None:
         """Refresh and display product movement data."""
         try:
-            QMessageBox.information(self, "Info", "Product movement data updated")
+            self.statusBar().showMessage("Product movement data updated", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh product movement: {str(e)}")
 
     def refresh_revenue_report(self) -> None:
         """Refresh and display revenue tracking data."""
         try:
-            QMessageBox.information(self, "Info", "Revenue report updated")
+            self.statusBar().showMessage("Revenue report updated", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh revenue report: {str(e)}")
 
@@ -2683,7 +3644,7 @@ class MainWindow(QMainWindow):
 
         # Title
         title = QLabel("ADMIN PANEL")
-        title.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
+        title.setProperty("role", "page-title")
         layout.addWidget(title)
 
         # Admin tab widget for different sections
@@ -2694,12 +3655,12 @@ class MainWindow(QMainWindow):
         user_mgmt_layout = QVBoxLayout(user_mgmt_widget)
 
         user_title = QLabel("User Management")
-        user_title.setStyleSheet("font-size: 12px; font-weight: bold;")
+        user_title.setProperty("role", "panel-title")
         user_mgmt_layout.addWidget(user_title)
 
         # Add new user section
         add_user_frame = QFrame()
-        add_user_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 5px; padding: 10px;")
+        add_user_frame.setProperty("role", "panel-compact")
         add_user_layout = QGridLayout(add_user_frame)
 
         add_user_layout.addWidget(QLabel("Username:"), 0, 0)
@@ -2736,18 +3697,21 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", f"Failed to create user: {str(e)}")
 
         add_user_btn = QPushButton("Add User")
-        add_user_btn.setStyleSheet("background-color: #28a745; color: white; font-weight: bold;")
+        add_user_btn.setProperty("role", "success")
         add_user_btn.clicked.connect(add_new_user)
         add_user_layout.addWidget(add_user_btn, 2, 0, 1, 4)
 
         user_mgmt_layout.addWidget(add_user_frame)
 
-        # Users table
-        users_table = QTableWidget()
-        users_table.setColumnCount(6)
-        users_table.setHorizontalHeaderLabels(
-            ["Username", "Full Name", "Role", "Status", "Created", "Actions"]
-        )
+        # Users table: rows come from a model and the action buttons are
+        # painted by a delegate, so no widgets are created per user
+        users_model = UserTableModel(self)
+        users_table = QTableView()
+        users_table.setModel(users_model)
+        users_actions = UserActionsDelegate(users_table)
+        users_actions.edit_requested.connect(self.edit_user)
+        users_actions.disable_requested.connect(self.disable_user)
+        users_table.setItemDelegateForColumn(UserTableModel.ACTIONS_COLUMN, users_actions)
         users_table.setColumnWidth(0, 120)
         users_table.setColumnWidth(1, 150)
         users_table.setColumnWidth(2, 100)
@@ -2763,31 +3727,7 @@ class MainWindow(QMainWindow):
                 {"username": "cashier1", "name": "John Doe", "role": "cashier", "status": "Active", "created": "2024-01-15"},
                 {"username": "manager1", "name": "Jane Smith", "role": "manager", "status": "Active", "created": "2024-01-20"},
             ]
-            
-            users_table.setRowCount(len(sample_users))
-            for i, user in enumerate(sample_users):
-                users_table.setItem(i, 0, QTableWidgetItem(user["username"]))
-                users_table.setItem(i, 1, QTableWidgetItem(user["name"]))
-                users_table.setItem(i, 2, QTableWidgetItem(user["role"]))
-                users_table.setItem(i, 3, QTableWidgetItem(user["status"]))
-                users_table.setItem(i, 4, QTableWidgetItem(user["created"]))
-                
-                # Actions buttons
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout(actions_widget)
-                actions_layout.setContentsMargins(0, 0, 0, 0)
-                
-                edit_btn = QPushButton("Edit")
-                edit_btn.setMaximumWidth(60)
-                edit_btn.clicked.connect(lambda checked, u=user["username"]: self.edit_user(u))
-                actions_layout.addWidget(edit_btn)
-                
-                disable_btn = QPushButton("Disable")
-                disable_btn.setMaximumWidth(70)
-                disable_btn.clicked.connect(lambda checked, u=user["username"]: self.disable_user(u))
-                actions_layout.addWidget(disable_btn)
-                
-                users_table.setCellWidget(i, 5, actions_widget)
+            users_model.set_users(sample_users)
 
         refresh_user_table()
         user_mgmt_layout.addWidget(users_table)
@@ -2799,11 +3739,11 @@ class MainWindow(QMainWindow):
         settings_layout = QVBoxLayout(settings_widget)
 
         settings_title = QLabel("System Settings")
-        settings_title.setStyleSheet("font-size: 12px; font-weight: bold;")
+        settings_title.setProperty("role", "panel-title")
         settings_layout.addWidget(settings_title)
 
         settings_frame = QFrame()
-        settings_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 5px; padding: 15px;")
+        settings_frame.setProperty("role", "panel")
         settings_grid = QGridLayout(settings_frame)
 
         # Store settings
@@ -2848,7 +3788,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
 
         save_settings_btn = QPushButton("Save Settings")
-        save_settings_btn.setStyleSheet("background-color: #007bff; color: white; font-weight: bold;")
+        save_settings_btn.setProperty("role", "primary")
         save_settings_btn.clicked.connect(save_settings)
         settings_grid.addWidget(save_settings_btn, 6, 0, 1, 2)
 
@@ -2862,22 +3802,22 @@ class MainWindow(QMainWindow):
         export_layout = QVBoxLayout(export_widget)
 
         export_title = QLabel("Data Export & Backup")
-        export_title.setStyleSheet("font-size: 12px; font-weight: bold;")
+        export_title.setProperty("role", "panel-title")
         export_layout.addWidget(export_title)
 
         export_frame = QFrame()
-        export_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 5px; padding: 15px;")
+        export_frame.setProperty("role", "panel")
         export_grid = QGridLayout(export_frame)
 
         # Export options
         export_grid.addWidget(QLabel("Export Type:"), 0, 0)
         export_type_combo = QComboBox()
-        export_type_combo.addItems(["Sales Data", "Inventory Data", "User Data", "All Data"])
+        export_type_combo.addItems(list(DATA_EXPORT_TABLES))
         export_grid.addWidget(export_type_combo, 0, 1)
 
         export_grid.addWidget(QLabel("Format:"), 1, 0)
         format_combo = QComboBox()
-        format_combo.addItems(["CSV", "Excel (.xlsx)", "JSON"])
+        format_combo.addItems(list(DATA_EXPORT_FORMATS))
         export_grid.addWidget(format_combo, 1, 1)
 
         export_grid.addWidget(QLabel("Date Range:"), 2, 0)
@@ -2891,55 +3831,129 @@ class MainWindow(QMainWindow):
         date_range_layout.addWidget(export_end_date)
         export_grid.addLayout(date_range_layout, 2, 1)
 
+        def on_export_type_changed(export_type):
+            dated = export_type == "Sales Data"
+            export_start_date.setEnabled(dated)
+            export_end_date.setEnabled(dated)
+
+        export_type_combo.currentTextChanged.connect(on_export_type_changed)
+        on_export_type_changed(export_type_combo.currentText())
+
         def export_data():
-            try:
-                export_type = export_type_combo.currentText()
-                file_format = format_combo.currentText()
-                start_date = export_start_date.date().toString("yyyy-MM-dd")
-                end_date = export_end_date.date().toString("yyyy-MM-dd")
-                
-                filename = f"export_{export_type.replace(' ', '_')}_{start_date}_to_{end_date}.{file_format.split('.')[-1] if '.' in file_format else file_format.lower()}"
-                
-                QMessageBox.information(self, "Success", f"Data exported to {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export data: {str(e)}")
+            export_type = export_type_combo.currentText()
+            date_range = None
+            filename = f"export_{export_type.replace(' ', '_').lower()}"
+            if export_type == "Sales Data":
+                date_range = (
+                    export_start_date.date().toPyDate(),
+                    export_end_date.date().toPyDate(),
+                )
+                filename += f"_{date_range[0]}_to_{date_range[1]}"
+
+            success, message, file_path = ExportManager().export_tables(
+                DATA_EXPORT_TABLES[export_type],
+                filename,
+                DATA_EXPORT_FORMATS[format_combo.currentText()],
+                db_path=self.db_path,
+                date_range=date_range,
+            )
+            if success:
+                QMessageBox.information(self, "Success", f"{message}\n\nSaved in: {file_path.parent}")
+            else:
+                QMessageBox.critical(self, "Error", message)
 
         export_btn = QPushButton("Export Data")
-        export_btn.setStyleSheet("background-color: #17a2b8; color: white; font-weight: bold;")
+        export_btn.setProperty("role", "info")
         export_btn.clicked.connect(export_data)
         export_grid.addWidget(export_btn, 3, 0, 1, 2)
 
         export_layout.addWidget(export_frame)
 
         # Backup section
+        export_layout.addSpacing(20)
         backup_frame = QFrame()
-        backup_frame.setStyleSheet("border: 1px solid #ddd; border-radius: 5px; padding: 15px; margin-top: 20px;")
+        backup_frame.setProperty("role", "panel")
         backup_grid = QGridLayout(backup_frame)
 
         backup_grid.addWidget(QLabel("Database Backup & Restore"), 0, 0, 1, 2)
-        backup_grid.addWidget(QLabel("Status: Database last backed up on 2024-01-25 at 10:30 AM"), 1, 0, 1, 2)
+        backup_status = QLabel("Status: No backup made this session")
+        backup_grid.addWidget(backup_status, 1, 0, 1, 2)
+
+        def run_with_progress(title, copy):
+            # BackupManager copies BACKUP_PAGES pages per step; the dialog is
+            # updated (and polled for Cancel) between steps
+            progress_dialog = QProgressDialog(f"{title}...", "Cancel", 0, 0, self)
+            progress_dialog.setWindowTitle(title)
+            progress_dialog.setWindowModality(Qt.WindowModal)
+            progress_dialog.setMinimumDuration(0)
+
+            def on_progress(done, total):
+                progress_dialog.setMaximum(total)
+                progress_dialog.setValue(done)
+                QApplication.processEvents()
 
-        def backup_database():
             try:
-                # Create database backup
-                QMessageBox.information(self, "Success", "Database backed up successfully")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Backup failed: {str(e)}")
+                result = copy(progress=on_progress, should_abort=progress_dialog.wasCanceled)
+                # Read before close(), which itself marks the dialog canceled
+                cancelled = progress_dialog.wasCanceled()
+            finally:
+                progress_dialog.close()
+            return result, cancelled
+
+        def backup_database():
+            backup_manager = BackupManager(self.db_path)
+            (success, message, _), cancelled = run_with_progress(
+                "Backing up database", backup_manager.create_backup
+            )
+            if success:
+                backup_status.setText(
+                    f"Status: Database last backed up on {time.strftime('%Y-%m-%d at %I:%M %p')}"
+                )
+                QMessageBox.information(self, "Success", message)
+            elif not cancelled:
+                QMessageBox.critical(self, "Error", message)
 
         def restore_database():
-            try:
-                # Restore database from backup
-                QMessageBox.information(self, "Success", "Database restored successfully")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Restore failed: {str(e)}")
+            backup_manager = BackupManager(self.db_path)
+            path, _ = QFileDialog.getOpenFileName(
+                self, "Restore Database", str(backup_manager.backup_dir),
+                "SQLite Database (*.db);;All Files (*)"
+            )
+            if not path:
+                return
+            reply = QMessageBox.question(
+                self,
+                "Confirm Restore",
+                "Restoring replaces ALL current data with the contents of the backup.\n\nContinue?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No,
+            )
+            if reply != QMessageBox.Yes:
+                return
+
+            (success, message), cancelled = run_with_progress(
+                "Restoring database",
+                lambda **callbacks: backup_manager.restore_backup(Path(path), **callbacks),
+            )
+            if success:
+                # Every cache was filled from the replaced database
+                self.invalidate_products_cache()
+                self.invalidate_primary_store()
+                self.refresh_inventory_table()
+                self.load_sales_products()
+                self.load_products_table()
+                self.load_dashboard_data()
+                QMessageBox.information(self, "Success", message)
+            elif not cancelled:
+                QMessageBox.critical(self, "Error", message)
 
         backup_btn = QPushButton("Backup Database")
-        backup_btn.setStyleSheet("background-color: #28a745; color: white; font-weight: bold;")
+        backup_btn.setProperty("role", "success")
         backup_btn.clicked.connect(backup_database)
         backup_grid.addWidget(backup_btn, 2, 0)
 
         restore_btn = QPushButton("Restore Database")
-        restore_btn.setStyleSheet("background-color: #ffc107; color: black; font-weight: bold;")
+        restore_btn.setProperty("role", "warning")
         restore_btn.clicked.connect(restore_database)
         backup_grid.addWidget(restore_btn, 2, 1)
 
@@ -2996,115 +4010,125 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             QMessageBox.information(self, "Success", f"User '{username}' disabled")
 
-    def load_dashboard_data(self) -> None:
-        """Load and display dashboard data."""
-        try:
-            # Get store info
-            store = self.store_service.get_primary_store()
-            if not store:
-                return
-
-            # Get inventory alerts
-            alerts_service = InventoryAlerts(self.db_path)
-            alerts = alerts_service.generate_alerts(store["id"])
-
-            # Update dashboard table
-            self.dashboard_table.setRowCount(len(alerts["alerts"]))
-            for i, alert in enumerate(alerts["alerts"]):
-                self.dashboard_table.setItem(i, 0, QTableWidgetItem(alert["type"].upper()))
-                self.dashboard_table.setItem(i, 1, QTableWidgetItem(alert["message"]))
+    def closeEvent(self, event) -> None:
+        """Release the long-lived alerts session and printer when the window closes."""
+        if self._dashboard_loader is not None:
+            # The loader is still using the alerts session: drop it if it has
+            # not started, otherwise let it finish before the session closes.
+            # Clearing the field makes its late result go unreported.
+            pool = QThreadPool.globalInstance()
+            if not pool.tryTake(self._dashboard_loader):
+                pool.waitForDone()
+            self._dashboard_loader = None
+        self.alerts_service.close()
+        self._close_printer()
+        super().closeEvent(event)
 
-            # Update alerts table
-            self.alerts_table.setRowCount(len(alerts["alerts"]))
-            for i, alert in enumerate(alerts["alerts"]):
-                self.alerts_table.setItem(i, 0, QTableWidgetItem(alert["type"]))
-                self.alerts_table.setItem(i, 1, QTableWidgetItem(alert["message"]))
+    def load_dashboard_data(self) -> None:
+        """Load dashboard data in the background; tables fill when it arrives."""
+        if self._dashboard_loader is not None:
+            return
 
-            alerts_service.close()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load dashboard: {str(e)}")
+        store = self.primary_store
+        if not store:
+            self._on_dashboard_loaded({"alerts": []})
+            return
 
-    def load_sales_products(self) -> None:
-        """Load all products into the sales product grid."""
-        try:
-            products = self.product_service.get_all_products(active_only=True)
-            
-            # Clear existing cards
-            while self.products_cards_layout.count():
-                item = self.products_cards_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            # Create product cards (2 columns for larger cards)
-            for i, product in enumerate(products):
-                card = self.create_product_card(product)
-                row = i // 2
-                col = i % 2
-                self.products_cards_layout.addWidget(card, row, col)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load products: {str(e)}")
+        self._dashboard_loader = DashboardLoader(self.alerts_service, store["id"])
+        self._dashboard_loader.signals.loaded.connect(self._on_dashboard_loaded)
+        self._dashboard_loader.signals.failed.connect(self._on_dashboard_failed)
+        QThreadPool.globalInstance().start(self._dashboard_loader)
+
+    def _on_dashboard_loaded(self, alerts: dict) -> None:
+        """Display dashboard alerts fetched by DashboardLoader."""
+        self._dashboard_loader = None
+
+        # One pass over the alerts feeds both grids; each repaints once
+        dashboard_rows = []
+        alert_rows = []
+        for alert in alerts["alerts"]:
+            dashboard_rows.append((alert["type"].upper(), alert["message"]))
+            alert_rows.append((alert["type"], alert["message"]))
+        self.dashboard_model.set_rows(dashboard_rows)
+        self.alerts_model.set_rows(alert_rows)
+
+    def _on_dashboard_failed(self, error: str) -> None:
+        if self._dashboard_loader is None:
+            return  # Window closed while the load was running
+        self._dashboard_loader = None
+        QMessageBox.critical(self, "Error", f"Failed to load dashboard: {error}")
+
+    def _set_products_cache(self, products: list) -> None:
+        """Store a fresh catalog snapshot and rebuild the barcode/SKU indexes."""
+        self._products_cache = (time.monotonic(), products)
+        self._all_products = products
+        self._products_by_barcode = {
+            p["barcode"].strip(): p for p in products if p.get("barcode")
+        }
+        self._products_by_sku = {p["sku"].strip(): p for p in products if p.get("sku")}
+        # Lowercased name/SKU/barcode per product, so filtering never re-lowers
+        self._product_search_keys = [
+            (
+                "\x1f".join((p["name"], p.get("sku") or "", p.get("barcode") or "")).lower(),
+                p,
+            )
+            for p in products
+        ]
+        self._last_product_search = ("", [])
 
-    def create_product_card(self, product: dict) -> QWidget:
-        """Create a clickable product card for the sales grid."""
-        card = QWidget()
-        card.setStyleSheet("""
-            QWidget {
-                background-color: #ffffff;
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 15px;
-            }
-            QWidget:hover {
-                background-color: #f0f7ff;
-                border: 2px solid #4472C4;
-                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            }
-        """)
-        card.setCursor(Qt.PointingHandCursor)
-        card.setMinimumHeight(220)
-        layout = QVBoxLayout(card)
-        layout.setSpacing(8)
-        layout.setContentsMargins(10, 10, 10, 10)
+    def _products_cache_fresh(self) -> bool:
+        return (
+            self._products_cache is not None
+            and time.monotonic() - self._products_cache[0] < PRODUCTS_CACHE_TTL
+        )
 
-        # Product image placeholder
-        image_label = QLabel()
-        image_label.setMinimumHeight(120)
-        image_label.setStyleSheet("background-color: #e8e8e8; border-radius: 5px; font-size: 9px;")
-        image_label.setAlignment(Qt.AlignCenter)
-        image_label.setText("📦 No Image")
-        layout.addWidget(image_label)
+    def _get_products_cached(self) -> list:
+        """Return the active catalog, refetching only once the cache has expired."""
+        if not self._products_cache_fresh():
+            self._set_products_cache(self.product_service.get_all_products(active_only=True))
+        return self._products_cache[1]
 
-        # Product name
-        name_label = QLabel(product['name'])
-        name_label.setWordWrap(True)
-        name_label.setStyleSheet("font-weight: bold; font-size: 8px; color: #333;")
-        layout.addWidget(name_label)
+    def invalidate_products_cache(self) -> None:
+        """Force the next catalog lookup to hit the database."""
+        self._products_cache = None
+        # Sales and imports write through their own sessions
+        self.ref_cache.clear()
+        _catalog_cache.clear()
 
-        # Stock info
-        stock_label = QLabel(f"Stock: {product.get('quantity', 0)} units")
-        stock_label.setStyleSheet("font-size: 7px; color: #666; font-weight: 500;")
-        layout.addWidget(stock_label)
+    def load_sales_products(self) -> None:
+        """Load all products into the sales product grid in the background."""
+        if self._sales_products_loader is not None:
+            return
+        if self._products_cache_fresh():
+            self._do_product_search()
+            return
 
-        # Price
-        price_label = QLabel(f"₦{product.get('retail_price', product.get('selling_price', 0)):.2f}")
-        price_label.setStyleSheet("font-weight: bold; font-size: 9px; color: #28a745; padding: 5px 0px;")
-        layout.addWidget(price_label)
+        self._sales_products_loader = SalesProductsLoader(self.db_path)
+        self._sales_products_loader.signals.loaded.connect(self._on_sales_products_loaded)
+        self._sales_products_loader.signals.failed.connect(self._on_sales_products_failed)
+        QThreadPool.globalInstance().start(self._sales_products_loader)
 
-        # Store product data on card
-        card.product_id = product['id']
-        card.product_name = product['name']
-        card.product_price = float(product.get('retail_price', product.get('selling_price', 0)))
+    def _on_sales_products_loaded(self, products: list) -> None:
+        """Display the catalog fetched by SalesProductsLoader."""
+        self._sales_products_loader = None
+        self._set_products_cache(products)
+        self._do_product_search()
 
-        # Make card clickable
-        def on_card_clicked():
-            self.add_product_to_sales_cart(product)
-        
-        card.mousePressEvent = lambda event: on_card_clicked()
+    def _on_sales_products_failed(self, error: str) -> None:
+        self._sales_products_loader = None
+        QMessageBox.critical(self, "Error", f"Failed to load products: {error}")
 
-        return card
+    def _cart_locked(self) -> bool:
+        """True while SaleWorker is recording the cart; edits wait until it finishes."""
+        if self._sale_worker is None:
+            return False
+        self.statusBar().showMessage("Sale in progress - the cart can be changed once it completes", 3000)
+        return True
 
     def add_product_to_sales_cart(self, product: dict) -> None:
         """Add product to sales cart with stock level checking."""
+        if self._cart_locked():
+            return
         try:
             # Check available stock before adding
             available_stock = product.get('quantity', 0)
@@ -3120,103 +4144,41 @@ class MainWindow(QMainWindow):
             else:
                 self.low_stock_bar.setVisible(False)
             
-            # Check if product already in cart
-            for row in range(self.sales_cart_table.rowCount()):
-                name_item = self.sales_cart_table.item(row, 1)
-                if name_item and name_item.text() == product['name']:
-                    # Check if incrementing would exceed available stock
-                    qty_item = self.sales_cart_table.item(row, 3)
-                    current_qty = int(qty_item.text())
-                    if current_qty + 1 > available_stock:
-                        QMessageBox.warning(self, "Insufficient Stock",
-                            f"Only {available_stock} unit(s) available for {product['name']}\n"
-                            f"Currently adding: {current_qty + 1}")
-                        return
-                    # Increment quantity
-                    qty_item.setText(str(current_qty + 1))
-                    # Update total
-                    price = float(self.sales_cart_table.item(row, 2).text().replace('₦', '').strip())
-                    new_qty = current_qty + 1
-                    total = price * new_qty
-                    self.sales_cart_table.setItem(row, 5, QTableWidgetItem(f"₦{total:.2f}"))
-                    self.update_sales_summary()
-                    return
+            # Check if incrementing would exceed available stock
+            in_cart = self.cart_model.quantity_of(product['id'])
+            if in_cart + 1 > available_stock:
+                QMessageBox.warning(self, "Insufficient Stock",
+                    f"Only {available_stock} unit(s) available for {product['name']}\n"
+                    f"Currently adding: {in_cart + 1}")
+                return
 
-            # Add new row to cart
-            row = self.sales_cart_table.rowCount()
-            self.sales_cart_table.insertRow(row)
             price = float(product.get('retail_price', product.get('selling_price', 0)))
-            # Item # (row number)
-            item_num = QTableWidgetItem(str(row + 1))
-            item_num.setTextAlignment(Qt.AlignCenter)
-            item_num.setFont(QFont("Arial", 9, QFont.Bold))
-            self.sales_cart_table.setItem(row, 0, item_num)
-            # Product Name
-            name_item = QTableWidgetItem(product['name'])
-            name_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.sales_cart_table.setItem(row, 1, name_item)
-            name_item.product_id = product['id']
-            # Price
-            price_item = QTableWidgetItem(f"₦{price:.2f}")
-            price_item.setTextAlignment(Qt.AlignRight)
-            price_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.sales_cart_table.setItem(row, 2, price_item)
-            # Quantity (default 1)
-            qty_item = QTableWidgetItem("1")
-            qty_item.setTextAlignment(Qt.AlignCenter)
-            qty_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.sales_cart_table.setItem(row, 3, qty_item)
-            # Discount (default 0%)
-            discount_item = QTableWidgetItem("0%")
-            discount_item.setTextAlignment(Qt.AlignCenter)
-            discount_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.sales_cart_table.setItem(row, 4, discount_item)
-            # Total (price * 1)
-            total_item = QTableWidgetItem(f"₦{price:.2f}")
-            total_item.setTextAlignment(Qt.AlignRight)
-            total_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.sales_cart_table.setItem(row, 5, total_item)
-            # Delete button
-            delete_btn = QPushButton("Delete")
-            delete_btn.setStyleSheet("font-size: 12px; background-color: #dc3545; color: white; border-radius: 5px; padding: 6px;")
-            delete_btn.setMinimumHeight(32)
-            delete_btn.clicked.connect(lambda _, r=row: self.remove_from_cart(r))
-            self.sales_cart_table.setCellWidget(row, 6, delete_btn)
-            # Set row height for better visibility
-            self.sales_cart_table.setRowHeight(row, 48)
-            self.update_sales_summary()
+            self.cart_model.add_or_increment(product['id'], product['name'], price)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add product: {str(e)}")
 
     def remove_from_cart(self, row: int) -> None:
         """Remove item from sales cart."""
-        self.sales_cart_table.removeRow(row)
-        self.update_sales_summary()
+        if self._cart_locked():
+            return
+        self.cart_model.remove_row(row)
 
     def clear_sales_cart(self) -> None:
         """Clear all items from the sales cart."""
-        if self.sales_cart_table.rowCount() > 0:
+        if self._cart_locked():
+            return
+        if self.cart_model.rowCount() > 0:
             reply = QMessageBox.question(self, "Clear Cart", 
                 "Are you sure you want to clear the entire cart?",
                 QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                self.sales_cart_table.setRowCount(0)
-                self.update_sales_summary()
+                self.cart_model.clear()
                 self.item_scanner.clear()
                 self.item_scanner.setFocus()
 
     def update_sales_summary(self) -> None:
         """Update cart summary (subtotal, tax, total) and change calculation."""
-        subtotal = 0.0
-        
-        for row in range(self.sales_cart_table.rowCount()):
-            qty_text = self.sales_cart_table.item(row, 3).text() if self.sales_cart_table.item(row, 3) else "0"
-            price_text = self.sales_cart_table.item(row, 2).text() if self.sales_cart_table.item(row, 2) else "0"
-            
-            # Remove currency symbol if present
-            qty = int(qty_text) if qty_text else 0
-            price = float(price_text.replace('₦', '').strip()) if price_text else 0.0
-            subtotal += qty * price
+        subtotal = self.cart_model.subtotal()
 
         # Calculate tax (assuming 7.5% VAT)
         tax = subtotal * 0.075
@@ -3237,38 +4199,41 @@ class MainWindow(QMainWindow):
         
         # Display change in blue if positive, red if negative (insufficient payment)
         if change >= 0:
-            self.sales_change_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #0066cc; min-width: 100px; padding-right: 10px;")
+            self._set_change_shortfall(False)
             self.sales_change_label.setText(f"₦{change:.2f}")
         else:
-            self.sales_change_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #dc3545; min-width: 100px; padding-right: 10px;")
+            self._set_change_shortfall(True)
             self.sales_change_label.setText(f"₦{abs(change):.2f} (Shortfall)")
 
-    def on_product_search(self) -> None:
+    def _set_change_shortfall(self, shortfall: bool) -> None:
+        """Flip the change label between its normal and shortfall style."""
+        if self.sales_change_label.property("shortfall") == shortfall:
+            return
+        self.sales_change_label.setProperty("shortfall", shortfall)
+        # Dynamic properties are only re-evaluated on repolish
+        self.sales_change_label.style().unpolish(self.sales_change_label)
+        self.sales_change_label.style().polish(self.sales_change_label)
+
+    def _do_product_search(self) -> None:
         """Filter products based on search input."""
         search_text = self.product_search.text().lower()
         try:
             if search_text:
-                products = self.product_service.get_all_products(active_only=True)
-                filtered = [
-                    p for p in products 
-                    if search_text in p['name'].lower() 
-                    or search_text in p.get('sku', '').lower()
-                    or search_text in p.get('barcode', '').lower()
-                ]
+                # Extending the query can only drop matches, so only the last
+                # search's hits need checking
+                last_text, last_hits = self._last_product_search
+                if last_text and search_text.startswith(last_text):
+                    candidates = last_hits
+                else:
+                    candidates = self._product_search_keys
+                hits = [(key, p) for key, p in candidates if search_text in key]
+                self._last_product_search = (search_text, hits)
+                filtered = [p for _, p in hits]
             else:
-                filtered = self.product_service.get_all_products(active_only=True)
-            
-            # Clear and reload
-            while self.products_cards_layout.count():
-                item = self.products_cards_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            for i, product in enumerate(filtered):
-                card = self.create_product_card(product)
-                row = i // 2
-                col = i % 2
-                self.products_cards_layout.addWidget(card, row, col)
+                self._last_product_search = ("", [])
+                filtered = self._all_products
+
+            self.product_model.set_products(filtered)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Search failed: {str(e)}")
 
@@ -3279,14 +4244,12 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            # Search for product by barcode or SKU
-            all_products = self.product_service.get_all_products(active_only=True)
-            product = None
-            for p in all_products:
-                if (p.get('barcode', '').strip() == barcode_or_sku or 
-                    p.get('sku', '').strip() == barcode_or_sku):
-                    product = p
-                    break
+            # Resolve by barcode, then SKU, via the indexes built with the cache
+            self._get_products_cached()
+            product = (
+                self._products_by_barcode.get(barcode_or_sku)
+                or self._products_by_sku.get(barcode_or_sku)
+            )
             if not product:
                 QMessageBox.warning(self, "Product Not Found", 
                     f"No product found with barcode/SKU: {barcode_or_sku}")
@@ -3312,8 +4275,7 @@ class MainWindow(QMainWindow):
                 # Display cart summary
                 total_items = sum(item["quantity"] for item in self.current_cart)
                 total_amount = sum(
-                    item["quantity"] * item["unit_price"] 
-                    for item in self.current_cart
+                    (item["subtotal"] for item in self.current_cart), ZERO_MONEY
                 )
                 
                 self.sales_status.setText(
@@ -3331,9 +4293,12 @@ class MainWindow(QMainWindow):
 
     def complete_sale(self) -> None:
         """Complete sale transaction with payment."""
+        if self._sale_worker is not None:
+            return
+
         try:
             # Check if cart has items
-            if self.sales_cart_table.rowCount() == 0:
+            if self.cart_model.rowCount() == 0:
                 QMessageBox.warning(self, "Empty Cart", "Add items to cart first")
                 return
 
@@ -3341,30 +4306,12 @@ class MainWindow(QMainWindow):
             payment_method = self.sales_payment_method.currentText()
             amount_paid = self.sales_amount_paid.value()
 
-            # Extract cart items from table (new structure: Item#, Product, Price, Qty, Disc%, Total)
-            cart_items = []
-            subtotal = 0.0
-            
-            for row in range(self.sales_cart_table.rowCount()):
-                name_item = self.sales_cart_table.item(row, 1)  # Product name in column 1
-                price_item = self.sales_cart_table.item(row, 2)  # Price in column 2
-                qty_item = self.sales_cart_table.item(row, 3)  # Qty in column 3
-                
-                if name_item and price_item and qty_item:
-                    name = name_item.text()
-                    price_text = price_item.text().replace('₦', '').strip()
-                    price = float(price_text) if price_text else 0.0
-                    qty = int(qty_item.text()) if qty_item.text() else 0
-                    
-                    if qty > 0:
-                        product_id = getattr(name_item, 'product_id', None)
-                        cart_items.append({
-                            "product_id": product_id,
-                            "product_name": name,
-                            "unit_price": price,
-                            "quantity": qty,
-                        })
-                        subtotal += price * qty
+            # Cart rows already hold numeric prices/quantities; total them
+            # straight off the rows, once, and hand that subtotal on to the
+            # receipt rather than re-summing the copied dicts
+            rows = [row for row in self.cart_model.rows if row.quantity > 0]
+            subtotal = sum(row.line_total for row in rows)
+            cart_items = [asdict(row) for row in rows]
 
             if not cart_items:
                 QMessageBox.warning(self, "Empty Cart", "Add items to cart first")
@@ -3386,76 +4333,65 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            # Allocate batches using FEFO for each product
-            sales_service = SalesService(get_session())
-            inventory_service = InventoryService(get_session())
-            store = self.store_service.get_primary_store()
-            
-
-            allocated_items = []
-            for cart_item in cart_items:
-                # Get available batches for product (FEFO - earliest expiry first)
-                batches = inventory_service.get_available_batches(
-                    product_id=cart_item["product_id"],
-                    store_id=store["id"],
-                    quantity_needed=cart_item["quantity"],
-                )
-                
-                if not batches or sum(b["available_quantity"] for b in batches) < cart_item["quantity"]:
-                    QMessageBox.warning(
-                        self,
-                        "Insufficient Stock",
-                        f"Not enough stock for {cart_item['product_name']}\n"
-                        f"Needed: {cart_item['quantity']}\n"
-                        f"Available: {sum(b['available_quantity'] for b in batches)}",
-                    )
-                    return
-                
-                # Allocate from batches
-                remaining_qty = cart_item["quantity"]
-                for batch in batches:
-                    if remaining_qty <= 0:
-                        break
-                    
-                    qty_to_take = min(remaining_qty, batch["available_quantity"])
-                    allocated_items.append({
-                        "batch_id": batch["id"],
-                        "quantity": qty_to_take,
-                        "unit_price": cart_item["unit_price"],
-                    })
-                    remaining_qty -= qty_to_take
-
-            # Create sale
-            sale_result = sales_service.create_sale(
-                user_id=user_id,
+            # Allocation and the DB writes run on SaleWorker; the UI stays live.
+            # The store is resolved once here and reused for the receipt.
+            store = self.primary_store
+            self._pending_sale = {
+                "store": store,
+                "cart_items": cart_items,
+                "subtotal": subtotal,
+                "tax": tax,
+                "total_amount": total_amount,
+                "payment_method": payment_method,
+                "amount_paid": amount_paid,
+            }
+            self._sale_worker = SaleWorker(
+                cart_items,
+                user_id=self.user_session.user_id,
                 store_id=store["id"],
-                items=allocated_items,
                 payment_method=payment_method,
-                amount_paid=Decimal(str(amount_paid)),
+                amount_paid=amount_paid,
+                db_path=self.db_path,
             )
+            self._sale_worker.signals.loaded.connect(self._on_sale_completed)
+            self._sale_worker.signals.rejected.connect(self._on_sale_rejected)
+            self._sale_worker.signals.failed.connect(self._on_sale_failed)
+            self.complete_sale_btn.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            QThreadPool.globalInstance().start(self._sale_worker)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to complete sale: {str(e)}")
 
+    def _finish_sale_worker(self) -> dict:
+        """Release the checkout UI and return the totals of the finished sale."""
+        self._sale_worker = None
+        pending, self._pending_sale = self._pending_sale, None
+        QApplication.restoreOverrideCursor()
+        self.complete_sale_btn.setEnabled(True)
+        return pending
+
+    def _on_sale_completed(self, sale_result: dict) -> None:
+        """Print and confirm a sale recorded by SaleWorker, then reset the cart."""
+        pending = self._finish_sale_worker()
+        subtotal = pending["subtotal"]
+        tax = pending["tax"]
+        total_amount = pending["total_amount"]
+        amount_paid = pending["amount_paid"]
+        try:
             change = amount_paid - total_amount
-            QMessageBox.information(
-                self,
-                "Sale Completed",
-                f"Receipt #: {sale_result['receipt_number']}\n"
-                f"Subtotal: ₦{subtotal:.2f}\n"
-                f"Tax (7.5%): ₦{tax:.2f}\n"
-                f"Total: ₦{total_amount:.2f}\n"
-                f"Amount Paid: ₦{amount_paid:.2f}\n"
-                f"Change: ₦{change:.2f}",
-            )
 
             # Print receipt to thermal printer
             self.print_thermal_receipt(
                 receipt_number=sale_result['receipt_number'],
-                items=cart_items,
+                items=pending["cart_items"],
                 subtotal=subtotal,
                 tax=tax,
                 total=total_amount,
-                payment_method=payment_method,
+                payment_method=pending["payment_method"],
                 amount_paid=amount_paid,
                 change=change,
+                store=pending["store"],
             )
             
             # Display confirmation message
@@ -3470,28 +4406,43 @@ class MainWindow(QMainWindow):
                 f"Change: ₦{change:.2f}",
             )
 
+            # Stock levels changed; the next lookup must see them
+            self.invalidate_products_cache()
+
             # Clear cart and reset UI
-            self.sales_cart_table.setRowCount(0)
+            self.cart_model.clear()
             self.customer_input.clear()
             self.sales_amount_paid.setValue(0)
             self.sales_payment_method.setCurrentIndex(0)
-            self.update_sales_summary()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to complete sale: {str(e)}")
 
+    def _on_sale_rejected(self, message: str) -> None:
+        self._finish_sale_worker()
+        QMessageBox.warning(self, "Insufficient Stock", message)
+
+    def _on_sale_failed(self, error: str) -> None:
+        self._finish_sale_worker()
+        QMessageBox.critical(self, "Error", f"Failed to complete sale: {error}")
+
     def print_thermal_receipt(self, receipt_number: str, items: list, subtotal: float, tax: float, total: float,
-                              payment_method: str, amount_paid: float, change: float) -> None:
-        """Format and send the receipt to thermal printer using configured settings or file fallback."""
+                              payment_method: str, amount_paid: float, change: float,
+                              store: Optional[dict] = None) -> None:
+        """Format and send the receipt to thermal printer using configured settings or file fallback.
+
+        Pass the `store` the caller already resolved; only when it is None is
+        the primary store looked up.
+        """
         try:
-            from desktop_app.thermal_printer import ThermalPrinter, format_receipt
-            from desktop_app.config import get_printer_device_info
+            from desktop_app.thermal_printer import PrintableItem, format_receipt_lines
 
-            store = self.store_service.get_primary_store() if hasattr(self, 'store_service') else None
+            if store is None:
+                store = self.primary_store
 
-            receipt_text = format_receipt(
+            receipt_lines = format_receipt_lines(
                 receipt_number=str(receipt_number),
-                items=items,
+                items=[PrintableItem(it['product_name'], it['quantity'], float(it['unit_price'])) for it in items],
                 subtotal=subtotal,
                 tax=tax,
                 total=total,
@@ -3501,23 +4452,19 @@ class MainWindow(QMainWindow):
                 store=store,
             )
 
-            # Load printer config and use it, or fallback to file
-            config = load_printer_config()
-            if not config.get('enabled', False):
-                backend_config = None
-            else:
-                printer_type = config.get('type', 'FILE')
-                device_info = get_printer_device_info(printer_type, config)
-                backend_config = {'type': printer_type, 'device_info': device_info}
-
-            printer = ThermalPrinter(backend=backend_config)
-            result = printer.print_text(receipt_text)
-
-            if result.get('status') == 'printed':
-                QMessageBox.information(self, 'Printer', 'Receipt sent to thermal printer.')
-            else:
-                path = result.get('path')
-                QMessageBox.information(self, 'Receipt Saved', f'Receipt saved to: {path}')
+            def on_result(result: dict) -> None:
+                if result.get('status') == 'printed':
+                    QMessageBox.information(self, 'Printer', 'Receipt sent to thermal printer.')
+                else:
+                    path = result.get('path')
+                    QMessageBox.information(self, 'Receipt Saved', f'Receipt saved to: {path}')
+
+            # Configured printer, or fallback to file
+            self._start_print_job(
+                receipt_lines,
+                on_result,
+                lambda error: QMessageBox.warning(self, 'Print Error', f'Failed to print receipt: {error}'),
+            )
 
         except Exception as e:
             QMessageBox.warning(self, 'Print Error', f'Failed to print receipt: {e}')
@@ -3567,7 +4514,8 @@ class MainWindow(QMainWindow):
                     f"Store: {data['store_id']}",
                 )
 
-                # Refresh inventory table
+                # Refresh inventory table and the cached sales catalog
+                self.invalidate_products_cache()
                 self.refresh_inventory_table()
 
         except Exception as e:
@@ -3576,57 +4524,100 @@ class MainWindow(QMainWindow):
     def refresh_inventory_table(self) -> None:
         """Refresh inventory table with current stock batches."""
         try:
-            inv_service = InventoryService(self.session)
-            store = self.store_service.get_primary_store()
+            store = self.primary_store
             if not store:
                 return
 
-            # Get all batches for primary store (ordered by expiry - FEFO)
-            batches = inv_service.get_store_inventory(store["id"])
-            self.inventory_table.setRowCount(len(batches))
-
-            for i, batch in enumerate(batches):
-                self.inventory_table.setItem(i, 0, QTableWidgetItem(str(batch["id"])))
-                self.inventory_table.setItem(i, 1, QTableWidgetItem(str(batch["product_id"])))
-                self.inventory_table.setItem(i, 2, QTableWidgetItem(batch["batch_number"]))
-                self.inventory_table.setItem(i, 3, QTableWidgetItem(str(batch["expiry_date"])))
-                self.inventory_table.setItem(i, 4, QTableWidgetItem(str(batch["quantity"])))
-
-            inv_service.session.close()
+            # Only batch ids (ordered by expiry - FEFO) are read now; the model
+            # fetches full rows window by window as they scroll into view
+            batch_ids = self.inventory_service.get_store_inventory_ids(store["id"])
+            self.inventory_model.set_batch_ids(batch_ids, self.ref_cache.get_batches)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh inventory: {str(e)}")
 
 
+    @staticmethod
+    def _build_backend_config(config: dict):
+        """Translate the printer section of config.json into a ThermalPrinter backend."""
+        from desktop_app.config import get_printer_device_info
+
+        if not config.get('enabled', False):
+            return None
+        printer_type = config.get('type', 'FILE')
+        device_info = get_printer_device_info(printer_type, config)
+        return {'type': printer_type, 'device_info': device_info}
+
+    def _get_printer(self):
+        """Return the shared thermal printer, reconnecting only when its config changes."""
+        from desktop_app.thermal_printer import ThermalPrinter
+
+        # Rebuild the backend only when the printer section itself changed
+        config = load_printer_config()
+        if config != self._printer_config:
+            self._backend_config = self._build_backend_config(config)
+            self._printer_config = config
+        backend_config = self._backend_config
+
+        if self._printer is None or self._printer[0] != backend_config:
+            self._close_printer()
+            self._printer = (backend_config, ThermalPrinter(backend=backend_config))
+        return self._printer[1]
+
+    def _close_printer(self) -> None:
+        if self._printer is not None:
+            # Wait for a running job to finish with the device first
+            self._printer_lock.lock()
+            try:
+                self._printer[1].close()
+            finally:
+                self._printer_lock.unlock()
+            self._printer = None
+
+    def _start_print_job(self, lines, on_result, on_error) -> None:
+        """Print `lines` on a pool thread and report back through the callbacks."""
+        job = PrintJob(self._get_printer(), lines, self._printer_lock)
+        self._print_jobs.add(job)
+
+        def loaded(result: dict) -> None:
+            self._print_jobs.discard(job)
+            on_result(result)
+
+        def failed(error: str) -> None:
+            self._print_jobs.discard(job)
+            on_error(error)
+
+        job.signals.loaded.connect(loaded)
+        job.signals.failed.connect(failed)
+        QThreadPool.globalInstance().start(job)
+
     def printer_test(self) -> None:
         """Send a small test print using the configured thermal printer."""
         try:
-            from desktop_app.thermal_printer import ThermalPrinter
-            from desktop_app.config import get_printer_backend, get_printer_device_info
             from datetime import datetime
 
-            config = load_printer_config()
-            if not config.get('enabled', False):
+            if not load_printer_config().get('enabled', False):
                 QMessageBox.information(self, 'Printer Test', 'Printer is disabled. Saving to file (fallback).')
-                backend_config = None
-            else:
-                printer_type = config.get('type', 'FILE')
-                device_info = get_printer_device_info(printer_type, config)
-                backend_config = {'type': printer_type, 'device_info': device_info}
 
-            printer = ThermalPrinter(backend=backend_config)
-            test_text = (
-                "PRINTER TEST\n"
-                "PharmaPOS Thermal Printer Test\n"
-                f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                "------------------------------\n"
-                "This is a test print.\n"
+            test_lines = [
+                "PRINTER TEST",
+                "PharmaPOS Thermal Printer Test",
+                f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "------------------------------",
+                "This is a test print.",
+            ]
+
+            def on_result(res: dict) -> None:
+                if res.get('status') == 'printed':
+                    QMessageBox.information(self, 'Printer Test', 'Test printed to device successfully.')
+                else:
+                    path = res.get('path')
+                    QMessageBox.information(self, 'Printer Test', f'Test saved to file: {path}\n\n(Printer may be disabled or unavailable.)')
+
+            self._start_print_job(
+                test_lines,
+                on_result,
+                lambda error: QMessageBox.warning(self, 'Printer Test', f'Printer test failed: {error}'),
             )
-            res = printer.print_text(test_text)
-            if res.get('status') == 'printed':
-                QMessageBox.information(self, 'Printer Test', 'Test printed to device successfully.')
-            else:
-                path = res.get('path')
-                QMessageBox.information(self, 'Printer Test', f'Test saved to file: {path}\n\n(Printer may be disabled or unavailable.)')
         except Exception as e:
             QMessageBox.warning(self, 'Printer Test', f'Printer test failed: {e}')
 
@@ -3635,46 +4626,28 @@ class MainWindow(QMainWindow):
         """Re-generate and print (or save) the most recent sale receipt using configured printer."""
         try:
             # Local imports to avoid top-level dependencies
-            from desktop_app.models import get_session, SalesService
-            from desktop_app.database import sales as sales_table, sale_items as sale_items_table, product_batches, products
-            from desktop_app.config import get_printer_device_info
-            from sqlalchemy import select
-            from desktop_app.thermal_printer import ThermalPrinter, format_receipt
-
-            session = get_session()
-            # Fetch most recent sale
-            stmt = select(sales_table).order_by(sales_table.c.created_at.desc())
-            row = session.execute(stmt).fetchone()
-            if not row:
+            from desktop_app.models import SalesService, statement_budget
+            from desktop_app.thermal_printer import PrintableItem, format_receipt_lines
+
+            # Most recent sale with its items, product names and batch numbers
+            # in one statement; the budget catches per-item lookups creeping back
+            with statement_budget(self.session, 1):
+                sale = SalesService(self.session).get_latest_sale_with_items()
+            if not sale:
                 QMessageBox.information(self, 'Reprint', 'No sales found to reprint.')
                 return
 
-            sale = dict(row._mapping)
-            sale_id = sale['id']
-
-            # Get sale items
-            sales_service = SalesService(session)
-            items = sales_service.get_sale_items(sale_id)
-
-            # Build printable items list with product names
-            printable_items = []
-            for it in items:
-                # Lookup batch and product
-                batch_row = session.execute(select(product_batches).where(product_batches.c.id == it['product_batch_id'])).fetchone()
-                batch = dict(batch_row._mapping) if batch_row else None
-                prod = None
-                if batch:
-                    prod_row = session.execute(select(products).where(products.c.id == batch['product_id'])).fetchone()
-                    prod = dict(prod_row._mapping) if prod_row else None
-
-                printable_items.append({
-                    'product_name': prod['name'] if prod else f"Batch {batch.get('batch_number') if batch else it['product_batch_id']}",
-                    'quantity': it['quantity'],
-                    'unit_price': float(it['unit_price']),
-                })
+            printable_items = [
+                PrintableItem(
+                    it['product_name'] or f"Batch {it['batch_number'] or it['product_batch_id']}",
+                    it['quantity'],
+                    float(it['unit_price']),
+                )
+                for it in sale['items']
+            ]
 
-            store = self.store_service.get_primary_store()
-            receipt_text = format_receipt(
+            store = self.primary_store
+            receipt_lines = format_receipt_lines(
                 receipt_number=sale['receipt_number'],
                 items=printable_items,
                 subtotal=float(sale.get('total_amount', 0)),
@@ -3686,48 +4659,49 @@ class MainWindow(QMainWindow):
                 store=store,
             )
 
-            config = load_printer_config()
-            if not config.get('enabled', False):
-                backend_config = None
-            else:
-                printer_type = config.get('type', 'FILE')
-                device_info = get_printer_device_info(printer_type, config)
-                backend_config = {'type': printer_type, 'device_info': device_info}
-
-            printer = ThermalPrinter(backend=backend_config)
-            res = printer.print_text(receipt_text)
-            if res.get('status') == 'printed':
-                QMessageBox.information(self, 'Reprint', 'Receipt sent to printer.')
-            else:
-                QMessageBox.information(self, 'Reprint', f'Receipt saved to: {res.get("path")}')
+            def on_result(res: dict) -> None:
+                if res.get('status') == 'printed':
+                    QMessageBox.information(self, 'Reprint', 'Receipt sent to printer.')
+                else:
+                    QMessageBox.information(self, 'Reprint', f'Receipt saved to: {res.get("path")}')
+
+            self._start_print_job(
+                receipt_lines,
+                on_result,
+                lambda error: QMessageBox.warning(self, 'Reprint Error', f'Failed to reprint receipt: {error}'),
+            )
 
         except Exception as e:
             QMessageBox.warning(self, 'Reprint Error', f'Failed to reprint receipt: {e}')
 
     def expire_batches_action(self) -> None:
-        """UI action to expire batches within given days for selected store."""
+        """UI action to expire batches within given days for the selected stores."""
         try:
             days = int(self.expiry_days_input.value())
             store_text = self.expiry_store_input.text().strip()
             if store_text:
                 try:
-                    store_id = int(store_text)
+                    store_ids = [int(part) for part in store_text.split(",") if part.strip()]
                 except ValueError:
-                    QMessageBox.warning(self, "Input Error", "Store ID must be an integer")
+                    QMessageBox.warning(self, "Input Error", "Store IDs must be comma-separated integers")
                     return
             else:
-                store = self.store_service.get_primary_store()
+                store = self.primary_store
                 if not store:
                     QMessageBox.warning(self, "Store Error", "No primary store configured")
                     return
-                store_id = store["id"]
+                store_ids = [store["id"]]
 
-            inv_service = InventoryService(self.session)
             # Use current user id if available, otherwise 0
             user_id = getattr(self.user_session, "user_id", 0)
-            expired_count = inv_service.expire_batches_within_days(store_id, days, user_id)
-            QMessageBox.information(self, "Expiry Result", f"Expired {expired_count} batches")
-            inv_service.session.close()
+            # Every store in one UPDATE, through the window's shared session
+            expired = self.inventory_service.expire_batches_within_days_bulk(store_ids, days, user_id)
+            if len(expired) == 1:
+                message = f"Expired {sum(expired.values())} batches"
+            else:
+                message = "\n".join(f"Store {store_id}: expired {count} batches" for store_id, count in expired.items())
+            QMessageBox.information(self, "Expiry Result", message)
+            self.invalidate_products_cache()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to expire batches: {str(e)}")
 
@@ -3750,8 +4724,7 @@ class MainWindow(QMainWindow):
             supplier_service = SupplierService(session)
 
             # Get primary store
-            store_service = StoreService(session)
-            primary_store = store_service.get_primary_store()
+            primary_store = self.primary_store
             if not primary_store:
                 session.close()
                 return
@@ -3880,15 +4853,40 @@ class MainWindow(QMainWindow):
 # --- Application Entry Point ------------------------------------------------
 def main() -> None:
     """Main application entry point."""
-    from desktop_app.database import init_db
-    
     app = QApplication(sys.argv)
-
-    # Initialize database
-    init_db()
-
-    # Initialize authentication service
-    auth_service = AuthenticationService()
+    with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+        app.setStyleSheet(f.read())
+
+    splash_pixmap = QPixmap(400, 200)
+    splash_pixmap.fill(QColor("#4472C4"))
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage("PharmaPOS NG\nStarting...", Qt.AlignCenter, Qt.white)
+    splash.show()
+    app.processEvents()
+
+    # Initialize the database and authentication service on a worker thread
+    # so the splash stays painted; wait for it in a local event loop
+    init_thread = QThread()
+    init_worker = InitWorker()
+    init_worker.moveToThread(init_thread)
+    init_thread.started.connect(init_worker.run)
+
+    outcome = {}
+    waiter = QEventLoop()
+    init_worker.ready.connect(lambda auth: outcome.update(auth_service=auth))
+    init_worker.failed.connect(lambda error: outcome.update(error=error))
+    init_worker.ready.connect(waiter.quit)
+    init_worker.failed.connect(waiter.quit)
+    init_thread.start()
+    waiter.exec_()
+    init_thread.quit()
+    init_thread.wait()
+    splash.close()
+
+    if "error" in outcome:
+        QMessageBox.critical(None, "Startup Error", f"Failed to initialize database: {outcome['error']}")
+        sys.exit(1)
+    auth_service = outcome["auth_service"]
 
     # Show login dialog
     login_dialog = LoginDialog(auth_service)